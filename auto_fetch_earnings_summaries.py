@@ -1,30 +1,174 @@
 #!/usr/bin/env python3
 """
 Automatically fetch and generate earnings call summaries
-This script is designed to be run within Claude Code environment
+Finds every reported quarter without a presentation summary, researches the
+gaps concurrently through the daily update's Google Search + Vertex AI
+Claude path, and writes all new summaries to earnings_data.json at once.
+
+Search results and generated summaries are cached per quarter in
+.summary_cache/, so a rerun (after a failure or a budget cut-off) only pays
+for quarters still missing. Spend is capped by the same RESEARCH_MAX_*
+limits as the daily update.
+
+Usage:
+  python auto_fetch_earnings_summaries.py            # Fill every gap
+  python auto_fetch_earnings_summaries.py --queued   # Only quarters queued by earnings_schedule.py
+  python auto_fetch_earnings_summaries.py --dry-run  # List the gaps without researching
 """
+
+import hashlib
 import json
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+
+from automated_daily_update import (
+    setup_gcp_credentials,
+    search_web,
+    call_claude_vertex,
+    build_full_prompt,
+    run_budget
+)
+from earnings_schedule import load_summary_queue, remove_from_summary_queue
+from fetch_earnings_summaries import find_summary_gaps, generate_earnings_summary_prompt
+from pipeline_context import PipelineContext, EARNINGS
+from research_budget import estimate_tokens
+
+SUMMARY_CACHE_DIR = '.summary_cache'
+SUMMARY_WORKERS = 4
+SUMMARY_MAX_TOKENS = 700  # One dense paragraph
+MIN_SUMMARY_CHARS = 80    # Shorter responses are treated as failures, not summaries
+
+
+def build_summary_query(name, ticker, quarter):
+    return f"{name} {ticker} {quarter} earnings call"
+
+
+def summary_cache_path(ticker, quarter, prompt, cache_dir=SUMMARY_CACHE_DIR):
+    """Cache entries are keyed by the prompt too, so rewording it refreshes them"""
+    digest = hashlib.sha1(prompt.encode('utf-8')).hexdigest()[:12]
+    return os.path.join(cache_dir, f"{ticker}-{quarter.replace(' ', '-')}-{digest}.json")
+
+
+def load_cached_research(path):
+    if os.path.exists(path):
+        with open(path, 'r') as f:
+            return json.load(f)
+    return {}
+
+
+def save_cached_research(path, entry):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_file = path + '.tmp'
+    with open(tmp_file, 'w') as f:
+        json.dump(entry, f, indent=2)
+    os.replace(tmp_file, path)
+
+
+def research_summary(gap):
+    """
+    Search for and summarize one earnings call, reusing cached results
+    Returns the summary text, or None (budget exhausted or generation failed)
+    """
+    ticker, name, quarter = gap['ticker'], gap['name'], gap['quarter']
+    prompt = generate_earnings_summary_prompt(name, ticker, quarter) + "\n\nWrite only the paragraph, no introduction."
+    path = summary_cache_path(ticker, quarter, prompt)
+    entry = load_cached_research(path)
+
+    if entry.get('summary'):
+        print(f"  [CACHED] {ticker} {quarter}")
+        return entry['summary']
+
+    # Budget is reserved (checked and held in one step) so concurrent workers can't overspend
+    if 'search_results' not in entry:
+        if not run_budget.reserve_search():
+            run_budget.record_skip(ticker, f'{quarter} search budget')
+            return None
+        entry['search_query'] = build_summary_query(name, ticker, quarter)
+        try:
+            entry['search_results'] = search_web(entry['search_query'])
+        finally:
+            run_budget.release_search()
+        # Keep the results even if the LLM call fails, a rerun won't search again
+        if entry['search_results']:
+            save_cached_research(path, entry)
+
+    input_tokens = estimate_tokens(build_full_prompt(prompt, entry['search_results']))
+    allowance = run_budget.reserve_llm_call(input_tokens, SUMMARY_MAX_TOKENS)
+    if allowance is None:
+        run_budget.record_skip(ticker, f'{quarter} llm budget')
+        return None
+
+    try:
+        summary = call_claude_vertex(prompt, entry['search_results'], max_tokens=allowance)
+    finally:
+        run_budget.release_llm_call()
+    summary = (summary or '').strip()
+    if len(summary) < MIN_SUMMARY_CHARS:
+        print(f"  [FAIL] {ticker} {quarter}: no usable summary returned")
+        return None
+
+    entry['summary'] = summary
+    entry['generated_at'] = datetime.now().isoformat(timespec='seconds')
+    save_cached_research(path, entry)
+    print(f"  [OK] {ticker} {quarter} ({len(summary)} chars)")
+    return summary
+
+
+def generate_missing_summaries(gaps, workers=SUMMARY_WORKERS):
+    """Research gaps concurrently, returns {(ticker, quarter): summary} for those that succeeded"""
+    summaries = {}
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {executor.submit(research_summary, gap): gap for gap in gaps}
+        for future in as_completed(futures):
+            gap = futures[future]
+            try:
+                summary = future.result()
+            except Exception as e:
+                print(f"  [SKIP] {gap['ticker']} {gap['quarter']}: {e}")
+                continue
+            if summary:
+                summaries[(gap['ticker'], gap['quarter'])] = summary
+    return summaries
+
+
+def main(argv):
+    context = PipelineContext()
+    queue = [(item['ticker'], item['quarter']) for item in load_summary_queue()]
+    gaps = find_summary_gaps(context.earnings, queue)
+    if '--queued' in argv:
+        gaps = [gap for gap in gaps if (gap['ticker'], gap['quarter']) in set(queue)]
+
+    print(f"Earnings call summaries missing: {len(gaps)}")
+    for gap in gaps:
+        print(f"  - {gap['ticker']} {gap['quarter']}")
+    if not gaps or '--dry-run' in argv:
+        return
+
+    setup_gcp_credentials()
+    start = time.monotonic()
+    print(f"\nResearching {len(gaps)} quarters ({SUMMARY_WORKERS} workers)...")
+    summaries = generate_missing_summaries(gaps)
+
+    # One batched write for everything generated
+    for (ticker, quarter), summary in summaries.items():
+        context.earnings['companies'][ticker]['quarters'][quarter]['presentation_summary'] = summary
+    if summaries:
+        context.mark_dirty(EARNINGS)
+        context.save()
+        remove_from_summary_queue(summaries)
+        print(f"\n[OK] Saved {len(summaries)} summaries to earnings_data.json")
+        print(f"[OK] Dashboard updated: {context.render_dashboard()}")
+
+    usage = run_budget.report()
+    print(f"\nGenerated {len(summaries)}/{len(gaps)} in {time.monotonic() - start:.1f}s")
+    print(f"  LLM calls: {usage['llm_calls']} | Searches: {usage['searches']} | "
+          f"Estimated cost: ${usage['estimated_cost_usd']:.4f}")
+    if usage['skipped']:
+        print(f"  Skipped (budget): {', '.join(s['ticker'] + ' ' + s['reason'] for s in usage['skipped'])}")
 
-def load_earnings_data():
-    """Load earnings data"""
-    with open('earnings_data.json', 'r') as f:
-        return json.load(f)
-
-def save_earnings_data(data):
-    """Save earnings data"""
-    with open('earnings_data.json', 'w') as f:
-        json.dump(data, f, indent=2)
-
-# List of earnings calls that need summaries
-EARNINGS_CALLS_TO_FETCH = [
-    ('DKNG', 'DraftKings', 'Q3 2024'),
-    ('DKNG', 'DraftKings', 'Q4 2024'),
-    ('DKNG', 'DraftKings', 'Q1 2025'),
-    ('DKNG', 'DraftKings', 'Q2 2025'),
-    ('DKNG', 'DraftKings', 'Q3 2025'),
-]
 
 if __name__ == "__main__":
-    print("This script should be run by Claude Code to fetch earnings summaries automatically.")
-    print("Claude can use WebSearch to find and summarize earnings calls.")
-    print("\nUse the main dashboard generation instead, which will prompt Claude to fetch missing summaries.")
+    main(sys.argv[1:])
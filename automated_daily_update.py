@@ -17,17 +17,30 @@ from google.oauth2 import service_account
 sys.path.insert(0, '.')
 from gaming_stock_tracker_v3 import (
     analyze_single_day,
-    load_historical_data,
-    save_historical_data,
-    generate_html_dashboard,
     GAMING_COMPANIES
 )
+from pipeline_context import PipelineContext
+from research_budget import ResearchBudget, estimate_tokens, rank_material_changes
+from validate_news import validate_record
 
 # Configuration
 GCP_PROJECT_ID = None  # Will be extracted from service account
 GCP_LOCATION = "us-east5"  # Vertex AI location
 CLAUDE_MODEL = "claude-sonnet-4-5@20250929"  # Claude Sonnet 4.5
 
+# Endpoint overrides (point these at stub_servers.py for offline runs)
+GOOGLE_SEARCH_URL = os.environ.get('GOOGLE_SEARCH_URL', 'https://www.googleapis.com/customsearch/v1')
+VERTEX_BASE_URL = os.environ.get('VERTEX_BASE_URL', f"https://{GCP_LOCATION}-aiplatform.googleapis.com")
+
+# Batch mode: research all of a day's movers in a single Claude call
+# (set BATCH_NARRATIVES=0 to fall back to one call per ticker)
+BATCH_NARRATIVES = os.environ.get('BATCH_NARRATIVES', '1') != '0'
+BATCH_TOKENS_PER_TICKER = 300  # Output budget per narrative in batch mode
+NARRATIVE_MAX_TOKENS = 1024  # Output budget for a single-ticker narrative
+
+# Per-run search/LLM budget (limits from RESEARCH_MAX_* env vars, unset = unlimited)
+run_budget = ResearchBudget.from_env()
+
 def setup_gcp_credentials():
     """Setup GCP credentials from GitHub secret"""
     global GCP_PROJECT_ID
@@ -61,7 +74,7 @@ def search_web(query):
         print("ERROR: Google Search API credentials not found")
         return []
 
-    url = "https://www.googleapis.com/customsearch/v1"
+    url = GOOGLE_SEARCH_URL
     params = {
         'key': api_key,
         'cx': search_engine_id,
@@ -69,6 +82,8 @@ def search_web(query):
         'num': 5  # Get top 5 results
     }
 
+    run_budget.record_search()
+
     try:
         response = requests.get(url, params=params, timeout=10)
         response.raise_for_status()
@@ -88,10 +103,24 @@ def search_web(query):
         print(f"WARNING: Search failed for '{query}': {e}")
         return []
 
-def call_claude_vertex(prompt, search_results=None):
-    """Call Claude via Vertex AI to generate news narrative"""
+def get_vertex_token():
+    """Get a bearer token for Vertex AI (VERTEX_ACCESS_TOKEN overrides, e.g. for stub servers)"""
+    token = os.environ.get('VERTEX_ACCESS_TOKEN')
+    if token:
+        return token
 
-    # Build the prompt with search results if available
+    from google.auth.transport.requests import Request
+
+    # Get credentials with proper scopes
+    credentials = service_account.Credentials.from_service_account_file(
+        '/tmp/gcp_credentials.json',
+        scopes=['https://www.googleapis.com/auth/cloud-platform']
+    )
+    credentials.refresh(Request())
+    return credentials.token
+
+def build_full_prompt(prompt, search_results=None):
+    """Append formatted web search results to a prompt"""
     full_prompt = prompt
     if search_results:
         full_prompt += "\n\nWeb search results:\n"
@@ -99,19 +128,16 @@ def call_claude_vertex(prompt, search_results=None):
             full_prompt += f"\n{i}. {result['title']}\n"
             full_prompt += f"   {result['snippet']}\n"
             full_prompt += f"   URL: {result['link']}\n"
+    return full_prompt
 
-    # Call Claude via Vertex AI REST API
-    from google.auth.transport.requests import Request
-    from google.oauth2 import service_account
+def call_claude_vertex(prompt, search_results=None, max_tokens=NARRATIVE_MAX_TOKENS):
+    """Call Claude via Vertex AI to generate news narrative"""
 
-    # Get credentials with proper scopes
-    credentials = service_account.Credentials.from_service_account_file(
-        '/tmp/gcp_credentials.json',
-        scopes=['https://www.googleapis.com/auth/cloud-platform']
-    )
+    # Build the prompt with search results if available
+    full_prompt = build_full_prompt(prompt, search_results)
 
     # Build endpoint URL
-    endpoint_url = f"https://{GCP_LOCATION}-aiplatform.googleapis.com/v1/projects/{GCP_PROJECT_ID}/locations/{GCP_LOCATION}/publishers/anthropic/models/{CLAUDE_MODEL}:streamRawPredict"
+    endpoint_url = f"{VERTEX_BASE_URL}/v1/projects/{GCP_PROJECT_ID}/locations/{GCP_LOCATION}/publishers/anthropic/models/{CLAUDE_MODEL}:streamRawPredict"
 
     # Prepare request payload
     payload = {
@@ -122,36 +148,49 @@ def call_claude_vertex(prompt, search_results=None):
                 "content": full_prompt
             }
         ],
-        "max_tokens": 1024,
+        "max_tokens": max_tokens,
         "temperature": 1.0
     }
 
-    # Get auth token
-    credentials.refresh(Request())
     headers = {
-        "Authorization": f"Bearer {credentials.token}",
+        "Authorization": f"Bearer {get_vertex_token()}",
         "Content-Type": "application/json"
     }
 
+    # Token usage, reported by the stream (input estimated until then; failed
+    # requests are counted but not billed)
+    input_tokens = 0
+    output_tokens = 0
+
     # Make request
     try:
         response = requests.post(endpoint_url, headers=headers, json=payload, timeout=60)
         response.raise_for_status()
+        input_tokens = estimate_tokens(full_prompt)
 
-        # Parse streaming response
+        # Parse streaming response (narratives may arrive in several deltas)
         lines = response.text.strip().split('\n')
+        chunks = []
         for line in lines:
             if line.startswith('data: '):
                 data = json.loads(line[6:])
                 if data.get('type') == 'content_block_delta':
                     delta = data.get('delta', {})
                     if delta.get('type') == 'text_delta':
-                        return delta.get('text', '')
+                        chunks.append(delta.get('text', ''))
                 elif data.get('type') == 'message_start':
-                    continue
+                    usage = data.get('message', {}).get('usage', {})
+                    input_tokens = usage.get('input_tokens', input_tokens)
+                elif data.get('type') == 'message_delta':
+                    output_tokens = data.get('usage', {}).get('output_tokens', output_tokens)
                 elif data.get('type') == 'content_block_start':
                     continue
 
+        if chunks:
+            text = ''.join(chunks)
+            output_tokens = output_tokens or estimate_tokens(text)
+            return text
+
         # Fallback: try to get text from final message
         if lines:
             last_data = json.loads(lines[-1].replace('data: ', ''))
@@ -164,24 +203,50 @@ def call_claude_vertex(prompt, search_results=None):
         print(f"    ERROR calling Claude: {e}")
         return None
 
+    finally:
+        run_budget.record_llm_call(input_tokens, output_tokens)
+
     return None
 
-def research_material_change(ticker, name, pct_change, date_display, current_price):
+def build_search_query(ticker, name, pct_change, date_display):
+    """Build the web search query used to research a material change"""
+    direction = "up" if pct_change > 0 else "down"
+    return f"{name} {ticker} stock {direction} {date_display}"
+
+def placeholder_news(name, pct_change, date_display, search_query):
+    """Placeholder news entry used when no narrative could be generated"""
+    direction_verb = "rose" if pct_change > 0 else "fell"
+    return {
+        'search_query': search_query,
+        'summary': f"{name} {direction_verb} {abs(pct_change):.1f}% on {date_display}.",
+        'needs_manual_lookup': True
+    }
+
+def research_material_change(ticker, name, pct_change, date_display, current_price, search_results=None):
     """Research and generate news narrative for a material change"""
 
     print(f"\n  Researching {ticker} ({pct_change:+.2f}%)...")
 
-    # Step 1: Search the web
-    direction = "up" if pct_change > 0 else "down"
-    search_query = f"{name} {ticker} stock {direction} {date_display}"
+    # Step 1: Search the web (skipped when batch mode already searched)
+    search_query = build_search_query(ticker, name, pct_change, date_display)
 
-    print(f"    Searching: {search_query}")
-    search_results = search_web(search_query)
+    # Budget is reserved (checked and held in one step): backfill_news runs this from several workers
+    if search_results is None:
+        if not run_budget.reserve_search():
+            print(f"    BUDGET: search budget exhausted, leaving placeholder")
+            run_budget.record_skip(ticker, 'search budget')
+            return placeholder_news(name, pct_change, date_display, search_query)
 
-    if not search_results:
-        print(f"    WARNING: No search results found")
-    else:
-        print(f"    Found {len(search_results)} search results")
+        print(f"    Searching: {search_query}")
+        try:
+            search_results = search_web(search_query)
+        finally:
+            run_budget.release_search()
+
+        if not search_results:
+            print(f"    WARNING: No search results found")
+        else:
+            print(f"    Found {len(search_results)} search results")
 
     # Step 2: Ask Claude to write narrative
     direction_verb = "rose" if pct_change > 0 else "fell"
@@ -197,8 +262,18 @@ Requirements:
 
 Write only the narrative, no introduction or explanation."""
 
+    input_tokens = estimate_tokens(build_full_prompt(prompt, search_results))
+    allowance = run_budget.reserve_llm_call(input_tokens, NARRATIVE_MAX_TOKENS)
+    if allowance is None:
+        print(f"    BUDGET: LLM budget exhausted, leaving placeholder")
+        run_budget.record_skip(ticker, 'llm budget')
+        return placeholder_news(name, pct_change, date_display, search_query)
+
     print(f"    Calling Claude via Vertex AI...")
-    narrative = call_claude_vertex(prompt, search_results)
+    try:
+        narrative = call_claude_vertex(prompt, search_results, max_tokens=allowance)
+    finally:
+        run_budget.release_llm_call()
 
     if narrative:
         print(f"    ✓ Generated narrative ({len(narrative)} chars)")
@@ -210,11 +285,135 @@ Write only the narrative, no introduction or explanation."""
     else:
         print(f"    WARNING: Claude returned no narrative")
         # Fallback to placeholder
-        return {
+        return placeholder_news(name, pct_change, date_display, search_query)
+
+def build_batch_prompt(movers, date_display):
+    """Build a single prompt covering every material change for the day"""
+    prompt = f"""Based on the web search results provided for each stock, write a concise 2-3 sentence news narrative explaining each of the following stock moves on {date_display}.
+
+Requirements:
+- Use past tense and the direction verb given for each stock (not rises/drops)
+- Include specific catalysts: analyst actions, earnings news, competitive developments, regulatory changes, or market events
+- Mention stock performance context (YTD, vs 52-week high, etc.) if relevant
+- Keep it factual and concise
+- Write in third person
+
+Respond with only a JSON object mapping each ticker to its narrative string, e.g. {{"DKNG": "DraftKings fell ..."}}. No other text.
+"""
+
+    for mover in movers:
+        direction_verb = "rose" if mover['pct_change'] > 0 else "fell"
+        prompt += f"\n## {mover['ticker']}: {mover['name']} {direction_verb} {abs(mover['pct_change']):.1f}% to close at ${mover['current_price']:.2f}\n"
+        if mover['search_results']:
+            for i, result in enumerate(mover['search_results'], 1):
+                prompt += f"{i}. {result['title']} - {result['snippet']}\n"
+        else:
+            prompt += "(no search results)\n"
+
+    return prompt
+
+def parse_batch_narratives(text, tickers):
+    """Parse Claude's JSON batch response into {ticker: narrative}, dropping invalid entries"""
+    if not text:
+        return {}
+
+    # Tolerate code fences or stray text around the JSON object
+    start = text.find('{')
+    end = text.rfind('}')
+    if start == -1 or end <= start:
+        return {}
+
+    try:
+        parsed = json.loads(text[start:end + 1])
+    except ValueError:
+        return {}
+
+    if not isinstance(parsed, dict):
+        return {}
+
+    narratives = {}
+    for ticker in tickers:
+        narrative = parsed.get(ticker)
+        if isinstance(narrative, str) and narrative.strip():
+            narratives[ticker] = narrative.strip()
+
+    return narratives
+
+def research_material_changes_batch(material_changes, date_display):
+    """
+    Research all material changes for a day with a single Claude call
+    Expects material_changes ranked most significant first; whatever doesn't
+    fit the run budget is left as a placeholder. Returns {ticker: news};
+    tickers missing from the batch response fall back to individual
+    research_material_change calls reusing the search results
+    """
+    results = {}
+    movers = []
+    for change in material_changes:
+        ticker = change['ticker']
+        name = change['name']
+        pct_change = change['data']['pct_change']
+        search_query = build_search_query(ticker, name, pct_change, date_display)
+
+        if not run_budget.can_search():
+            print(f"\n  BUDGET: search budget exhausted, leaving {ticker} as placeholder")
+            run_budget.record_skip(ticker, 'search budget')
+            results[ticker] = placeholder_news(name, pct_change, date_display, search_query)
+            continue
+
+        print(f"\n  Searching: {search_query}")
+        search_results = search_web(search_query)
+        print(f"    Found {len(search_results)} search results")
+
+        movers.append({
+            'ticker': ticker,
+            'name': name,
+            'pct_change': pct_change,
+            'current_price': change['data']['current_price'],
             'search_query': search_query,
-            'summary': f"{name} {direction_verb} {abs(pct_change):.1f}% on {date_display}.",
-            'needs_manual_lookup': True
-        }
+            'search_results': search_results
+        })
+
+    # Drop the least significant movers until the batch call fits the budget
+    while movers:
+        max_tokens = max(NARRATIVE_MAX_TOKENS, BATCH_TOKENS_PER_TICKER * len(movers))
+        prompt = build_batch_prompt(movers, date_display)
+        if run_budget.can_call_llm(estimate_tokens(prompt), max_tokens):
+            break
+        mover = movers.pop()
+        print(f"  BUDGET: dropping {mover['ticker']} from batch, leaving placeholder")
+        run_budget.record_skip(mover['ticker'], 'llm budget')
+        results[mover['ticker']] = placeholder_news(mover['name'], mover['pct_change'], date_display, mover['search_query'])
+
+    if not movers:
+        return results
+
+    tickers = [m['ticker'] for m in movers]
+    print(f"\n  Calling Claude via Vertex AI (batch of {len(movers)})...")
+    text = call_claude_vertex(prompt, max_tokens=run_budget.cap_max_tokens(max_tokens))
+    narratives = parse_batch_narratives(text, tickers)
+    print(f"    ✓ Batch returned {len(narratives)}/{len(movers)} narratives")
+
+    for mover in movers:
+        ticker = mover['ticker']
+        if ticker in narratives:
+            results[ticker] = {
+                'search_query': mover['search_query'],
+                'summary': narratives[ticker],
+                'needs_manual_lookup': False
+            }
+        else:
+            print(f"    {ticker} missing from batch, falling back to single call")
+            results[ticker] = research_material_change(
+                ticker,
+                mover['name'],
+                mover['pct_change'],
+                date_display,
+                mover['current_price'],
+                search_results=mover['search_results']
+            )
+
+    return results
 
 def main():
     """Main automation workflow"""
@@ -223,6 +422,8 @@ def main():
     print("=" * 70)
     print()
 
+    context = PipelineContext()
+
     # Setup
     print("[1/6] Setting up GCP credentials...")
     setup_gcp_credentials()
@@ -249,46 +450,62 @@ def main():
     if record['material_changes']:
         print(f"[3/6] Researching news for {len(record['material_changes'])} material changes...")
 
-        for i, change in enumerate(record['material_changes'], 1):
-            ticker = change['ticker']
-            name = change['name']
-            pct_change = change['data']['pct_change']
-            current_price = change['data']['current_price']
-
-            print(f"\n  [{i}/{len(record['material_changes'])}] {ticker}: {pct_change:+.2f}% → ${current_price:.2f}")
-
-            # Research and update news
-            news = research_material_change(
-                ticker,
-                name,
-                pct_change,
-                record['date_display'],
-                current_price
-            )
+        # Spend the research budget on the most significant moves first
+        ranked_changes = rank_material_changes(record['material_changes'], record.get('benchmark'))
 
-            change['news'] = news
+        if BATCH_NARRATIVES and len(ranked_changes) > 1:
+            batch_news = research_material_changes_batch(ranked_changes, record['date_display'])
+            for change in record['material_changes']:
+                change['news'] = batch_news[change['ticker']]
+        else:
+            for i, change in enumerate(ranked_changes, 1):
+                ticker = change['ticker']
+                name = change['name']
+                pct_change = change['data']['pct_change']
+                current_price = change['data']['current_price']
+
+                print(f"\n  [{i}/{len(ranked_changes)}] {ticker}: {pct_change:+.2f}% → ${current_price:.2f}")
+
+                # Research and update news
+                news = research_material_change(
+                    ticker,
+                    name,
+                    pct_change,
+                    record['date_display'],
+                    current_price
+                )
+
+                change['news'] = news
+
+        # Pre-publish gate: narratives that contradict the stored move don't ship
+        mismatches = validate_record(record)
+        if mismatches:
+            changes_by_ticker = {c['ticker']: c for c in record['material_changes']}
+            for mismatch in mismatches:
+                change = changes_by_ticker[mismatch['ticker']]
+                print(f"  WARNING: {mismatch['ticker']} narrative failed validation ({', '.join(mismatch['issues'])}), leaving placeholder")
+                change['news'] = placeholder_news(
+                    change['name'],
+                    change['data']['pct_change'],
+                    record['date_display'],
+                    change['news'].get('search_query', '')
+                )
     else:
         print("[3/6] No material changes to research")
     print()
 
-    # Save to history
+    # Save to history (loaded once, shared with the dashboard render below)
     print("[4/6] Saving to stock_tracker_history.json...")
-    historical_data = load_historical_data()
-
-    # Remove if already exists
-    existing_dates = {r['date'] for r in historical_data['records']}
-    if record['date'] in existing_dates:
-        print(f"  Removing existing record for {record['date']}")
-        historical_data['records'] = [r for r in historical_data['records'] if r['date'] != record['date']]
-
-    historical_data['records'].append(record)
-    save_historical_data(historical_data)
-    print("✓ Data saved")
+    status = context.upsert_record(record)
+    if status == 'replaced':
+        print(f"  Replaced existing record for {record['date']}")
+    written = context.save()
+    print("✓ Data saved" if written else "✓ History already up to date")
     print()
 
     # Regenerate dashboard
     print("[5/6] Regenerating dashboard...")
-    dashboard_file = generate_html_dashboard()
+    dashboard_file = context.render_dashboard()
     print(f"✓ Dashboard updated: {dashboard_file}")
     print()
 
@@ -324,6 +541,14 @@ def main():
             pct = change['data']['pct_change']
             print(f"  • {ticker}: {pct:+.2f}%")
 
+    usage = run_budget.report()
+    print("\nResearch Usage:")
+    print(f"  LLM calls: {usage['llm_calls']} | Searches: {usage['searches']}")
+    print(f"  Tokens: {usage['input_tokens']} in / {usage['output_tokens']} out")
+    print(f"  Estimated cost: ${usage['estimated_cost_usd']:.4f}")
+    if usage['skipped']:
+        print(f"  Left for manual lookup (budget): {', '.join(s['ticker'] for s in usage['skipped'])}")
+
     print()
 
 if __name__ == "__main__":
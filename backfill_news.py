@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+"""
+Backfill placeholder news narratives in the history
+Scans stock_tracker_history.json for material changes flagged
+needs_manual_lookup, researches them concurrently with the automated
+search + Claude path, and writes results back in batches.
+
+Progress is checkpointed to backfill_checkpoint.json, so an interrupted
+run picks up where it left off. Changes left as placeholders because the
+research budget ran out stay pending for the next run; one is only marked
+failed after MAX_ATTEMPTS researched runs came back without a narrative.
+
+Usage:
+  python backfill_news.py [--workers 4] [--per-minute 20] [--batch-size 10] [--limit N] [--retry-failed]
+"""
+
+import argparse
+import json
+import os
+import queue
+import threading
+import time
+
+import automated_daily_update as research
+from gaming_stock_tracker_v3 import (
+    load_historical_data,
+    save_historical_data,
+    index_material_changes
+)
+
+CHECKPOINT_FILE = 'backfill_checkpoint.json'
+MAX_ATTEMPTS = 3  # Researched runs without a narrative before a change is marked failed
+
+
+def load_checkpoint():
+    """Load checkpoint: narratives not yet written to history, attempts per key, and keys that failed"""
+    if os.path.exists(CHECKPOINT_FILE):
+        with open(CHECKPOINT_FILE, 'r') as f:
+            checkpoint = json.load(f)
+        checkpoint.setdefault('attempts', {})
+        return checkpoint
+    return {'pending': {}, 'attempts': {}, 'failed': []}
+
+
+def save_checkpoint(checkpoint):
+    """Save checkpoint atomically"""
+    tmp_file = CHECKPOINT_FILE + '.tmp'
+    with open(tmp_file, 'w') as f:
+        json.dump(checkpoint, f, indent=2)
+    os.replace(tmp_file, CHECKPOINT_FILE)
+
+
+def checkpoint_key(date, ticker):
+    return f"{date}|{ticker}"
+
+
+def find_placeholders(data):
+    """List (date, ticker) keys whose news still needs manual lookup, newest first"""
+    keys = []
+    for (date, ticker), change in index_material_changes(data).items():
+        news = change.get('news') or {}
+        if news.get('needs_manual_lookup', not news.get('summary')):
+            keys.append((date, ticker))
+    return sorted(keys, reverse=True)
+
+
+class RateLimiter:
+    """Spaces out task starts to at most per_minute per minute across all workers"""
+
+    def __init__(self, per_minute):
+        self.interval = 60.0 / per_minute if per_minute else 0
+        self.next_slot = time.monotonic()
+        self.lock = threading.Lock()
+
+    def wait(self):
+        if not self.interval:
+            return
+        with self.lock:
+            now = time.monotonic()
+            slot = max(now, self.next_slot)
+            self.next_slot = slot + self.interval
+        time.sleep(max(0, slot - now))
+
+
+def budget_left():
+    """Room for at least one more search and narrative call"""
+    budget = research.run_budget
+    return budget.can_search() and budget.can_call_llm(0, research.NARRATIVE_MAX_TOKENS)
+
+
+def worker(tasks, results, limiter, stop):
+    """
+    Pull placeholder tasks off the queue and research them
+    Results are (date, ticker, news, skipped); skipped means the budget refused a
+    reservation, and every worker stops rather than paying for more searches
+    """
+    while not stop.is_set():
+        try:
+            task = tasks.get_nowait()
+        except queue.Empty:
+            return
+
+        if not budget_left():
+            stop.set()
+            tasks.task_done()
+            return
+
+        limiter.wait()
+        research.run_budget.take_thread_skip()
+        news = research.research_material_change(
+            task['ticker'],
+            task['name'],
+            task['pct_change'],
+            task['date_display'],
+            task['current_price']
+        )
+        skipped = research.run_budget.take_thread_skip()
+        if skipped:
+            stop.set()
+        results.put((task['date'], task['ticker'], news, skipped))
+        tasks.task_done()
+
+
+def commit_pending(data, index, checkpoint):
+    """Apply checkpointed narratives to the history and write it once"""
+    if not checkpoint['pending']:
+        return 0
+
+    applied = 0
+    for key, news in checkpoint['pending'].items():
+        date, ticker = key.split('|')
+        change = index.get((date, ticker))
+        if change is not None:
+            change['news'] = news
+            applied += 1
+
+    save_historical_data(data)
+    checkpoint['pending'] = {}
+    save_checkpoint(checkpoint)
+    return applied
+
+
+def backfill(workers=4, per_minute=20, batch_size=10, limit=None, retry_failed=False):
+    """Research every placeholder narrative, committing results in batches"""
+    data = load_historical_data()
+    index = index_material_changes(data)
+    checkpoint = load_checkpoint()
+
+    # Finish whatever an interrupted run left in the checkpoint
+    resumed = commit_pending(data, index, checkpoint)
+    if resumed:
+        print(f"[OK] Applied {resumed} narratives from previous checkpoint")
+
+    if retry_failed:
+        checkpoint['failed'] = []
+    failed = set(checkpoint['failed'])
+    keys = [k for k in find_placeholders(data) if checkpoint_key(*k) not in failed]
+    if limit:
+        keys = keys[:limit]
+
+    if not keys:
+        print("No placeholder narratives to backfill")
+        return 0
+
+    print(f"Backfilling {len(keys)} placeholder narratives with {workers} workers...")
+
+    records_by_date = {r['date']: r for r in data['records']}
+    tasks = queue.Queue()
+    for date, ticker in keys:
+        change = index[(date, ticker)]
+        tasks.put({
+            'date': date,
+            'ticker': ticker,
+            'name': change['name'],
+            'pct_change': change['data']['pct_change'],
+            'current_price': change['data']['current_price'],
+            'date_display': records_by_date[date]['date_display']
+        })
+
+    results = queue.Queue()
+    limiter = RateLimiter(per_minute)
+    stop = threading.Event()
+    threads = [
+        threading.Thread(target=worker, args=(tasks, results, limiter, stop), daemon=True)
+        for _ in range(workers)
+    ]
+    for thread in threads:
+        thread.start()
+
+    filled = 0
+    interrupted = False
+    try:
+        while any(t.is_alive() for t in threads) or not results.empty():
+            try:
+                date, ticker, news, skipped = results.get(timeout=0.5)
+            except queue.Empty:
+                continue
+
+            key = checkpoint_key(date, ticker)
+            if skipped:
+                continue  # Not researched: left for the next run with a fresh budget
+            if news.get('needs_manual_lookup'):
+                attempts = checkpoint['attempts'].get(key, 0) + 1
+                checkpoint['attempts'][key] = attempts
+                if attempts >= MAX_ATTEMPTS:
+                    checkpoint['failed'].append(key)
+                    del checkpoint['attempts'][key]
+            else:
+                checkpoint['pending'][key] = news
+                checkpoint['attempts'].pop(key, None)
+                filled += 1
+            save_checkpoint(checkpoint)
+
+            if len(checkpoint['pending']) >= batch_size:
+                commit_pending(data, index, checkpoint)
+                print(f"  [OK] Committed batch ({filled} filled so far)")
+    except KeyboardInterrupt:
+        stop.set()
+        interrupted = True
+        print("\nInterrupted - progress saved to checkpoint, rerun to resume")
+
+    commit_pending(data, index, checkpoint)
+
+    if stop.is_set() and not interrupted:
+        print("Research budget exhausted - remaining placeholders left for next run")
+
+    print(f"\n[OK] Filled {filled}/{len(keys)} placeholder narratives")
+    return filled
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Backfill needs_manual_lookup news narratives')
+    parser.add_argument('--workers', type=int, default=4, help='Concurrent research workers')
+    parser.add_argument('--per-minute', type=int, default=20, help='Max narratives started per minute (0 = unlimited)')
+    parser.add_argument('--batch-size', type=int, default=10, help='Narratives per history write')
+    parser.add_argument('--limit', type=int, default=None, help='Only backfill the N most recent placeholders')
+    parser.add_argument('--retry-failed', action='store_true', help='Retry placeholders that failed in earlier runs')
+    args = parser.parse_args()
+
+    print("=" * 70)
+    print("NEWS BACKFILL - Gaming Stock Tracker")
+    print("=" * 70)
+
+    research.setup_gcp_credentials()
+    backfill(args.workers, args.per_minute, args.batch_size, args.limit, args.retry_failed)
+
+    usage = research.run_budget.report()
+    print(f"LLM calls: {usage['llm_calls']} | Searches: {usage['searches']} | Estimated cost: ${usage['estimated_cost_usd']:.4f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Dashboard render benchmark
+Renders synthetic histories of increasing length (built by repeating the
+real records on earlier dates) and reports render time and peak Python
+memory for a cold fragment cache and a warm one, plus the per-render cost
+of the page chrome (static head/CSS/JS is built once at import).
+
+Usage:
+  python benchmark_dashboard.py [--sizes 50 250 1000 4000]
+"""
+
+import argparse
+import contextlib
+import copy
+import io
+import os
+import shutil
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+
+import dashboard_template
+import gaming_stock_tracker_v3 as tracker
+import logo_assets
+
+
+def synthetic_history(base_records, n_days):
+    """Repeat base records over n_days weekdays ending at the newest real date"""
+    base = sorted(base_records, key=lambda r: r['date'])
+    day = datetime.strptime(base[-1]['date'], '%Y-%m-%d')
+    records = []
+    i = 0
+    while len(records) < n_days:
+        if day.weekday() < 5:
+            record = copy.deepcopy(base[-1 - (i % len(base))])
+            record['date'] = day.strftime('%Y-%m-%d')
+            record['date_display'] = day.strftime('%B %d, %Y')
+            records.append(record)
+            i += 1
+        day -= timedelta(days=1)
+    return {'records': records}
+
+
+def measure(render):
+    """Run render() and return (seconds, peak traced bytes)"""
+    tracemalloc.start()
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        render()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def chrome_benchmark(iterations=10000):
+    """Time the per-render page chrome work (only the header stats are substituted)"""
+    static_bytes = sum(len(part.encode('utf-8')) for part in (
+        dashboard_template.PAGE_HEAD,
+        dashboard_template.BODY_OPEN,
+        dashboard_template.TABS_HTML,
+        dashboard_template.EARNINGS_TAB_OPEN,
+        dashboard_template.PAGE_FOOTER
+    ))
+    company_list = '<br>'.join(f"• {name} ({ticker})" for ticker, name in tracker.GAMING_COMPANIES.items())
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        dashboard_template.render_header(7, 2.0, 57, 'November 13, 2025', 'January 30, 2026', company_list)
+    per_render = (time.perf_counter() - start) / iterations
+
+    print(f"Page chrome: {static_bytes / 1024:.1f} KB static (built once), header substitution {per_render * 1e6:.1f} us per render")
+    print()
+
+
+def run(sizes):
+    base_records = tracker.load_historical_data()['records']
+    earnings_file = os.path.abspath('earnings_data.json')
+    asset_dir = os.path.abspath('assets')
+    original_dir = os.getcwd()
+
+    # Render with whatever logos are on disk; network fetches would dominate the timings
+    logo_assets.LOGO_FETCH = False
+
+    print(f"{'days':>6} {'page KB':>9} {'cold s':>8} {'cold peak MB':>13} {'warm s':>8} {'warm peak MB':>13}")
+    for n_days in sizes:
+        history = synthetic_history(base_records, n_days)
+        render = lambda: tracker.generate_html_dashboard(history)
+
+        workdir = tempfile.mkdtemp(prefix='dashboard-bench-')
+        shutil.copy(earnings_file, workdir)
+        if os.path.isdir(asset_dir):
+            shutil.copytree(asset_dir, os.path.join(workdir, 'assets'))
+        os.chdir(workdir)
+        try:
+            cold_s, cold_peak = measure(render)
+            warm_s, warm_peak = measure(render)
+            page_kb = os.path.getsize(tracker.DASHBOARD_FILE) / 1024
+        finally:
+            os.chdir(original_dir)
+            shutil.rmtree(workdir)
+
+        print(f"{n_days:>6} {page_kb:>9.0f} {cold_s:>8.3f} {cold_peak / 1e6:>13.2f} {warm_s:>8.3f} {warm_peak / 1e6:>13.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark dashboard rendering against history size')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[50, 250, 1000, 4000])
+    args = parser.parse_args()
+    chrome_benchmark()
+    run(args.sizes)
+
+
+if __name__ == '__main__':
+    main()
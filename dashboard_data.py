@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Dashboard data shards
+Writes the day history as compact per-month JSON files under data/ plus a
+manifest, so index.html only embeds the most recent days and the browser
+fetches older months on scroll. Shards whose content is unchanged are not
+rewritten, keeping daily commits to the current month.
+
+Earnings years older than the ones shown on the page are archived the same
+way, one earnings-<YEAR>.json of pre-rendered year columns per year.
+"""
+
+import json
+import os
+
+DASHBOARD_DATA_DIR = 'data'
+MANIFEST_FILE = 'manifest.json'
+
+
+def shard_name(month):
+    return f"days-{month}.json"
+
+
+def _cents(value):
+    """Round as the day card displays it (Python's .2f), so the client's toFixed(2) agrees"""
+    return float(f"{value:.2f}")
+
+
+def compact_day(record):
+    """Reduce a history record to the fields the client-side day card needs"""
+    benchmark = record.get('benchmark') or {}
+    changes = []
+    for change in record.get('material_changes', []):
+        data = change['data']
+        news = change.get('news') or {}
+        changes.append({
+            'ticker': change['ticker'],
+            'name': change['name'],
+            'open': _cents(data['open_price']),
+            'close': _cents(data['current_price']),
+            'pct': _cents(data['pct_change']),
+            'summary': news.get('summary', ''),
+            'query': news.get('search_query') or change.get('search_query', '')
+        })
+
+    return {
+        'date': record['date'],
+        'display': record['date_display'],
+        'benchmark': [_cents(benchmark['current_price']), _cents(benchmark.get('pct_change', 0))] if benchmark else None,
+        'changes': changes
+    }
+
+
+def write_if_changed(path, text):
+    """Write text to path atomically unless the file already holds it, returns True if written"""
+    if os.path.exists(path):
+        with open(path, 'r', encoding='utf-8') as f:
+            if f.read() == text:
+                return False
+
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(text)
+    os.replace(tmp_path, path)
+    return True
+
+
+def write_day_shards(records, data_dir=DASHBOARD_DATA_DIR):
+    """
+    Write one JSON shard per month (days newest first) and the manifest
+    records must already be sorted newest first
+    Returns (shards written, shards unchanged)
+    """
+    os.makedirs(data_dir, exist_ok=True)
+
+    months = {}
+    for record in records:
+        months.setdefault(record['date'][:7], []).append(compact_day(record))
+
+    written = 0
+    unchanged = 0
+    for month, days in months.items():
+        text = json.dumps(days, separators=(',', ':'), ensure_ascii=False)
+        if write_if_changed(os.path.join(data_dir, shard_name(month)), text):
+            written += 1
+        else:
+            unchanged += 1
+
+    manifest = {
+        'months': [{'month': month, 'days': len(days)} for month, days in months.items()]
+    }
+    write_if_changed(os.path.join(data_dir, MANIFEST_FILE), json.dumps(manifest, indent=2))
+
+    # Drop shards for months no longer in the history
+    expected = {shard_name(month) for month in months}
+    for name in os.listdir(data_dir):
+        if name.startswith('days-') and name.endswith('.json') and name not in expected:
+            os.remove(os.path.join(data_dir, name))
+
+    return written, unchanged
+
+
+def earnings_archive_name(year):
+    return f"earnings-{year}.json"
+
+
+def write_earnings_archive(earlier_columns, data_dir=DASHBOARD_DATA_DIR):
+    """
+    Write one JSON file per archived earnings year ({ticker: year column html})
+    and remove files for years no longer archived
+    Returns (files written, files unchanged)
+    """
+    os.makedirs(data_dir, exist_ok=True)
+
+    written = 0
+    unchanged = 0
+    for year, columns in earlier_columns.items():
+        text = json.dumps(columns, separators=(',', ':'), ensure_ascii=False)
+        if write_if_changed(os.path.join(data_dir, earnings_archive_name(year)), text):
+            written += 1
+        else:
+            unchanged += 1
+
+    expected = {earnings_archive_name(year) for year in earlier_columns}
+    for name in os.listdir(data_dir):
+        if name.startswith('earnings-') and name.endswith('.json') and name not in expected:
+            os.remove(os.path.join(data_dir, name))
+
+    return written, unchanged
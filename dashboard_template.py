@@ -0,0 +1,1253 @@
+#!/usr/bin/env python3
+"""
+Dashboard page template
+Static markup, CSS and JS for index.html, built once at import. Only the
+header stats are substituted per render; day and quarter cards are rendered
+by gaming_stock_tracker_v3 and cached as fragments. PAGE_FOOTER also carries
+the client-side renderer for days older than those embedded in the page.
+"""
+
+from string import Template
+
+# Doctype and <head> with the page CSS, left open for the logo stylesheet link
+PAGE_HEAD = """<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Gaming Stock Tracker Dashboard</title>
+    <style>
+        @import url('https://fonts.googleapis.com/css2?family=Inter:wght@400;500;600;700&display=swap');
+
+        * {
+            margin: 0;
+            padding: 0;
+            box-sizing: border-box;
+        }
+
+        body {
+            font-family: 'Inter', -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
+            background: #0047FF;
+            padding: 0;
+            min-height: 100vh;
+        }
+
+        .top-banner {
+            background: #FF4500;
+            color: white;
+            padding: 8px 20px;
+            font-size: 0.85em;
+            font-weight: 500;
+            position: sticky;
+            top: 0;
+            z-index: 100;
+            display: flex;
+            justify-content: space-between;
+            align-items: center;
+        }
+
+        .banner-logo {
+            display: flex;
+            align-items: center;
+            gap: 8px;
+            font-weight: 700;
+            font-size: 1em;
+        }
+
+        .banner-logo-icon {
+            width: 18px;
+            height: 18px;
+            fill: white;
+        }
+
+        .banner-center {
+            flex: 1;
+            text-align: center;
+        }
+
+        .container {
+            max-width: 1400px;
+            margin: 0 auto;
+            padding: 20px 15px;
+        }
+
+        .header {
+            background: white;
+            padding: 20px 25px;
+            border-radius: 8px;
+            box-shadow: 0 2px 8px rgba(0,0,0,0.1);
+            margin-bottom: 15px;
+            display: grid;
+            grid-template-columns: 2fr 1fr 1fr;
+            gap: 25px;
+            align-items: start;
+        }
+
+        .header-main {
+            border-right: 2px solid #f0f0f0;
+            padding-right: 25px;
+        }
+
+        h1 {
+            color: #0047FF;
+            font-size: 1.8em;
+            margin-bottom: 6px;
+            font-weight: 700;
+            letter-spacing: -0.5px;
+        }
+
+        .subtitle {
+            color: #333;
+            font-size: 0.9em;
+            font-weight: 400;
+        }
+
+        .header-section {
+            padding-left: 10px;
+        }
+
+        .header-section-title {
+            color: #0047FF;
+            font-size: 0.75em;
+            font-weight: 700;
+            text-transform: uppercase;
+            letter-spacing: 0.5px;
+            margin-bottom: 8px;
+        }
+
+        .header-section-content {
+            color: #555;
+            font-size: 0.85em;
+            line-height: 1.6;
+        }
+
+        .date-range {
+            color: #777;
+            font-size: 0.8em;
+            margin-top: 4px;
+        }
+
+
+        .day-card {
+            background: white;
+            padding: 20px 25px;
+            border-radius: 8px;
+            box-shadow: 0 2px 8px rgba(0,0,0,0.08);
+            margin-bottom: 12px;
+            content-visibility: auto;
+            contain-intrinsic-size: auto 240px;
+        }
+
+        .day-header {
+            display: flex;
+            justify-content: space-between;
+            align-items: center;
+            margin-bottom: 15px;
+            padding-bottom: 12px;
+            border-bottom: 2px solid #f0f0f0;
+            position: sticky;
+            top: 35px;
+            background: white;
+            z-index: 10;
+            margin-left: -25px;
+            margin-right: -25px;
+            margin-top: -20px;
+            padding: 15px 25px 12px 25px;
+            border-radius: 8px 8px 0 0;
+            box-shadow: 0 2px 4px rgba(0,0,0,0.05);
+        }
+
+        .day-title {
+            font-size: 1.3em;
+            color: #0047FF;
+            font-weight: 700;
+        }
+
+        .benchmark {
+            font-size: 0.9em;
+            padding: 6px 14px;
+            border-radius: 20px;
+            font-weight: 600;
+            background: #f5f5f5;
+        }
+
+        .benchmark.positive {
+            background: #d4edda;
+            color: #155724;
+        }
+
+        .benchmark.negative {
+            background: #f8d7da;
+            color: #721c24;
+        }
+
+        .material-changes {
+            margin-top: 12px;
+        }
+
+        .change-item {
+            background: #f8f9fa;
+            padding: 15px 18px;
+            border-left: 4px solid #0047FF;
+            margin-bottom: 12px;
+            border-radius: 6px;
+            transition: all 0.2s ease;
+        }
+
+        .change-item:hover {
+            box-shadow: 0 2px 8px rgba(0,0,0,0.08);
+            transform: translateY(-1px);
+        }
+
+        .change-item.positive {
+            border-left-color: #28a745;
+            background: #f0fdf4;
+        }
+
+        .change-item.negative {
+            border-left-color: #dc3545;
+            background: #fef2f2;
+        }
+
+        .company-name {
+            font-size: 1.05em;
+            font-weight: 700;
+            margin-bottom: 6px;
+            color: #1a1a1a;
+            display: flex;
+            align-items: center;
+            gap: 10px;
+        }
+
+        .company-logo {
+            width: 24px;
+            height: 24px;
+            border-radius: 4px;
+        }
+
+        .data-row {
+            display: flex;
+            align-items: center;
+            gap: 20px;
+            flex-wrap: wrap;
+        }
+
+        .price-info {
+            display: flex;
+            gap: 20px;
+            align-items: center;
+        }
+
+        .price-item {
+            display: flex;
+            gap: 6px;
+            align-items: baseline;
+        }
+
+        .price-label {
+            color: #666;
+            font-size: 0.75em;
+            font-weight: 600;
+            text-transform: uppercase;
+            letter-spacing: 0.5px;
+        }
+
+        .price-value {
+            font-weight: 700;
+            font-size: 0.95em;
+            color: #1a1a1a;
+        }
+
+        .search-link {
+            display: inline-block;
+            margin-top: 8px;
+            padding: 6px 14px;
+            background: #FF4500;
+            color: white;
+            text-decoration: none;
+            border-radius: 20px;
+            font-size: 0.8em;
+            font-weight: 600;
+            transition: all 0.2s ease;
+        }
+
+        .search-link:hover {
+            background: #e03e00;
+            transform: translateY(-1px);
+            box-shadow: 0 2px 6px rgba(255,69,0,0.3);
+        }
+
+        .no-changes {
+            color: #666;
+            font-style: italic;
+            padding: 15px;
+            text-align: center;
+            background: #f8f9fa;
+            border-radius: 6px;
+            font-size: 0.9em;
+        }
+
+        .day-loader {
+            color: #666;
+            padding: 20px;
+            text-align: center;
+            font-size: 0.9em;
+        }
+
+        .news-inline {
+            display: flex;
+            align-items: center;
+            gap: 12px;
+            flex: 1;
+            min-width: 0;
+        }
+
+        .news-text {
+            color: #333;
+            font-size: 0.88em;
+            line-height: 1.4;
+            flex: 1;
+            min-width: 0;
+        }
+
+        .news-button {
+            display: inline-block;
+            padding: 5px 12px;
+            background: #1a1a2e;
+            color: white;
+            text-decoration: none;
+            border-radius: 20px;
+            font-size: 0.75em;
+            font-weight: 600;
+            transition: all 0.2s ease;
+            white-space: nowrap;
+            flex-shrink: 0;
+        }
+
+        .news-button:hover {
+            background: #0047FF;
+            box-shadow: 0 2px 6px rgba(0,71,255,0.3);
+        }
+
+        .separator {
+            color: #ccc;
+            margin: 0 4px;
+        }
+
+        .search-box {
+            position: relative;
+            margin-bottom: 15px;
+        }
+
+        .search-box input {
+            width: 100%;
+            padding: 12px 16px;
+            border: 2px solid #e0e0e0;
+            border-radius: 8px;
+            font: inherit;
+            font-size: 0.95em;
+            background: white;
+        }
+
+        .search-box input:focus {
+            outline: none;
+            border-color: #0047FF;
+        }
+
+        .search-results {
+            position: absolute;
+            left: 0;
+            right: 0;
+            top: 100%;
+            z-index: 60;
+            max-height: 60vh;
+            overflow-y: auto;
+            background: white;
+            border-radius: 0 0 8px 8px;
+            box-shadow: 0 8px 24px rgba(0,0,0,0.15);
+        }
+
+        .search-results:empty {
+            display: none;
+        }
+
+        .search-result {
+            display: block;
+            width: 100%;
+            text-align: left;
+            padding: 10px 16px;
+            border: none;
+            border-bottom: 1px solid #f0f0f0;
+            background: white;
+            font: inherit;
+            cursor: pointer;
+        }
+
+        .search-result:hover {
+            background: #f8f9fa;
+        }
+
+        .search-meta {
+            font-size: 0.8em;
+            font-weight: 600;
+            color: #0047FF;
+            margin-bottom: 3px;
+        }
+
+        .search-snippet {
+            font-size: 0.85em;
+            color: #444;
+            line-height: 1.4;
+        }
+
+        .search-status {
+            padding: 10px 16px;
+            font-size: 0.85em;
+            color: #666;
+        }
+
+        .tabs {
+            display: flex;
+            gap: 0;
+            margin-bottom: 15px;
+            background: white;
+            border-radius: 8px;
+            padding: 5px;
+            box-shadow: 0 2px 8px rgba(0,0,0,0.08);
+            position: sticky;
+            top: 35px;
+            z-index: 50;
+        }
+
+        .tab {
+            flex: 1;
+            padding: 12px 20px;
+            background: transparent;
+            border: none;
+            color: #555;
+            font-weight: 600;
+            font-size: 0.95em;
+            cursor: pointer;
+            border-radius: 6px;
+            transition: all 0.2s ease;
+        }
+
+        .tab:hover {
+            background: #f5f5f5;
+            color: #0047FF;
+        }
+
+        .tab.active {
+            background: #0047FF;
+            color: white;
+        }
+
+        .tab-content {
+            display: none;
+        }
+
+        .tab-content.active {
+            display: block;
+        }
+
+        .company-card {
+            background: white;
+            padding: 0;
+            border-radius: 8px;
+            margin-bottom: 15px;
+            box-shadow: 0 2px 8px rgba(0,0,0,0.08);
+            overflow: hidden;
+        }
+
+        .company-header {
+            display: flex;
+            align-items: center;
+            gap: 12px;
+            padding: 20px 25px;
+            cursor: pointer;
+            background: white;
+            border-bottom: 2px solid #f0f0f0;
+            transition: background 0.2s;
+        }
+
+        .company-header:hover {
+            background: #f8f9fa !important;
+        }
+
+        .collapse-arrow {
+            width: 20px;
+            height: 20px;
+            fill: #0047FF;
+            transition: transform 0.3s;
+        }
+
+        .company-header-logo {
+            width: 32px;
+            height: 32px;
+            border-radius: 4px;
+        }
+
+        .company-header h2 {
+            color: #0047FF;
+            font-size: 1.4em;
+            margin: 0;
+            flex: 1;
+        }
+
+        .sparkline {
+            display: flex;
+            align-items: center;
+            gap: 8px;
+        }
+
+        .sparkline svg {
+            display: block;
+            overflow: visible;
+        }
+
+        .sparkline polyline {
+            fill: none;
+            stroke-width: 1.5;
+            stroke-linejoin: round;
+        }
+
+        .spark-price {
+            stroke: #0047FF;
+        }
+
+        .spark-relative {
+            stroke: #FF4500;
+            stroke-dasharray: 3 2;
+        }
+
+        .spark-labels {
+            display: flex;
+            flex-direction: column;
+            font-size: 0.72em;
+            font-weight: 600;
+            line-height: 1.3;
+            white-space: nowrap;
+        }
+
+        .spark-change.positive {
+            color: #28a745;
+        }
+
+        .spark-change.negative {
+            color: #dc3545;
+        }
+
+        .ir-link {
+            padding: 6px 14px;
+            background: #FF4500;
+            color: white;
+            text-decoration: none;
+            border-radius: 20px;
+            font-size: 0.8em;
+            font-weight: 600;
+        }
+
+        .industry-overview {
+            background: linear-gradient(135deg, #0047FF 0%, #0056CC 100%);
+            padding: 25px 30px;
+            border-radius: 8px;
+            margin-bottom: 20px;
+            box-shadow: 0 4px 12px rgba(0,71,255,0.2);
+            color: rgba(255,255,255,0.95);
+        }
+
+        .industry-overview h2 {
+            color: white;
+            font-size: 1.5em;
+            margin-bottom: 15px;
+            font-weight: 700;
+        }
+
+        .overview-stats {
+            display: grid;
+            grid-template-columns: repeat(auto-fit, minmax(180px, 1fr));
+            gap: 12px;
+            margin-bottom: 15px;
+        }
+
+        .overview-stat {
+            background: rgba(255,255,255,0.1);
+            padding: 12px 15px;
+            border-radius: 6px;
+        }
+
+        .overview-label {
+            font-size: 0.75em;
+            font-weight: 600;
+            text-transform: uppercase;
+            opacity: 0.8;
+        }
+
+        .overview-value {
+            color: white;
+            font-size: 1.3em;
+            font-weight: 700;
+        }
+
+        .overview-note {
+            font-size: 0.8em;
+        }
+
+        .overview-change {
+            font-weight: 700;
+        }
+
+        .overview-change.positive {
+            color: #8CF5B0;
+        }
+
+        .overview-change.negative {
+            color: #FFB4B4;
+        }
+
+        .overview-ranking {
+            margin-bottom: 12px;
+        }
+
+        .overview-ranking ol {
+            display: flex;
+            flex-wrap: wrap;
+            gap: 6px 18px;
+            padding-left: 20px;
+            font-size: 0.9em;
+        }
+
+        .overview-ranking li span {
+            color: white;
+            font-weight: 700;
+        }
+
+        .overview-text {
+            font-size: 0.95em;
+            line-height: 1.7;
+        }
+
+        .year-grid {
+            display: grid;
+            grid-template-columns: repeat(auto-fit, minmax(280px, 1fr));
+            gap: 20px;
+        }
+
+        .earlier-years {
+            margin-bottom: 20px;
+        }
+
+        .earlier-years-button {
+            padding: 6px 14px;
+            background: white;
+            color: #0047FF;
+            border: 1px solid #0047FF;
+            border-radius: 20px;
+            font-size: 0.8em;
+            font-weight: 600;
+            cursor: pointer;
+        }
+
+        .earlier-years-button:disabled {
+            opacity: 0.6;
+            cursor: default;
+        }
+
+        .year-column {
+            display: flex;
+            flex-direction: column;
+            gap: 15px;
+        }
+
+        .year-heading {
+            background: #0047FF;
+            color: white;
+            padding: 10px 15px;
+            border-radius: 6px;
+            font-weight: 700;
+            text-align: center;
+            font-size: 1.1em;
+        }
+
+        .year-heading.current {
+            background: #FF4500;
+        }
+
+        .quarter-card {
+            background: #f8f9fa;
+            padding: 15px;
+            border-radius: 6px;
+            border-left: 4px solid #0047FF;
+        }
+
+        .quarter-card.missing {
+            background: #f0f0f0;
+            border-left-color: #ccc;
+            opacity: 0.5;
+        }
+
+        .quarter-title {
+            font-weight: 700;
+            color: #0047FF;
+            font-size: 1em;
+            margin-bottom: 10px;
+        }
+
+        .quarter-card.missing .quarter-title {
+            color: #999;
+        }
+
+        .quarter-empty {
+            color: #999;
+            font-size: 0.85em;
+            font-style: italic;
+        }
+
+        .quarter-metrics {
+            display: flex;
+            gap: 20px;
+            margin-bottom: 12px;
+        }
+
+        .metric-label {
+            color: #666;
+            font-size: 0.75em;
+            font-weight: 600;
+            text-transform: uppercase;
+        }
+
+        .metric-value {
+            color: #1a1a1a;
+            font-weight: 700;
+            font-size: 1em;
+        }
+
+        .yoy {
+            font-size: 0.85em;
+            font-weight: 600;
+        }
+
+        .yoy.positive {
+            color: #28a745;
+        }
+
+        .yoy.negative {
+            color: #dc3545;
+        }
+
+        .quarter-extra {
+            display: flex;
+            flex-wrap: wrap;
+            gap: 4px 14px;
+            color: #666;
+            font-size: 0.8em;
+            margin-bottom: 8px;
+        }
+
+        .quarter-extra strong {
+            color: #1a1a1a;
+        }
+
+        .quarter-event {
+            display: flex;
+            flex-wrap: wrap;
+            gap: 4px 14px;
+            color: #666;
+            font-size: 0.8em;
+            margin-bottom: 8px;
+        }
+
+        .quarter-event-label {
+            flex-basis: 100%;
+            font-size: 0.85em;
+            text-transform: uppercase;
+            letter-spacing: 0.5px;
+            color: #999;
+        }
+
+        .presentation {
+            background: white;
+            padding: 12px;
+            border-radius: 4px;
+            border-left: 3px solid #FF4500;
+            margin-top: 10px;
+        }
+
+        .presentation-label {
+            font-weight: 700;
+            color: #0047FF;
+            font-size: 0.75em;
+            text-transform: uppercase;
+            margin-bottom: 6px;
+        }
+
+        .presentation-text {
+            color: #333;
+            font-size: 0.88em;
+            line-height: 1.5;
+        }
+
+        .company-content {
+            padding: 25px;
+            background: #fafafa;
+            max-height: 5000px;
+            opacity: 1;
+            transition: max-height 0.4s ease, opacity 0.3s ease;
+        }
+
+        .company-content.collapsed {
+            max-height: 0;
+            opacity: 0;
+            padding: 0 25px !important;
+            overflow: hidden;
+        }
+    </style>
+"""
+
+# Content-hashed logo stylesheet built by logo_assets
+STYLESHEET_LINK = Template("""    <link rel="stylesheet" href="$href">
+""")
+
+# Closes <head>; top banner and the opening of the container, up to the header stats
+BODY_OPEN = """</head>
+<body>
+    <div class="top-banner">
+        <div class="banner-logo">
+            <svg class="banner-logo-icon" viewBox="0 0 24 24" xmlns="http://www.w3.org/2000/svg">
+                <path d="M12 2L4 5v6.09c0 5.05 3.41 9.76 8 10.91 4.59-1.15 8-5.86 8-10.91V5l-8-3z"/>
+            </svg>
+            <span>GeoComply</span>
+        </div>
+        <div class="banner-center">Gaming Stock Intelligence • Real-time tracking of material market movements</div>
+        <div style="width: 120px;"></div>
+    </div>
+    <div class="container">
+"""
+
+# Header stats, the only dynamic part of the page chrome
+HEADER_TEMPLATE = Template("""        <div class="header">
+            <div class="header-main">
+                <h1>Gaming Stock Tracker Dashboard</h1>
+                <p class="subtitle">Monitoring $company_count gaming companies for material changes (±$threshold%)</p>
+            </div>
+            <div class="header-section">
+                <div class="header-section-title">Trading Days</div>
+                <div class="header-section-content">
+                    <strong>$day_count</strong> days tracked
+                    <div class="date-range">$oldest_date to $newest_date</div>
+                </div>
+            </div>
+            <div class="header-section">
+                <div class="header-section-title">Companies Monitored</div>
+                <div class="header-section-content">$company_list</div>
+            </div>
+        </div>
+
+""")
+
+# Disclaimer, search box, tab buttons and the opening of the material changes tab
+TABS_HTML = """        <div style="background: #FF4500; color: white; padding: 12px 20px; border-radius: 8px; margin-bottom: 15px; box-shadow: 0 2px 8px rgba(255,69,0,0.2); font-size: 0.9em; line-height: 1.5;">
+            <strong>⚠️ Disclaimer:</strong> Data shown here is for informational purposes only and is not intended to be financial advice. Pursuant to the GeoComply <a href="https://drive.google.com/file/d/1AKZ-Bu2KGJGaApcUeE6reQXLA5lqARV3/edit" target="_blank" style="color: white; text-decoration: underline; font-weight: 600;">Restricted Trading List</a>, company employees and their families are prohibited from buying or selling gaming related securities.
+        </div>
+
+        <div class="search-box">
+            <input type="search" id="search-input" placeholder="Search news and earnings summaries, e.g. Missouri launch" autocomplete="off" aria-label="Search news and earnings summaries">
+            <div id="search-results" class="search-results"></div>
+        </div>
+
+        <div class="tabs">
+            <button class="tab active" data-tab="material-changes" onclick="switchTab('material-changes')">Material Changes</button>
+            <button class="tab" data-tab="earnings-tracker" onclick="switchTab('earnings-tracker')">Earnings Tracker</button>
+        </div>
+
+        <div id="material-changes" class="tab-content active">
+"""
+
+# Scroll sentinel after the embedded day cards; older days are fetched from data/
+DAY_LOADER_TEMPLATE = Template("""
+        <div id="day-loader" class="day-loader" data-oldest="$oldest_date">Loading older days...</div>
+""")
+
+# Closes the material changes tab and opens the earnings tab
+EARNINGS_TAB_OPEN = """
+        </div>
+
+        <div id="earnings-tracker" class="tab-content">
+    """
+
+# Closes the page: container, tab/collapse scripts, lazy day loader, search
+PAGE_FOOTER = """
+        </div>
+    </div>
+
+    <script>
+        function switchTab(tabId) {
+            // Hide all tabs
+            document.querySelectorAll('.tab-content').forEach(tab => {
+                tab.classList.remove('active');
+            });
+            document.querySelectorAll('.tab').forEach(tab => {
+                tab.classList.remove('active');
+            });
+
+            // Show selected tab
+            document.getElementById(tabId).classList.add('active');
+            document.querySelector('.tab[data-tab="' + tabId + '"]').classList.add('active');
+        }
+
+        function toggleCompany(companyId) {
+            const content = document.getElementById(companyId);
+            const arrowId = companyId.replace('company-', 'arrow-');
+            const arrow = document.getElementById(arrowId);
+
+            if (content.classList.contains('collapsed')) {
+                content.classList.remove('collapsed');
+                arrow.style.transform = 'rotate(0deg)';
+            } else {
+                content.classList.add('collapsed');
+                arrow.style.transform = 'rotate(-90deg)';
+            }
+        }
+
+        // Earnings years before the ones on the page are pre-rendered into
+        // data/earnings-YEAR.json ({ticker: column html}), fetched on request
+        const earningsYears = new Map();
+
+        function loadEarningsYear(year) {
+            if (!earningsYears.has(year)) {
+                earningsYears.set(year, fetchJson('data/earnings-' + year + '.json'));
+            }
+            return earningsYears.get(year);
+        }
+
+        async function showEarlierYears(button) {
+            const container = button.parentElement;
+            const years = container.dataset.years.split(',');
+            button.disabled = true;
+            button.textContent = 'Loading...';
+            try {
+                const columns = await Promise.all(years.map(loadEarningsYear));
+                container.innerHTML = '<div class="year-grid">'
+                    + columns.map(column => column[container.dataset.ticker] || '').join('') + '</div>';
+            } catch (error) {
+                years.forEach(year => earningsYears.delete(year));
+                button.disabled = false;
+                button.textContent = 'Earlier years could not be loaded, retry';
+            }
+        }
+
+        // Older days live in per-month JSON shards (see dashboard_data.py) and
+        // are rendered into day cards when the loader scrolls into view
+        const dayLoader = document.getElementById('day-loader');
+        let dayManifest = null;
+        let nextMonth = 0;
+        let loadingDays = null;
+
+        function escapeHtml(text) {
+            return String(text).replace(/[&<>"']/g, c => ({
+                '&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#39;'
+            })[c]);
+        }
+
+        function signed(value) {
+            return (value >= 0 ? '+' : '') + value.toFixed(2);
+        }
+
+        function renderDay(day) {
+            let html = '<div class="day-card" id="day-' + day.date + '"><div class="day-header">'
+                + '<div class="day-title">' + escapeHtml(day.display) + '</div>';
+            if (day.benchmark) {
+                const [price, pct] = day.benchmark;
+                html += '<div class="benchmark ' + (pct > 0 ? 'positive' : 'negative') + '">'
+                    + 'NASDAQ: $' + price.toFixed(2) + ' (' + signed(pct) + '%)</div>';
+            }
+            html += '</div>';
+
+            if (!day.changes.length) {
+                return html + '<div class="no-changes">No material changes detected on this day</div></div>';
+            }
+
+            html += '<div class="material-changes">';
+            for (const change of day.changes) {
+                const name = escapeHtml(change.name);
+                const searchUrl = 'https://www.google.com/search?q=' + encodeURIComponent(change.query);
+                html += '<div class="change-item ' + (change.pct > 0 ? 'positive' : 'negative') + '">'
+                    + '<div class="company-name">'
+                    + '<span class="company-logo logo-' + change.ticker + '" role="img" aria-label="' + name + '"></span>'
+                    + '<span>' + name + ' (' + change.ticker + ')</span></div>'
+                    + '<div class="data-row"><div class="price-info">'
+                    + '<div class="price-item"><span class="price-label">Open:</span><span class="price-value">$' + change.open.toFixed(2) + '</span></div>'
+                    + '<div class="price-item"><span class="price-label">Close:</span><span class="price-value">$' + change.close.toFixed(2) + '</span></div>'
+                    + '<div class="price-item"><span class="price-label">Change:</span><span class="price-value">' + signed(change.pct) + '% ' + (change.pct > 0 ? 'UP' : 'DOWN') + '</span></div>'
+                    + '</div>';
+                if (change.summary) {
+                    html += '<span class="separator">•</span><div class="news-inline">'
+                        + '<div class="news-text">' + escapeHtml(change.summary) + '</div>'
+                        + '<a href="' + searchUrl + '" target="_blank" class="news-button">Find News →</a></div>';
+                } else {
+                    html += '<a href="' + searchUrl + '" target="_blank" class="search-link">Search News →</a>';
+                }
+                html += '</div></div>';
+            }
+            return html + '</div></div>';
+        }
+
+        async function fetchJson(url) {
+            const response = await fetch(url);
+            if (!response.ok) {
+                throw new Error(url + ': ' + response.status);
+            }
+            return response.json();
+        }
+
+        // Render the next month that has days older than those on the page;
+        // resolves false once the whole history is on the page
+        async function loadOlderDays() {
+            if (!dayLoader) {
+                return false;
+            }
+            if (!dayManifest) {
+                dayManifest = await fetchJson('data/manifest.json');
+            }
+            while (nextMonth < dayManifest.months.length) {
+                const month = dayManifest.months[nextMonth++].month;
+                const oldest = dayLoader.dataset.oldest;
+                if (month > oldest.slice(0, 7)) {
+                    continue;
+                }
+                const days = (await fetchJson('data/days-' + month + '.json')).filter(day => day.date < oldest);
+                if (days.length) {
+                    dayLoader.insertAdjacentHTML('beforebegin', days.map(renderDay).join(''));
+                    dayLoader.dataset.oldest = days[days.length - 1].date;
+                    return true;
+                }
+            }
+            dayLoader.remove();
+            return false;
+        }
+
+        function loadOlderDaysOnce() {
+            if (!loadingDays) {
+                loadingDays = loadOlderDays().finally(() => { loadingDays = null; });
+            }
+            return loadingDays;
+        }
+
+        if (dayLoader) {
+            const observer = new IntersectionObserver(entries => {
+                if (!entries.some(entry => entry.isIntersecting)) {
+                    return;
+                }
+                loadOlderDaysOnce().then(more => {
+                    if (!more) {
+                        observer.disconnect();
+                        return;
+                    }
+                    // Still in view after a short month: re-observe to fire again
+                    observer.unobserve(dayLoader);
+                    observer.observe(dayLoader);
+                }).catch(() => {
+                    observer.disconnect();
+                    dayLoader.textContent = 'Older days could not be loaded.';
+                });
+            }, { rootMargin: '600px' });
+            observer.observe(dayLoader);
+        }
+
+        // Search: the inverted index (see search_index.py) is fetched on first
+        // focus; queries intersect postings, the last word also matches as a prefix
+        const searchInput = document.getElementById('search-input');
+        const searchResults = document.getElementById('search-results');
+        const MAX_SEARCH_RESULTS = 25;
+        let searchIndex = null;
+        let searchIndexLoading = null;
+        const decodedPostings = new Map();
+
+        function loadSearchIndex() {
+            if (!searchIndexLoading) {
+                searchIndexLoading = fetchJson('data/search-index.json').then(index => {
+                    index.stopwords = new Set(index.stopwords);
+                    index.termList = Object.keys(index.terms);
+                    searchIndex = index;
+                    return index;
+                });
+            }
+            return searchIndexLoading;
+        }
+
+        // Mirrors search_index.stem(); the rules themselves ship in the index
+        function stemWord(word) {
+            for (const [suffix, replacement, minStem] of searchIndex.stem_rules) {
+                if (word.endsWith(suffix) && word.length - suffix.length >= minStem) {
+                    word = word.slice(0, word.length - suffix.length) + replacement;
+                    if ((suffix === 'ing' || suffix === 'ed') && word.length > 3
+                        && word[word.length - 1] === word[word.length - 2] && !'lsz'.includes(word[word.length - 1])) {
+                        word = word.slice(0, -1);
+                    }
+                    return word;
+                }
+            }
+            return word;
+        }
+
+        function tokenizeQuery(text) {
+            return (text.toLowerCase().match(/[a-z0-9]+/g) || [])
+                .filter(token => !searchIndex.stopwords.has(token))
+                .map(stemWord);
+        }
+
+        function postings(term) {
+            if (!decodedPostings.has(term)) {
+                const ids = [];
+                let id = 0;
+                for (const gap of searchIndex.terms[term] || []) {
+                    id += gap;
+                    ids.push(id);
+                }
+                decodedPostings.set(term, ids);
+            }
+            return decodedPostings.get(term);
+        }
+
+        function prefixPostings(prefix) {
+            const ids = new Set();
+            for (const term of searchIndex.termList) {
+                if (term.startsWith(prefix)) {
+                    postings(term).forEach(id => ids.add(id));
+                }
+            }
+            return [...ids].sort((a, b) => a - b);
+        }
+
+        function intersect(a, b) {
+            const out = [];
+            let i = 0;
+            let j = 0;
+            while (i < a.length && j < b.length) {
+                if (a[i] === b[j]) {
+                    out.push(a[i]);
+                    i++;
+                    j++;
+                } else if (a[i] < b[j]) {
+                    i++;
+                } else {
+                    j++;
+                }
+            }
+            return out;
+        }
+
+        function runSearch(query) {
+            const terms = tokenizeQuery(query);
+            if (!terms.length) {
+                return [];
+            }
+            const typingLastWord = !/\\s$/.test(query);
+            let ids = null;
+            terms.forEach((term, i) => {
+                const matches = (i === terms.length - 1 && typingLastWord) ? prefixPostings(term) : postings(term);
+                ids = ids === null ? matches : intersect(ids, matches);
+            });
+            return ids;
+        }
+
+        function renderSearchResults(query) {
+            if (!query.trim()) {
+                searchResults.innerHTML = '';
+                return;
+            }
+            const ids = runSearch(query);
+            if (!ids.length) {
+                searchResults.innerHTML = '<div class="search-status">No matches</div>';
+                return;
+            }
+            let html = '';
+            for (const id of ids.slice(0, MAX_SEARCH_RESULTS)) {
+                const [kind, key, ticker, label, text] = searchIndex.docs[id];
+                html += '<button type="button" class="search-result" data-kind="' + kind + '" data-key="' + escapeHtml(key) + '" data-ticker="' + ticker + '">'
+                    + '<div class="search-meta">' + ticker + ' · ' + escapeHtml(label) + (kind === 'q' ? ' earnings' : '') + '</div>'
+                    + '<div class="search-snippet">' + escapeHtml(text) + '</div></button>';
+            }
+            if (ids.length > MAX_SEARCH_RESULTS) {
+                html += '<div class="search-status">Showing ' + MAX_SEARCH_RESULTS + ' of ' + ids.length + ' matches</div>';
+            }
+            searchResults.innerHTML = html;
+        }
+
+        // Days older than those on the page are loaded month by month until the card exists
+        async function revealDay(date) {
+            switchTab('material-changes');
+            let card = document.getElementById('day-' + date);
+            while (!card && await loadOlderDaysOnce()) {
+                card = document.getElementById('day-' + date);
+            }
+            if (card) {
+                card.scrollIntoView({ behavior: 'smooth', block: 'start' });
+            }
+        }
+
+        function revealCompany(ticker) {
+            switchTab('earnings-tracker');
+            const card = document.getElementById('earnings-' + ticker);
+            if (!card) {
+                return;
+            }
+            const content = card.querySelector('.company-content');
+            if (content.classList.contains('collapsed')) {
+                toggleCompany(content.id);
+            }
+            card.scrollIntoView({ behavior: 'smooth', block: 'start' });
+        }
+
+        if (searchInput) {
+            searchInput.addEventListener('focus', () => {
+                loadSearchIndex().catch(() => {
+                    searchResults.innerHTML = '<div class="search-status">Search index could not be loaded.</div>';
+                });
+            });
+            searchInput.addEventListener('input', () => {
+                const query = searchInput.value;
+                loadSearchIndex().then(() => {
+                    if (searchInput.value === query) {
+                        renderSearchResults(query);
+                    }
+                }).catch(() => {});
+            });
+            searchResults.addEventListener('click', e => {
+                const result = e.target.closest('.search-result');
+                if (!result) {
+                    return;
+                }
+                searchResults.innerHTML = '';
+                if (result.dataset.kind === 'd') {
+                    revealDay(result.dataset.key).catch(() => {});
+                } else {
+                    revealCompany(result.dataset.ticker);
+                }
+            });
+        }
+    </script>
+</body>
+</html>
+"""
+
+
+def render_day_loader(oldest_date):
+    """Scroll sentinel marking the oldest day embedded in the page"""
+    return DAY_LOADER_TEMPLATE.substitute(oldest_date=oldest_date)
+
+
+def render_stylesheet_link(href):
+    return STYLESHEET_LINK.substitute(href=href)
+
+
+def render_header(company_count, threshold, day_count, oldest_date, newest_date, company_list):
+    """Fill in the header stats block"""
+    return HEADER_TEMPLATE.substitute(
+        company_count=company_count,
+        threshold=threshold,
+        day_count=day_count,
+        oldest_date=oldest_date,
+        newest_date=newest_date,
+        company_list=company_list
+    )
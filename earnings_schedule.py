@@ -0,0 +1,286 @@
+#!/usr/bin/env python3
+"""
+Earnings-calendar-aware refresh scheduler
+Keeps an expected report date per ticker in earnings_calendar.json and only
+fetches statements for companies that are inside their reporting window, so
+a print shows up within hours while every other run makes no statement calls.
+
+Expected dates come from, in order:
+  1. earnings_calendar_overrides.json ({"DKNG": "2025-11-06", ...}, maintained by hand)
+  2. the yfinance earnings calendar (rechecked weekly, or daily once the date has passed)
+  3. an estimate: the quarter after the latest stored one, plus the reporting lag
+
+A ticker inside its window (report date to WINDOW_AFTER_DAYS later) bypasses
+the statement cache until the new quarter lands. Past the window, or with
+only an estimated date, the statement cache's recheck interval applies.
+Quarters that land without a management summary are queued in
+earnings_summary_queue.json for summary generation, and stored quarters
+without a report date (needed by event_study.py) are looked up weekly.
+
+Usage:
+  python earnings_schedule.py            # Refresh companies that are due
+  python earnings_schedule.py --status   # Show the calendar without fetching
+"""
+
+import json
+import os
+import sys
+from datetime import datetime, timedelta
+
+import yfinance as yf
+
+from earnings_tracker import backfill_report_dates, fetch_all_earnings
+from gaming_stock_tracker_v3 import GAMING_COMPANIES
+from pipeline_context import PipelineContext, EARNINGS
+from statement_cache import next_period_end, REPORT_LAG_DAYS
+
+EARNINGS_CALENDAR_FILE = 'earnings_calendar.json'
+CALENDAR_OVERRIDES_FILE = 'earnings_calendar_overrides.json'
+SUMMARY_QUEUE_FILE = 'earnings_summary_queue.json'
+
+WINDOW_BEFORE_DAYS = 0     # Start refreshing on the report date itself
+WINDOW_AFTER_DAYS = 7      # yfinance statements can trail the print by a few days
+CALENDAR_REFRESH_DAYS = 7  # Recheck a future report date weekly
+QUARTER_DAYS = 92          # A report covers the quarter ending within this many days before it
+
+
+def _load_json(path, default):
+    if os.path.exists(path):
+        with open(path, 'r') as f:
+            return json.load(f)
+    return default
+
+
+def _save_json(path, data):
+    tmp_file = path + '.tmp'
+    with open(tmp_file, 'w') as f:
+        json.dump(data, f, indent=2)
+    os.replace(tmp_file, path)
+
+
+def latest_period_end(company):
+    """Most recent quarter end with financial data stored for a company, or None"""
+    dates = [
+        data['date'] for data in company.get('quarters', {}).values()
+        if data and data.get('date') and (data.get('revenue') is not None or data.get('earnings') is not None)
+    ]
+    return datetime.fromisoformat(max(dates)) if dates else None
+
+
+def fetch_calendar_date(ticker):
+    """Next expected report date from the yfinance calendar, or None"""
+    try:
+        calendar = yf.Ticker(ticker).calendar
+    except Exception as e:
+        print(f"  [WARN] {ticker} calendar lookup failed: {e}")
+        return None
+
+    # Newer yfinance returns a dict, older versions a DataFrame
+    if isinstance(calendar, dict):
+        dates = calendar.get('Earnings Date') or []
+    elif calendar is not None and 'Earnings Date' in getattr(calendar, 'index', []):
+        dates = list(calendar.loc['Earnings Date'].dropna())
+    else:
+        dates = []
+
+    if not isinstance(dates, (list, tuple)):
+        dates = [dates]
+    if not dates:
+        return None
+    # A range is given before the company confirms; the earliest opens the window
+    return min(datetime(d.year, d.month, d.day) for d in dates)
+
+
+def estimate_report_date(company):
+    """Earliest plausible report date for the quarter after the latest stored one"""
+    latest = latest_period_end(company)
+    if latest is None:
+        return None
+    return next_period_end(latest) + timedelta(days=REPORT_LAG_DAYS)
+
+
+def calendar_needs_check(entry, now):
+    # An 'override' entry whose override has since been removed is looked up again
+    if entry is None or entry['source'] == 'override':
+        return True
+    checked_at = datetime.fromisoformat(entry['checked_at'])
+    if now - checked_at >= timedelta(days=CALENDAR_REFRESH_DAYS):
+        return True
+    # Once the window has passed, look for the next date daily
+    expected = datetime.fromisoformat(entry['expected']) if entry.get('expected') else None
+    window_passed = expected is None or now > expected + timedelta(days=WINDOW_AFTER_DAYS)
+    return window_passed and now - checked_at >= timedelta(days=1)
+
+
+def update_calendar(calendar, earnings_data, now=None):
+    """Refresh expected report dates in place, returns the number of calendar lookups made"""
+    now = now or datetime.now()
+    overrides = _load_json(CALENDAR_OVERRIDES_FILE, {})
+    lookups = 0
+
+    for ticker in GAMING_COMPANIES:
+        entry = calendar.get(ticker)
+        if ticker in overrides:
+            if entry and entry['source'] == 'override' and entry['expected'] == overrides[ticker]:
+                continue
+            calendar[ticker] = {
+                'expected': overrides[ticker],
+                'source': 'override',
+                'checked_at': now.isoformat(timespec='seconds')
+            }
+            continue
+        if not calendar_needs_check(entry, now):
+            continue
+
+        expected = fetch_calendar_date(ticker)
+        lookups += 1
+        source = 'yfinance'
+        if expected is None:
+            expected = estimate_report_date(earnings_data.get('companies', {}).get(ticker, {}))
+            source = 'estimate'
+
+        calendar[ticker] = {
+            'expected': expected.strftime('%Y-%m-%d') if expected else None,
+            'source': source,
+            'checked_at': now.isoformat(timespec='seconds')
+        }
+
+    return lookups
+
+
+def refresh_status(entry, company, now=None):
+    """
+    Whether a ticker should be fetched: 'window' (inside its reporting window,
+    bypass the statement cache), 'overdue' (report expected but not in yet,
+    statement cache rules apply) or None
+    """
+    now = now or datetime.now()
+    if not entry or not entry.get('expected'):
+        return None
+
+    expected = datetime.fromisoformat(entry['expected'])
+    latest = latest_period_end(company)
+    if latest is not None and latest >= expected - timedelta(days=QUARTER_DAYS):
+        return None  # The quarter this report covers is already stored
+
+    if now < expected - timedelta(days=WINDOW_BEFORE_DAYS):
+        return None
+    if entry['source'] != 'estimate' and now <= expected + timedelta(days=WINDOW_AFTER_DAYS):
+        return 'window'
+    return 'overdue'
+
+
+def reported_quarters(earnings_data):
+    """(ticker, quarter) pairs that have financial data"""
+    return {
+        (ticker, quarter)
+        for ticker, company in earnings_data.get('companies', {}).items()
+        for quarter, data in company.get('quarters', {}).items()
+        if data and (data.get('revenue') is not None or data.get('earnings') is not None)
+    }
+
+
+def load_summary_queue():
+    return _load_json(SUMMARY_QUEUE_FILE, [])
+
+
+def queue_summaries(earnings_data, new_quarters, now=None):
+    """Add newly reported quarters without a presentation summary to the queue, returns those added"""
+    now = now or datetime.now()
+    queue = load_summary_queue()
+    queued = {(item['ticker'], item['quarter']) for item in queue}
+
+    added = []
+    for ticker, quarter in sorted(new_quarters):
+        data = earnings_data['companies'][ticker]['quarters'][quarter]
+        if data.get('presentation_summary') or (ticker, quarter) in queued:
+            continue
+        item = {'ticker': ticker, 'quarter': quarter, 'queued_at': now.isoformat(timespec='seconds')}
+        queue.append(item)
+        added.append(item)
+
+    if added:
+        _save_json(SUMMARY_QUEUE_FILE, queue)
+    return added
+
+
+def remove_from_summary_queue(done):
+    """Drop (ticker, quarter) pairs that now have summaries, returns how many were removed"""
+    done = set(done)
+    queue = load_summary_queue()
+    remaining = [item for item in queue if (item['ticker'], item['quarter']) not in done]
+    if len(remaining) != len(queue):
+        _save_json(SUMMARY_QUEUE_FILE, remaining)
+    return len(queue) - len(remaining)
+
+
+def print_calendar(calendar, earnings_data, now=None):
+    for ticker in GAMING_COMPANIES:
+        entry = calendar.get(ticker) or {}
+        company = earnings_data.get('companies', {}).get(ticker, {})
+        status = refresh_status(entry, company, now) or '-'
+        print(f"  {ticker:<5} {entry.get('expected') or 'unknown':<10}  {entry.get('source', ''):<8}  {status}")
+
+
+def run_scheduled_refresh(now=None, render=True):
+    """Fetch the companies that are due, queue their summaries and re-render; returns the tickers fetched"""
+    now = now or datetime.now()
+    context = PipelineContext()
+    earnings_data = context.earnings
+
+    calendar = _load_json(EARNINGS_CALENDAR_FILE, {})
+    previous = json.dumps(calendar, sort_keys=True)
+    lookups = update_calendar(calendar, earnings_data, now)
+    # Unchanged calendars aren't rewritten, so quiet runs leave the tree clean
+    if json.dumps(calendar, sort_keys=True) != previous:
+        _save_json(EARNINGS_CALENDAR_FILE, calendar)
+    print(f"Earnings calendar ({lookups} lookups):")
+    print_calendar(calendar, earnings_data, now)
+
+    statuses = {
+        ticker: refresh_status(calendar.get(ticker), earnings_data.get('companies', {}).get(ticker, {}), now)
+        for ticker in GAMING_COMPANIES
+    }
+    due = [ticker for ticker, status in statuses.items() if status]
+
+    # Report dates for quarters stored before they were recorded (the statement
+    # cache means fetches alone won't add them)
+    filled, date_lookups = backfill_report_dates(earnings_data, now=now)
+    if date_lookups:
+        print(f"\nReport dates: {filled} quarters filled ({date_lookups} lookups)")
+
+    if not due:
+        print("\nNo companies in their reporting window, nothing to fetch")
+        if date_lookups:
+            context.mark_dirty(EARNINGS)
+            context.save()
+            if filled and render:
+                print(f"[OK] Dashboard updated: {context.render_dashboard()}")
+        return []
+
+    before = reported_quarters(earnings_data)
+    in_window = {ticker for ticker in due if statuses[ticker] == 'window'}
+    print()
+    # Also saves the report dates filled above, they share earnings_data
+    fetch_all_earnings(earnings_data=earnings_data, tickers=due, refresh=in_window)
+
+    new_quarters = reported_quarters(earnings_data) - before
+    if new_quarters:
+        print(f"\nNew quarters: {', '.join(f'{t} {q}' for t, q in sorted(new_quarters))}")
+        for item in queue_summaries(earnings_data, new_quarters, now):
+            print(f"  [QUEUED] Summary for {item['ticker']} {item['quarter']}")
+    else:
+        print("\nNo new quarters reported yet")
+    if (new_quarters or filled) and render:
+        # fetch_all_earnings already saved the file; render from the same objects
+        print(f"[OK] Dashboard updated: {context.render_dashboard()}")
+
+    return due
+
+
+if __name__ == '__main__':
+    if sys.argv[1:] == ['--status']:
+        earnings = PipelineContext().earnings
+        print_calendar(_load_json(EARNINGS_CALENDAR_FILE, {}), earnings)
+    else:
+        run_scheduled_refresh()
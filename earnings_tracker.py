@@ -4,15 +4,27 @@ Earnings Tracker for Gaming Stocks
 Fetches quarterly financial data and management presentation summaries
 """
 import yfinance as yf
-from datetime import datetime
+from datetime import datetime, timedelta
 import json
 import os
+import queue
+import threading
+import time
 import pandas as pd
 
 # Import from main script
 from gaming_stock_tracker_v3 import GAMING_COMPANIES
+from quarter_metrics import metrics_by_quarter, parse_quarter, quarter_key
+from statement_cache import load_statement, store_statement
 
 EARNINGS_FILE = 'earnings_data.json'
+EARNINGS_CHECKPOINT_FILE = 'earnings_checkpoint.json'
+EARNINGS_FETCH_WORKERS = 4
+EARNINGS_FETCH_TIMEOUT = 60  # Seconds a single ticker may take before it is abandoned
+EARNINGS_CHECKPOINT_MAX_AGE = timedelta(hours=6)  # Older checkpoints are from an abandoned run, not this one
+REPORT_DATES_LIMIT = 24         # earnings_dates rows (past and upcoming) requested when backfilling, ~5 years
+REPORT_DATES_RECHECK_DAYS = 7   # Look a company up again at most this often while quarters lack report dates
+STATEMENT_SOURCES = ('quarterly_financials', 'quarterly_income_stmt')
 
 # Investor relations URLs for each company
 INVESTOR_RELATIONS = {
@@ -33,9 +45,37 @@ def load_earnings_data():
     return {"companies": {}}
 
 def save_earnings_data(data):
-    """Save earnings data"""
-    with open(EARNINGS_FILE, 'w') as f:
+    """Save earnings data (atomic: written to a temp file, then swapped in)"""
+    tmp_file = EARNINGS_FILE + '.tmp'
+    with open(tmp_file, 'w') as f:
         json.dump(data, f, indent=2)
+    os.replace(tmp_file, EARNINGS_FILE)
+
+def load_fetch_checkpoint(now=None):
+    """
+    Quarters already fetched by a recently interrupted run, as
+    {'started_at': iso, 'companies': {ticker: quarters}}; checkpoints older
+    than EARNINGS_CHECKPOINT_MAX_AGE (or in the old format) are discarded
+    """
+    now = now or datetime.now()
+    fresh = {'started_at': now.isoformat(timespec='seconds'), 'companies': {}}
+    if not os.path.exists(EARNINGS_CHECKPOINT_FILE):
+        return fresh
+
+    with open(EARNINGS_CHECKPOINT_FILE, 'r') as f:
+        checkpoint = json.load(f)
+    started_at = checkpoint.get('started_at')
+    if not started_at or now - datetime.fromisoformat(started_at) > EARNINGS_CHECKPOINT_MAX_AGE:
+        print(f"Discarding stale checkpoint from {started_at or 'an earlier version'}")
+        return fresh
+    return checkpoint
+
+def save_fetch_checkpoint(checkpoint):
+    """Save fetch checkpoint atomically"""
+    tmp_file = EARNINGS_CHECKPOINT_FILE + '.tmp'
+    with open(tmp_file, 'w') as f:
+        json.dump(checkpoint, f, indent=2)
+    os.replace(tmp_file, EARNINGS_CHECKPOINT_FILE)
 
 def get_quarters_since_q1_2024():
     """Generate list of quarters from Q1 2024 to current quarter"""
@@ -54,186 +94,307 @@ def get_quarters_since_q1_2024():
 
     return quarters
 
-def fetch_quarterly_financials(ticker):
-    """Fetch quarterly financial data from yfinance"""
-    try:
-        stock = yf.Ticker(ticker)
-        quarters_data = {}
+def download_statement(ticker):
+    """Download the quarterly income statement frame, returns (frame, source) or (None, None)"""
+    stock = yf.Ticker(ticker)
 
-        # Get quarterly income statement (this has revenue and net income)
+    # quarterly_financials has revenue and net income; the income statement is the fallback
+    for source in STATEMENT_SOURCES:
         try:
-            quarterly_financials = stock.quarterly_financials
-
-            if quarterly_financials is not None and not quarterly_financials.empty:
-                # Transpose to get dates as index
-                for date_col in quarterly_financials.columns[:8]:  # Get last 8 quarters
-                    quarter_date = date_col
-
-                    # Filter for 2024 onwards
-                    if quarter_date.year < 2024:
-                        continue
-
-                    # Determine quarter
-                    quarter_num = (quarter_date.month - 1) // 3 + 1
-                    quarter_key = f"Q{quarter_num} {quarter_date.year}"
-
-                    # Get revenue (Total Revenue or just Revenue)
-                    revenue = None
-                    for rev_key in ['Total Revenue', 'Revenue']:
-                        if rev_key in quarterly_financials.index:
-                            revenue = quarterly_financials.loc[rev_key, date_col]
-                            break
-
-                    # Get net income
-                    net_income = None
-                    for income_key in ['Net Income', 'Net Income Common Stockholders']:
-                        if income_key in quarterly_financials.index:
-                            net_income = quarterly_financials.loc[income_key, date_col]
-                            break
-
-                    quarters_data[quarter_key] = {
-                        'date': quarter_date.strftime('%Y-%m-%d'),
-                        'revenue': float(revenue) if revenue is not None and not pd.isna(revenue) else None,
-                        'earnings': float(net_income) if net_income is not None and not pd.isna(net_income) else None,
-                        'presentation_summary': None,
-                        'ir_url': INVESTOR_RELATIONS.get(ticker, '')
-                    }
-
-                print(f"    [OK] Fetched financials from quarterly_financials")
-                return quarters_data
-
+            frame = getattr(stock, source)
+            if frame is not None and not frame.empty:
+                return frame, source
         except Exception as e:
-            print(f"    Warning: quarterly_financials failed: {e}")
+            print(f"    Warning: {source} failed: {e}")
+
+    return None, None
+
+def quarters_from_statement(statement, ticker):
+    """Extract revenue and net income per quarter (2024 onwards) from a statement frame"""
+    quarters_data = {}
+
+    for date_col in statement.columns[:8]:  # Get last 8 quarters
+        quarter_date = date_col
+
+        # Filter for 2024 onwards
+        if quarter_date.year < 2024:
+            continue
+
+        # Determine quarter
+        quarter_num = (quarter_date.month - 1) // 3 + 1
+        quarter_key = f"Q{quarter_num} {quarter_date.year}"
+
+        # Get revenue (Total Revenue or just Revenue)
+        revenue = None
+        for rev_key in ['Total Revenue', 'Revenue']:
+            if rev_key in statement.index:
+                revenue = statement.loc[rev_key, date_col]
+                break
+
+        # Get net income
+        net_income = None
+        for income_key in ['Net Income', 'Net Income Common Stockholders']:
+            if income_key in statement.index:
+                net_income = statement.loc[income_key, date_col]
+                break
+
+        quarters_data[quarter_key] = {
+            'date': quarter_date.strftime('%Y-%m-%d'),
+            'revenue': float(revenue) if revenue is not None and not pd.isna(revenue) else None,
+            'earnings': float(net_income) if net_income is not None and not pd.isna(net_income) else None,
+            'presentation_summary': None,
+            'ir_url': INVESTOR_RELATIONS.get(ticker, '')
+        }
 
-        # Try alternative: quarterly income statement
-        try:
-            quarterly_income = stock.quarterly_income_stmt
-
-            if quarterly_income is not None and not quarterly_income.empty:
-                for date_col in quarterly_income.columns[:8]:
-                    quarter_date = date_col
-
-                    if quarter_date.year < 2024:
-                        continue
-
-                    quarter_num = (quarter_date.month - 1) // 3 + 1
-                    quarter_key = f"Q{quarter_num} {quarter_date.year}"
-
-                    # Get revenue
-                    revenue = None
-                    for rev_key in ['Total Revenue', 'Revenue']:
-                        if rev_key in quarterly_income.index:
-                            revenue = quarterly_income.loc[rev_key, date_col]
-                            break
-
-                    # Get net income
-                    net_income = None
-                    for income_key in ['Net Income', 'Net Income Common Stockholders']:
-                        if income_key in quarterly_income.index:
-                            net_income = quarterly_income.loc[income_key, date_col]
-                            break
-
-                    quarters_data[quarter_key] = {
-                        'date': quarter_date.strftime('%Y-%m-%d'),
-                        'revenue': float(revenue) if revenue is not None and not pd.isna(revenue) else None,
-                        'earnings': float(net_income) if net_income is not None and not pd.isna(net_income) else None,
-                        'presentation_summary': None,
-                        'ir_url': INVESTOR_RELATIONS.get(ticker, '')
-                    }
-
-                print(f"    [OK] Fetched financials from quarterly_income_stmt")
-                return quarters_data
+    return quarters_data
 
-        except Exception as e:
-            print(f"    Warning: quarterly_income_stmt failed: {e}")
+def fetch_eps_surprises(ticker, limit=None):
+    """
+    Report dates and reported vs estimated EPS from the yfinance earnings calendar
+    Returns {quarter: {'report_date': d, 'eps_actual': x, 'eps_estimate': y}} ({} when unavailable);
+    report_date is 'YYYY-MM-DDTHH:MM' local exchange time, or just the date when no time is given.
+    limit: calendar rows to request (yfinance's default covers about two years)
+    """
+    try:
+        stock = yf.Ticker(ticker)
+        earnings_dates = stock.get_earnings_dates(limit=limit) if limit else stock.earnings_dates
+    except Exception as e:
+        print(f"    Warning: earnings_dates failed: {e}")
+        return {}
 
-        # If still no data, create placeholder structure
-        if not quarters_data:
-            print(f"    [WARN] No financial data available, creating placeholders")
-            all_quarters = get_quarters_since_q1_2024()
-            for quarter in all_quarters:
-                quarters_data[quarter] = {
-                    'date': None,
-                    'revenue': None,
-                    'earnings': None,
-                    'presentation_summary': None,
-                    'ir_url': INVESTOR_RELATIONS.get(ticker, '')
-                }
+    if earnings_dates is None or earnings_dates.empty:
+        return {}
 
+    surprises = {}
+    for reported_at, row in earnings_dates.iterrows():
+        actual = row.get('Reported EPS')
+        estimate = row.get('EPS Estimate')
+        if actual is None or pd.isna(actual):
+            continue  # Upcoming report
+
+        # A report covers the quarter that ended before it
+        year, q = reported_at.year, (reported_at.month - 1) // 3 + 1
+        year, q = (year, q - 1) if q > 1 else (year - 1, 4)
+        timed = reported_at.hour or reported_at.minute
+        report = {'report_date': reported_at.strftime('%Y-%m-%dT%H:%M' if timed else '%Y-%m-%d')}
+        if estimate is not None and not pd.isna(estimate):
+            report.update({'eps_actual': float(actual), 'eps_estimate': float(estimate)})
+        surprises[quarter_key(year, q)] = report
+
+    return surprises
+
+def fetch_quarterly_financials(ticker, refresh=False):
+    """
+    Fetch quarterly financial data, reusing the cached statement until a new
+    quarter could have been reported (refresh=True always downloads)
+    """
+    try:
+        cached = None if refresh else load_statement(ticker)
+        if cached is not None:
+            statement, source = cached
+            print(f"    [OK] Using cached {source} (no new quarter due yet)")
+        else:
+            statement, source = download_statement(ticker)
+            if statement is not None:
+                store_statement(ticker, statement, source)
+                print(f"    [OK] Fetched financials from {source}")
+
+        if statement is not None:
+            quarters_data = quarters_from_statement(statement, ticker)
+            if cached is None:
+                # Report dates and EPS only change with a new report, i.e. when the statement is downloaded
+                for quarter, report in fetch_eps_surprises(ticker).items():
+                    if quarter in quarters_data:
+                        quarters_data[quarter].update(report)
+            return quarters_data
+
+        # If still no data, create placeholder structure
+        print(f"    [WARN] No financial data available, creating placeholders")
+        quarters_data = {}
+        for quarter in get_quarters_since_q1_2024():
+            quarters_data[quarter] = {
+                'date': None,
+                'revenue': None,
+                'earnings': None,
+                'presentation_summary': None,
+                'ir_url': INVESTOR_RELATIONS.get(ticker, '')
+            }
         return quarters_data
 
     except Exception as e:
         print(f"    Error fetching data for {ticker}: {e}")
         return {}
 
+def quarters_missing_report_dates(company):
+    """Stored quarters with financial data but no report date"""
+    return [
+        quarter for quarter, data in company.get('quarters', {}).items()
+        if data and not data.get('report_date') and (data.get('revenue') is not None or data.get('earnings') is not None)
+    ]
+
+def backfill_report_dates(earnings_data, tickers=None, now=None, force=False):
+    """
+    Add report dates (and missing EPS) to stored quarters that lack them
+    Statements served from the cache never reach fetch_eps_surprises, so this
+    looks the calendar up directly; a company is rechecked at most every
+    REPORT_DATES_RECHECK_DAYS (unless force) since the calendar doesn't reach
+    back indefinitely. Returns (quarters filled, companies looked up).
+    """
+    now = now or datetime.now()
+    filled = 0
+    lookups = 0
+    for ticker in tickers or list(earnings_data.get('companies', {})):
+        company = earnings_data['companies'].get(ticker, {})
+        missing = quarters_missing_report_dates(company)
+        if not missing:
+            continue
+        checked_at = company.get('report_dates_checked_at')
+        if not force and checked_at and now - datetime.fromisoformat(checked_at) < timedelta(days=REPORT_DATES_RECHECK_DAYS):
+            continue
+
+        reports = fetch_eps_surprises(ticker, limit=REPORT_DATES_LIMIT)
+        lookups += 1
+        company['report_dates_checked_at'] = now.isoformat(timespec='seconds')
+        for quarter in missing:
+            if quarter in reports:
+                data = company['quarters'][quarter]
+                data.update({key: value for key, value in reports[quarter].items() if data.get(key) is None})
+                filled += 1
+        print(f"  [OK] {ticker}: report dates for {sum(1 for q in missing if q in reports)}/{len(missing)} quarters")
+    return filled, lookups
+
 def calculate_yoy_changes(quarters_data):
     """Calculate year-over-year percentage changes for revenue and earnings"""
-    sorted_quarters = sorted(quarters_data.items(), key=lambda x: x[0])
+    metrics = metrics_by_quarter([quarters_data])[0]
 
-    for i, (quarter, data) in enumerate(sorted_quarters):
-        # Find the same quarter from previous year
-        quarter_num, year = quarter.split()
-        prev_year_quarter = f"{quarter_num} {int(year) - 1}"
+    for quarter, data in quarters_data.items():
+        parsed = parse_quarter(quarter)
+        if not data or parsed is None:
+            continue
 
-        if prev_year_quarter in quarters_data:
-            prev_data = quarters_data[prev_year_quarter]
+        # Without the prior-year quarter there is nothing to recompute from,
+        # keep whatever YoY was recorded (e.g. from the earnings release)
+        year, q = parsed
+        if not quarters_data.get(quarter_key(year - 1, q)):
+            data.setdefault('revenue_yoy', None)
+            data.setdefault('earnings_yoy', None)
+            continue
 
-            # Calculate revenue YoY
-            if data.get('revenue') and prev_data.get('revenue'):
-                revenue_yoy = ((data['revenue'] - prev_data['revenue']) / prev_data['revenue']) * 100
-                data['revenue_yoy'] = round(revenue_yoy, 1)
-            else:
-                data['revenue_yoy'] = None
-
-            # Calculate earnings YoY
-            if data.get('earnings') and prev_data.get('earnings'):
-                earnings_yoy = ((data['earnings'] - prev_data['earnings']) / prev_data['earnings']) * 100
-                data['earnings_yoy'] = round(earnings_yoy, 1)
-            else:
-                data['earnings_yoy'] = None
-        else:
-            data['revenue_yoy'] = None
-            data['earnings_yoy'] = None
+        data['revenue_yoy'] = metrics[quarter]['revenue_yoy']
+        data['earnings_yoy'] = metrics[quarter]['earnings_yoy']
 
     return quarters_data
 
-def fetch_all_earnings():
-    """Fetch earnings data for all tracked companies"""
-    print("Fetching earnings data for all companies...")
+def merge_company_quarters(earnings_data, ticker, name, quarters_data):
+    """Merge freshly fetched quarters into a company's record and recompute YoY"""
+    if ticker not in earnings_data['companies']:
+        earnings_data['companies'][ticker] = {
+            'name': name,
+            'quarters': {}
+        }
+
+    # Update with new data; fields the fetch doesn't provide (None), such as
+    # presentation summaries, keep their stored values
+    quarters = earnings_data['companies'][ticker]['quarters']
+    for quarter, data in quarters_data.items():
+        stored = quarters.get(quarter) or {}
+        quarters[quarter] = {**stored, **{k: v for k, v in data.items() if v is not None or k not in stored}}
+
+    # Calculate YoY changes
+    earnings_data['companies'][ticker]['quarters'] = calculate_yoy_changes(
+        earnings_data['companies'][ticker]['quarters']
+    )
+
+def fetch_all_earnings(workers=EARNINGS_FETCH_WORKERS, timeout=EARNINGS_FETCH_TIMEOUT, earnings_data=None, refresh=False, tickers=None):
+    """
+    Fetch earnings data for all tracked companies (or just tickers) concurrently
+    Each finished ticker is checkpointed so a run interrupted before the final
+    write resumes where it stopped; results are merged in memory and written
+    once at the end. Each fetch runs on a daemon thread, so a ticker slower than
+    timeout is abandoned for this run and can't hold up the process exiting.
+    Statements come from the on-disk cache unless a new quarter is due or
+    refresh is set (True for every ticker, or a set of tickers).
+    """
+    companies = list(tickers) if tickers is not None else list(GAMING_COMPANIES)
+    refresh_tickers = set(companies) if refresh is True else set(refresh or ())
+    print(f"Fetching earnings data for {len(companies)} companies ({workers} workers)...")
     print("=" * 70)
 
-    earnings_data = load_earnings_data()
-
-    for ticker, name in GAMING_COMPANIES.items():
-        print(f"\nFetching {name} ({ticker})...")
+    if earnings_data is None:
+        earnings_data = load_earnings_data()
 
-        quarters_data = fetch_quarterly_financials(ticker)
+    checkpoint = load_fetch_checkpoint()
+    fetched = checkpoint['companies']
+    if fetched:
+        print(f"Resuming: {len(fetched)} companies already fetched ({', '.join(fetched)})")
 
-        if ticker not in earnings_data['companies']:
-            earnings_data['companies'][ticker] = {
-                'name': name,
-                'quarters': {}
-            }
+    waiting = [t for t in companies if t not in fetched]
+    running = {}  # ticker -> start time, for fetches not yet finished or abandoned
+    durations = {}
+    results = queue.Queue()
 
-        # Update with new data
-        earnings_data['companies'][ticker]['quarters'].update(quarters_data)
+    def fetch(ticker):
+        print(f"\nFetching {GAMING_COMPANIES[ticker]} ({ticker})...")
+        try:
+            results.put((ticker, fetch_quarterly_financials(ticker, ticker in refresh_tickers), None))
+        except Exception as e:
+            results.put((ticker, None, e))
 
-        # Calculate YoY changes
-        earnings_data['companies'][ticker]['quarters'] = calculate_yoy_changes(
-            earnings_data['companies'][ticker]['quarters']
-        )
+    run_start = time.monotonic()
+    timed_out = []
+    while waiting or running:
+        while waiting and len(running) < workers:
+            ticker = waiting.pop(0)
+            running[ticker] = time.monotonic()
+            threading.Thread(target=fetch, args=(ticker,), daemon=True).start()
 
-        # Save after each company
-        save_earnings_data(earnings_data)
+        try:
+            ticker, quarters_data, error = results.get(timeout=0.5)
+        except queue.Empty:
+            ticker = None
+
+        # Results from fetches already abandoned are dropped
+        if ticker in running:
+            durations[ticker] = time.monotonic() - running.pop(ticker)
+            if error is not None:
+                print(f"  [SKIP] {ticker}: {error}")
+            else:
+                fetched[ticker] = quarters_data
+                save_fetch_checkpoint(checkpoint)
+
+        # Give up on tickers that have been running too long, freeing their slot
+        now = time.monotonic()
+        for ticker in [t for t, started in running.items() if now - started > timeout]:
+            print(f"  [TIMEOUT] {ticker} took longer than {timeout}s, skipped this run")
+            timed_out.append(ticker)
+            del running[ticker]
+
+    # Merge everything fetched (this run and any resumed checkpoint), then write once
+    for ticker in GAMING_COMPANIES:
+        if ticker not in fetched:
+            continue
+        quarters_data = fetched[ticker]
+        merge_company_quarters(earnings_data, ticker, GAMING_COMPANIES[ticker], quarters_data)
 
         if quarters_data:
             # Count how many have actual data vs placeholders
             with_data = sum(1 for q in quarters_data.values() if q.get('revenue') is not None or q.get('earnings') is not None)
-            print(f"  [OK] Fetched {len(quarters_data)} quarters ({with_data} with financial data)")
+            print(f"  [OK] {ticker}: {len(quarters_data)} quarters ({with_data} with financial data)")
         else:
-            print(f"  [SKIP] No data available")
+            print(f"  [SKIP] {ticker}: No data available")
+
+    # Everything fetched is now in the earnings file; timed out tickers are simply refetched next run
+    save_earnings_data(earnings_data)
+    if os.path.exists(EARNINGS_CHECKPOINT_FILE):
+        os.remove(EARNINGS_CHECKPOINT_FILE)
 
+    elapsed = time.monotonic() - run_start
+    slowest = max(durations.values(), default=0)
     print(f"\n{'=' * 70}")
+    print(f"Fetched {len(durations)} companies in {elapsed:.1f}s "
+          f"(slowest ticker {slowest:.1f}s, {sum(durations.values()):.1f}s if run serially)")
+    if timed_out:
+        print(f"Timed out: {', '.join(timed_out)}")
     print(f"Earnings data saved to {EARNINGS_FILE}")
     return earnings_data
 
@@ -262,6 +423,15 @@ if __name__ == "__main__":
     if len(sys.argv) == 1:
         # Fetch all earnings data
         fetch_all_earnings()
+    elif sys.argv[1:] == ['--refresh']:
+        # Ignore the statement cache and download everything
+        fetch_all_earnings(refresh=True)
+    elif sys.argv[1:] == ['--report-dates']:
+        # Look up report dates for every stored quarter that lacks one
+        earnings_data = load_earnings_data()
+        filled, _ = backfill_report_dates(earnings_data, force=True)
+        save_earnings_data(earnings_data)
+        print(f"Filled report dates for {filled} quarters")
     elif len(sys.argv) == 4:
         # Update specific presentation summary
         ticker = sys.argv[1]
@@ -271,6 +441,8 @@ if __name__ == "__main__":
     else:
         print("Usage:")
         print("  python earnings_tracker.py                    # Fetch all earnings data")
+        print("  python earnings_tracker.py --refresh          # Same, ignoring the statement cache")
+        print("  python earnings_tracker.py --report-dates     # Look up missing report dates")
         print('  python earnings_tracker.py TICKER QUARTER "Summary text"  # Update presentation summary')
         print("\nExample:")
         print('  python earnings_tracker.py DKNG "Q1 2024" "Management highlighted..."')
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Earnings event study
+Joins each quarter's report date (earnings_data.json 'report_date', recorded
+from the yfinance earnings calendar by earnings_tracker.py) to the daily
+price history and measures the reaction against ^IXIC.
+
+Dates are matched to the sorted history with bisect: a report before the
+open (or without a time) reacts the same day, one after the close on the
+next trading day. Abnormal returns are market-adjusted (the company's daily
+move minus the NASDAQ's, using the same daily moves the day cards show) and
+are summed over each window, computed in one pass over a tickers x days
+array for every company and quarter at once.
+
+Usage:
+  python event_study.py                 # Default windows
+  python event_study.py --windows 0:0,-1:3
+"""
+
+import json
+import sys
+from bisect import bisect_left, bisect_right
+from datetime import datetime, timedelta
+
+import numpy as np
+
+EVENT_WINDOWS = ((0, 0), (0, 1), (0, 5))  # Trading days relative to the reaction day, inclusive
+AFTER_CLOSE_HOUR = 16   # Reports timed at or after this hour react the next trading day
+MAX_EVENT_GAP_DAYS = 4  # A reaction day further than this from the report is a gap in the history
+
+
+def build_return_matrix(records, tickers):
+    """
+    Daily moves from history records (any order) as
+    (sorted dates, {ticker: row}, [tickers x days] array, benchmark vector), NaN = missing
+    """
+    records = sorted(records, key=lambda r: r['date'])
+    dates = [r['date'] for r in records]
+    rows = {ticker: i for i, ticker in enumerate(tickers)}
+
+    returns = np.full((len(tickers), len(records)), np.nan)
+    benchmark = np.full(len(records), np.nan)
+    for col, record in enumerate(records):
+        if (record.get('benchmark') or {}).get('pct_change') is not None:
+            benchmark[col] = record['benchmark']['pct_change']
+        for ticker, company in record.get('companies', {}).items():
+            data = company.get('data') or {}
+            if ticker in rows and data.get('pct_change') is not None:
+                returns[rows[ticker], col] = data['pct_change']
+
+    return dates, rows, returns, benchmark
+
+
+def reaction_index(dates, report_date):
+    """
+    Index into sorted dates of the first session reacting to a report
+    report_date is 'YYYY-MM-DD' or 'YYYY-MM-DDTHH:MM'; None if not in the history
+    """
+    day = report_date[:10]
+    after_close = len(report_date) > 10 and int(report_date[11:13]) >= AFTER_CLOSE_HOUR
+    index = bisect_right(dates, day) if after_close else bisect_left(dates, day)
+    if index >= len(dates):
+        return None
+    gap = datetime.fromisoformat(dates[index]) - datetime.fromisoformat(day)
+    return index if gap <= timedelta(days=MAX_EVENT_GAP_DAYS) else None
+
+
+def window_sums(values, rows, days, window):
+    """Sum of values[row, day+start..day+end] per event, NaN if any day is missing"""
+    start, end = window
+    offsets = days[:, None] + np.arange(start, end + 1)[None, :]
+    inside = (offsets >= 0) & (offsets < values.shape[1])
+    gathered = values[rows[:, None], np.clip(offsets, 0, values.shape[1] - 1)]
+    return np.where(inside, gathered, np.nan).sum(axis=1)
+
+
+def _number(x):
+    return None if np.isnan(x) else round(float(x), 2)
+
+
+def earnings_events(earnings_data, records, windows=EVENT_WINDOWS):
+    """
+    Reaction to every report found in the history, as {ticker: {quarter: event}}
+    event: report_date, reaction_date, return and benchmark (reaction-day moves, %)
+    and windows: [[start, end, abnormal return %], ...] (None until the window has passed)
+    """
+    companies = earnings_data.get('companies', {})
+    dates, rows, returns, benchmark = build_return_matrix(records, list(companies))
+
+    events = []
+    for ticker, company in companies.items():
+        for quarter, data in company.get('quarters', {}).items():
+            if not data or not data.get('report_date'):
+                continue
+            index = reaction_index(dates, data['report_date'])
+            if index is not None:
+                events.append((ticker, quarter, data['report_date'], index))
+    if not events:
+        return {}
+
+    event_rows = np.array([rows[ticker] for ticker, _, _, _ in events])
+    event_days = np.array([index for _, _, _, index in events])
+    abnormal = returns - benchmark[None, :]
+    sums = [window_sums(abnormal, event_rows, event_days, window) for window in windows]
+
+    results = {}
+    for i, (ticker, quarter, report_date, index) in enumerate(events):
+        results.setdefault(ticker, {})[quarter] = {
+            'report_date': report_date,
+            'reaction_date': dates[index],
+            'return': _number(returns[event_rows[i], index]),
+            'benchmark': _number(benchmark[index]),
+            'windows': [[start, end, _number(sums[w][i])] for w, (start, end) in enumerate(windows)]
+        }
+    return results
+
+
+def parse_windows(spec):
+    """'0:0,-1:3' -> ((0, 0), (-1, 3))"""
+    return tuple(tuple(int(day) for day in part.split(':')) for part in spec.split(','))
+
+
+def main(argv):
+    windows = EVENT_WINDOWS
+    if len(argv) == 2 and argv[0] == '--windows':
+        windows = parse_windows(argv[1])
+
+    with open('earnings_data.json', 'r') as f:
+        earnings_data = json.load(f)
+    with open('stock_tracker_history.json', 'r') as f:
+        records = json.load(f)['records']
+
+    events = earnings_events(earnings_data, records, windows)
+    if not events:
+        print("No earnings reports fall inside the price history")
+        return
+
+    header = ''.join(f"{f'[{start:+d},{end:+d}]':>10}" for start, end in windows)
+    print(f"{'Ticker':<7}{'Quarter':<9}{'Reaction':<12}{'Move':>8}{'^IXIC':>8}{header}")
+    for ticker, quarters in events.items():
+        for quarter, event in quarters.items():
+            cells = ''.join(f"{'-' if car is None else f'{car:+.2f}%':>10}" for _, _, car in event['windows'])
+            move = '-' if event['return'] is None else f"{event['return']:+.2f}%"
+            bench = '-' if event['benchmark'] is None else f"{event['benchmark']:+.2f}%"
+            print(f"{ticker:<7}{quarter:<9}{event['reaction_date']:<12}{move:>8}{bench:>8}{cells}")
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
@@ -5,6 +5,9 @@ Automatically fetch earnings call summaries using web search
 import json
 import os
 
+from earnings_schedule import load_summary_queue
+from quarter_metrics import parse_quarter, quarter_ordinal
+
 # Note: This script requires access to WebSearch which is only available in Claude Code
 # When run standalone, it will print instructions for manual updates
 
@@ -28,6 +31,25 @@ def generate_earnings_summary_prompt(company_name, ticker, quarter):
 
 Keep it dense with specific numbers and quotes where possible. Focus on what matters most to investors."""
 
+def find_summary_gaps(earnings_data, queued=()):
+    """
+    Reported quarters (with revenue) that have no presentation summary, across
+    all companies, as {'ticker', 'name', 'quarter'} dicts: quarters in queued
+    ((ticker, quarter) pairs) first, then newest first
+    """
+    queued = set(queued)
+    gaps = []
+    for ticker, company_data in earnings_data['companies'].items():
+        name = company_data.get('name', ticker)
+        for quarter, data in company_data.get('quarters', {}).items():
+            parsed = parse_quarter(quarter)
+            if parsed and data and data.get('revenue') and not data.get('presentation_summary'):
+                gaps.append((quarter_ordinal(*parsed), {'ticker': ticker, 'name': name, 'quarter': quarter}))
+
+    # Queued quarters first, then newest first
+    gaps.sort(key=lambda item: ((item[1]['ticker'], item[1]['quarter']) not in queued, -item[0]))
+    return [gap for _, gap in gaps]
+
 def list_quarters_needing_summaries():
     """List all quarters that need earnings call summaries"""
     earnings_data = load_earnings_data()
@@ -35,30 +57,36 @@ def list_quarters_needing_summaries():
     print("\nQuarters needing earnings call summaries:")
     print("=" * 70)
 
-    for ticker, company_data in earnings_data['companies'].items():
-        name = company_data.get('name', ticker)
-        quarters = company_data.get('quarters', {})
+    by_company = {}
+    for gap in find_summary_gaps(earnings_data):
+        by_company.setdefault((gap['ticker'], gap['name']), []).append(gap['quarter'])
 
-        needs_summary = []
-        for quarter, data in sorted(quarters.items()):
-            if not data.get('presentation_summary') and data.get('revenue'):
-                needs_summary.append(quarter)
+    for (ticker, name), quarters in by_company.items():
+        print(f"\n{name} ({ticker}):")
+        for quarter in quarters:
+            print(f"  - {quarter}")
+            print(f"    Search: \"{name} {ticker} {quarter} earnings call\"")
 
-        if needs_summary:
-            print(f"\n{name} ({ticker}):")
-            for quarter in needs_summary:
-                print(f"  - {quarter}")
-                prompt = generate_earnings_summary_prompt(name, ticker, quarter)
-                print(f"    Search: \"{name} {ticker} {quarter} earnings call\"")
+def list_queued_summaries():
+    """List quarters the earnings scheduler queued as they were reported"""
+    queue = load_summary_queue()
+    if not queue:
+        return
+
+    print("\nQueued by the earnings scheduler (newly reported):")
+    print("=" * 70)
+    for item in queue:
+        print(f"  - {item['ticker']} {item['quarter']} (queued {item['queued_at']})")
 
 if __name__ == "__main__":
     print("Earnings Call Summary Fetcher")
     print("=" * 70)
     print("\nThis script identifies quarters that need earnings call summaries.")
-    print("To add summaries automatically, use Claude Code's WebSearch capability.")
+    print("To generate them automatically, run: python auto_fetch_earnings_summaries.py")
     print("\nAlternatively, you can:")
     print("1. Search for the earnings call transcript")
     print("2. Ask an AI to summarize it")
     print("3. Add it using: python earnings_tracker.py TICKER QUARTER \"Summary\"")
 
+    list_queued_summaries()
     list_quarters_needing_summaries()
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+On-disk cache of rendered dashboard fragments
+Each fragment is stored under a hash of the data it was rendered from (plus
+a version string covering the renderer code), so only records that changed
+since the last run get re-rendered.
+"""
+
+import hashlib
+import json
+import os
+
+FRAGMENT_CACHE_DIR = '.dashboard_cache'
+
+
+def file_digest(*paths):
+    """Hash of source files, used to invalidate fragments when renderer code changes"""
+    digest = hashlib.sha1()
+    for path in paths:
+        with open(path, 'rb') as f:
+            digest.update(f.read())
+    return digest.hexdigest()[:12]
+
+
+class FragmentCache:
+    """Content-addressed HTML fragment cache backed by one small file per fragment"""
+
+    def __init__(self, cache_dir=FRAGMENT_CACHE_DIR, version=''):
+        self.cache_dir = cache_dir
+        self.version = version
+        self.used = set()
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def key(self, kind, payload):
+        digest = hashlib.sha1()
+        digest.update(self.version.encode('utf-8'))
+        digest.update(json.dumps(payload, sort_keys=True, default=str).encode('utf-8'))
+        return f"{kind}-{digest.hexdigest()}.html"
+
+    def get(self, kind, payload, render):
+        """Return the cached fragment for payload, calling render() only on a miss"""
+        name = self.key(kind, payload)
+        path = os.path.join(self.cache_dir, name)
+        self.used.add(name)
+
+        if os.path.exists(path):
+            self.hits += 1
+            with open(path, 'r', encoding='utf-8') as f:
+                return f.read()
+
+        self.misses += 1
+        html = render()
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(html)
+        os.replace(tmp_path, path)
+        return html
+
+    def prune(self):
+        """Delete fragments not used in this render (stale versions of changed records)"""
+        removed = 0
+        for name in os.listdir(self.cache_dir):
+            # Other caches (e.g. sparklines.json) share the directory
+            if name.endswith('.html') and name not in self.used:
+                os.remove(os.path.join(self.cache_dir, name))
+                removed += 1
+        return removed
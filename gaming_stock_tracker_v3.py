@@ -10,8 +10,25 @@ from datetime import datetime, timedelta
 import json
 import os
 from pathlib import Path
+import urllib.parse
 import warnings
 
+import dashboard_template
+from dashboard_template import (
+    PAGE_HEAD, BODY_OPEN, TABS_HTML, EARNINGS_TAB_OPEN, PAGE_FOOTER,
+    render_header, render_day_loader, render_stylesheet_link
+)
+from dashboard_data import write_day_shards, write_earnings_archive
+from site_build import build_site
+from logo_assets import build_logo_css
+from search_index import write_search_index
+from sparklines import build_sparklines
+from fragment_cache import FragmentCache, file_digest
+from quarter_metrics import company_metrics, parse_quarter, quarter_index, quarter_key
+from sector_aggregates import sector_aggregates, overview_quarter, STRONG_GROWTH_PCT
+from event_study import earnings_events
+from latest_records import write_latest_records
+
 # Disable SSL warnings (workaround for Windows SSL certificate issues)
 warnings.filterwarnings('ignore')
 
@@ -39,7 +56,7 @@ GAMING_COMPANIES = {
     'BALY': 'Bally\'s Corporation'
 }
 
-# Company logo URLs (using Clearbit Logo API)
+# Company logo sources (Clearbit Logo API), fetched once into assets/logos by logo_assets
 COMPANY_LOGOS = {
     'DKNG': 'https://logo.clearbit.com/draftkings.com',
     'FLUT': 'https://logo.clearbit.com/flutter.com',
@@ -54,6 +71,9 @@ BENCHMARK = '^IXIC'  # NASDAQ Composite Index
 MATERIAL_CHANGE_THRESHOLD = 2.0  # 2% threshold
 DATA_FILE = 'stock_tracker_history.json'
 DASHBOARD_FILE = 'index.html'
+DASHBOARD_WRITE_BUFFER = 64 * 1024  # Bytes buffered before each write to disk
+DASHBOARD_EMBEDDED_DAYS = 30  # Most recent days rendered into index.html; older ones load from data/
+EARNINGS_VISIBLE_YEARS = 2  # Earnings years rendered into index.html; earlier ones load from data/
 
 def load_historical_data():
     """Load existing historical data from JSON file"""
@@ -63,9 +83,23 @@ def load_historical_data():
     return {"records": []}
 
 def save_historical_data(data):
-    """Save historical data to JSON file"""
-    with open(DATA_FILE, 'w') as f:
+    """
+    Save historical data to JSON file (atomic: written to a temp file, then swapped in)
+    and refresh the latest-records pointer read by the Slack notifier
+    """
+    tmp_file = DATA_FILE + '.tmp'
+    with open(tmp_file, 'w') as f:
         json.dump(data, f, indent=2)
+    os.replace(tmp_file, DATA_FILE)
+    write_latest_records(data, DATA_FILE)
+
+def index_material_changes(data):
+    """Map (date, ticker) -> material change dict for every record in the history"""
+    index = {}
+    for record in data['records']:
+        for change in record.get('material_changes', []):
+            index[(record['date'], change['ticker'])] = change
+    return index
 
 def get_stock_data(ticker, date=None):
     """
@@ -229,778 +263,537 @@ def load_earnings_data():
             return json.load(f)
     return {"companies": {}}
 
-def generate_industry_summary():
-    """Generate industry summary for most recent quarter across all companies"""
-    earnings_data = load_earnings_data()
-
-    # Find the most recent quarter across all companies
-    most_recent_quarter = None
-    for ticker, company_data in earnings_data['companies'].items():
-        quarters = company_data.get('quarters', {})
-        for quarter in quarters.keys():
-            if quarters[quarter].get('presentation_summary'):
-                if most_recent_quarter is None or quarter > most_recent_quarter:
-                    most_recent_quarter = quarter
-
-    if not most_recent_quarter:
+def format_billions(value):
+    return f"-${abs(value)/1e9:.2f}B" if value < 0 else f"${value/1e9:.2f}B"
+
+def format_change(pct):
+    change_class = "positive" if pct > 0 else "negative"
+    return f'<span class="overview-change {change_class}">{pct:+.1f}%</span>'
+
+def describe_sector_quarter(stats, names):
+    """One-paragraph reading of a quarter's sector aggregates"""
+    sentences = []
+    if stats['revenue_yoy'] is not None:
+        direction = "rose" if stats['revenue_yoy'] >= 0 else "fell"
+        sentences.append(
+            f"Sector revenue {direction} {abs(stats['revenue_yoy']):.1f}% year over year across "
+            f"{stats['comparable']} comparable {'company' if stats['comparable'] == 1 else 'companies'}."
+        )
+
+    growth = stats['growth']
+    growing = growth['strong'] + growth['moderate']
+    ranked = growing + growth['declining']
+    if ranked:
+        sentence = f"{growing} of {ranked} grew revenue"
+        if stats['fastest'] and stats['fastest'][1] > 0:
+            ticker, pct = stats['fastest']
+            sentence += f", led by {names.get(ticker, ticker)} ({pct:+.1f}%)"
+        sentences.append(sentence + ".")
+
+    if stats['with_earnings']:
+        sentences.append(f"{stats['profitable']} of {stats['with_earnings']} reported a profit.")
+
+    eps = stats['eps']
+    if eps['beat'] + eps['met'] + eps['missed']:
+        sentences.append(f"Against EPS estimates, {eps['beat']} beat, {eps['met']} met and {eps['missed']} missed.")
+
+    return ' '.join(sentences)
+
+def generate_industry_summary(earnings_data=None):
+    """Generate the industry overview card from sector aggregates for the most recent quarter"""
+    if earnings_data is None:
+        earnings_data = load_earnings_data()
+
+    companies = earnings_data.get('companies', {})
+    aggregates, _ = sector_aggregates(earnings_data)
+    quarter = overview_quarter(aggregates, len(companies))
+    if not quarter:
         return ""
 
-    # Collect summaries from all companies for this quarter
-    summaries = []
-    for ticker, company_data in sorted(earnings_data['companies'].items()):
-        name = company_data.get('name', ticker)
-        quarters = company_data.get('quarters', {})
-        if most_recent_quarter in quarters:
-            data = quarters[most_recent_quarter]
-            if data.get('presentation_summary'):
-                summaries.append({
-                    'ticker': ticker,
-                    'name': name,
-                    'summary': data['presentation_summary']
-                })
+    stats = aggregates[quarter]
+    names = {ticker: company.get('name', ticker) for ticker, company in companies.items()}
+    summaries = sum(
+        1 for company in companies.values()
+        if (company.get('quarters', {}).get(quarter) or {}).get('presentation_summary')
+    )
+
+    revenue_note = f"{stats['companies']} of {len(companies)} reported"
+    if stats['revenue_yoy'] is not None:
+        revenue_note = f"{format_change(stats['revenue_yoy'])} YoY, {revenue_note}"
+
+    earnings_value = format_billions(stats['earnings']) if stats['earnings'] is not None else "N/A"
+    growth = stats['growth']
+    median = f"median {format_change(growth['median'])}" if growth['median'] is not None else "no YoY yet"
+
+    tiles = [
+        ("Sector Revenue", format_billions(stats['revenue']), revenue_note),
+        ("Net Income", earnings_value, f"{stats['profitable']} of {stats['with_earnings']} profitable"),
+        ("Revenue Growth", f"{growth['strong']} / {growth['moderate']} / {growth['declining']}",
+         f"≥{STRONG_GROWTH_PCT:.0f}% / 0–{STRONG_GROWTH_PCT:.0f}% / declining, {median}")
+    ]
+    eps = stats['eps']
+    if eps['beat'] + eps['met'] + eps['missed']:
+        tiles.append(("EPS vs Estimates", f"{eps['beat']} / {eps['met']} / {eps['missed']}", "beat / met / missed"))
+
+    tiles_html = ''.join(
+        f'<div class="overview-stat"><div class="overview-label">{label}</div>'
+        f'<div class="overview-value">{value}</div><div class="overview-note">{note}</div></div>'
+        for label, value, note in tiles
+    )
+    ranking_html = ''.join(
+        f'<li><span>{ticker}</span> {margin:+.1f}%</li>' for ticker, margin in stats['margins']
+    )
 
-    if not summaries:
-        return ""
-
-    # Generate industry overview
     html = f"""
-    <div style="background: linear-gradient(135deg, #0047FF 0%, #0056CC 100%); padding: 25px 30px; border-radius: 8px; margin-bottom: 20px; box-shadow: 0 4px 12px rgba(0,71,255,0.2);">
-        <h2 style="color: white; font-size: 1.5em; margin-bottom: 15px; font-weight: 700;">Industry Overview: {most_recent_quarter}</h2>
-        <div style="color: rgba(255,255,255,0.95); font-size: 0.95em; line-height: 1.7;">
-            <p style="margin-bottom: 10px;"><strong style="color: white;">Gaming Industry {most_recent_quarter} Highlights:</strong></p>
-            <p>The gaming sector showed mixed performance across {len(summaries)} companies. Key themes included digital growth momentum, regional gaming challenges, strategic transformations, and evolving regulatory landscapes. Companies focused on cost optimization, market share expansion, and preparing for upcoming market opportunities while navigating customer-friendly sports outcomes and operational headwinds.</p>
-        </div>
+    <div class="industry-overview">
+        <h2>Industry Overview: {quarter}</h2>
+        <div class="overview-stats">{tiles_html}</div>
+        <div class="overview-ranking"><div class="overview-label">Net Margin Ranking</div><ol>{ranking_html}</ol></div>
+        <p class="overview-text">{describe_sector_quarter(stats, names)} Management summaries are available for {summaries} of {len(companies)} companies.</p>
     </div>
     """
 
     return html
 
-def generate_earnings_tracker_html():
-    """Generate HTML for the earnings tracker tab"""
-    earnings_data = load_earnings_data()
+def format_quarter_extra(metrics):
+    """QoQ revenue, net margin and TTM revenue line for a quarter card ('' if none are known)"""
+    if not metrics:
+        return ""
 
-    html = ""
+    parts = []
+    if metrics.get('revenue_qoq') is not None:
+        qoq_class = "positive" if metrics['revenue_qoq'] > 0 else "negative"
+        parts.append(f'<span>Rev QoQ <span class="yoy {qoq_class}">{metrics["revenue_qoq"]:+.1f}%</span></span>')
+    if metrics.get('net_margin') is not None:
+        parts.append(f'<span>Net margin <strong>{metrics["net_margin"]:.1f}%</strong></span>')
+    if metrics.get('revenue_ttm') is not None:
+        parts.append(f'<span>TTM revenue <strong>${metrics["revenue_ttm"]/1e9:.2f}B</strong></span>')
 
-    # Check if we have any earnings data
-    if not earnings_data.get('companies'):
-        html += """
-            <div style="padding: 40px; text-align: center; background: white; border-radius: 8px; margin: 20px 0;">
-                <h2 style="color: #0047FF; margin-bottom: 15px;">No Earnings Data Available</h2>
-                <p style="color: #555; margin-bottom: 20px;">Run <code>python earnings_tracker.py</code> to fetch earnings data.</p>
-            </div>
-        """
-        return html
+    if not parts:
+        return ""
+    return f'<div class="quarter-extra">{"".join(parts)}</div>'
 
-    # Add industry summary
-    html += generate_industry_summary()
+def format_window(start, end):
+    """(0, 0) -> 'Day 0', (-1, 5) -> 'Days -1..+5' (trading days from the reaction day)"""
+    offset = lambda day: f"{day:+d}" if day else "0"
+    return f"Day {offset(start)}" if start == end else f"Days {offset(start)}..{offset(end)}"
 
-    # Generate earnings cards for each company
-    company_index = 0
-    for ticker, company_data in earnings_data['companies'].items():
-        name = company_data.get('name', ticker)
-        quarters = company_data.get('quarters', {})
-        logo_url = COMPANY_LOGOS.get(ticker, '')
+def format_quarter_event(event):
+    """Post-earnings abnormal returns vs NASDAQ for a quarter card ('' if the report isn't in the history)"""
+    if not event:
+        return ""
 
-        if not quarters:
+    parts = []
+    for start, end, abnormal in event['windows']:
+        if abnormal is None:
             continue
+        change_class = "positive" if abnormal > 0 else "negative"
+        parts.append(f'<span>{format_window(start, end)} <span class="yoy {change_class}">{abnormal:+.1f}%</span></span>')
 
-        company_index += 1
-
-        # Organize quarters by year
-        quarters_2024 = {}
-        quarters_2025 = {}
+    if not parts:
+        return ""
+    title = f"Reported {event['report_date'].replace('T', ' ')}, first reaction {event['reaction_date']}"
+    if event['return'] is not None and event['benchmark'] is not None:
+        title += f": {event['return']:+.1f}% vs NASDAQ {event['benchmark']:+.1f}%"
+    return f'<div class="quarter-event" title="{title}"><span class="quarter-event-label">Post-earnings vs NASDAQ</span>{"".join(parts)}</div>'
 
-        for quarter, data in quarters.items():
-            if '2024' in quarter:
-                quarters_2024[quarter] = data
-            elif '2025' in quarter:
-                quarters_2025[quarter] = data
+def generate_quarter_card(quarter, data, metrics=None, event=None):
+    """
+    Generate HTML for a single earnings quarter card (placeholder if data is None)
+    metrics: this quarter's entry from quarter_metrics.company_metrics;
+    event: its entry from event_study.earnings_events
+    """
+    if data is None:
+        # Placeholder for missing quarter
+        return f"""
+            <div class="quarter-card missing">
+                <div class="quarter-title">{quarter}</div>
+                <div class="quarter-empty">No data available</div>
+            </div>
+        """
 
-        # Build HTML for company (collapsible)
-        html += f"""
-        <div class="company-card" style="background: white; padding: 0; border-radius: 8px; margin-bottom: 15px; box-shadow: 0 2px 8px rgba(0,0,0,0.08); overflow: hidden;">
-            <div class="company-header" onclick="toggleCompany('company-{company_index}')" style="display: flex; align-items: center; gap: 12px; padding: 20px 25px; cursor: pointer; background: white; border-bottom: 2px solid #f0f0f0; transition: background 0.2s;">
-                <svg class="collapse-arrow" id="arrow-{company_index}" style="width: 20px; height: 20px; fill: #0047FF; transition: transform 0.3s;" viewBox="0 0 24 24" xmlns="http://www.w3.org/2000/svg">
-                    <path d="M7.41 8.59L12 13.17l4.59-4.58L18 10l-6 6-6-6 1.41-1.41z"/>
-                </svg>
-                <img src="{logo_url}" alt="{name}" style="width: 32px; height: 32px; object-fit: contain; border-radius: 4px;" onerror="this.style.display='none'">
-                <h2 style="color: #0047FF; font-size: 1.4em; margin: 0; flex: 1;">{name} ({ticker})</h2>
-                <a href="{list(quarters.values())[0].get('ir_url', '#')}" target="_blank" onclick="event.stopPropagation();" style="padding: 6px 14px; background: #FF4500; color: white; text-decoration: none; border-radius: 20px; font-size: 0.8em; font-weight: 600;">Investor Relations →</a>
+    revenue = data.get('revenue')
+    earnings = data.get('earnings')
+    revenue_yoy = data.get('revenue_yoy')
+    earnings_yoy = data.get('earnings_yoy')
+    presentation_summary = data.get('presentation_summary')
+
+    # Format financial numbers
+    revenue_str = f"${revenue/1e9:.2f}B" if revenue else "N/A"
+    earnings_str = f"${earnings/1e9:.2f}B" if earnings else "N/A"
+
+    # Format YoY changes with color
+    revenue_yoy_str = ""
+    if revenue_yoy is not None:
+        yoy_class = "positive" if revenue_yoy > 0 else "negative"
+        revenue_yoy_str = f'<span class="yoy {yoy_class}">({revenue_yoy:+.1f}% YoY)</span>'
+
+    earnings_yoy_str = ""
+    if earnings_yoy is not None:
+        yoy_class = "positive" if earnings_yoy > 0 else "negative"
+        earnings_yoy_str = f'<span class="yoy {yoy_class}">({earnings_yoy:+.1f}% YoY)</span>'
+
+    card_html = f"""
+        <div class="quarter-card">
+            <div class="quarter-title">{quarter}</div>
+
+            <div class="quarter-metrics">
+                <div>
+                    <div class="metric-label">Revenue</div>
+                    <div class="metric-value">{revenue_str} {revenue_yoy_str}</div>
+                </div>
+                <div>
+                    <div class="metric-label">Earnings</div>
+                    <div class="metric-value">{earnings_str} {earnings_yoy_str}</div>
+                </div>
             </div>
+            {format_quarter_extra(metrics)}
+            {format_quarter_event(event)}
+    """
 
-            <div id="company-{company_index}" class="company-content" style="padding: 25px; background: #fafafa;">
-                <div style="display: grid; grid-template-columns: 1fr 1fr; gap: 20px;">
+    if presentation_summary:
+        card_html += f"""
+            <div class="presentation">
+                <div class="presentation-label">Management Presentation</div>
+                <div class="presentation-text">{presentation_summary}</div>
+            </div>
         """
 
-        # Helper function to generate quarter card
-        def generate_quarter_card(quarter, data):
-            if data is None:
-                # Placeholder for missing quarter
-                return f"""
-                    <div style="background: #f0f0f0; padding: 15px; border-radius: 6px; border-left: 4px solid #ccc; opacity: 0.5;">
-                        <div style="font-weight: 700; color: #999; font-size: 1em; margin-bottom: 10px;">{quarter}</div>
-                        <div style="color: #999; font-size: 0.85em; font-style: italic;">No data available</div>
-                    </div>
-                """
-
-            revenue = data.get('revenue')
-            earnings = data.get('earnings')
-            revenue_yoy = data.get('revenue_yoy')
-            earnings_yoy = data.get('earnings_yoy')
-            presentation_summary = data.get('presentation_summary')
-
-            # Format financial numbers
-            revenue_str = f"${revenue/1e9:.2f}B" if revenue else "N/A"
-            earnings_str = f"${earnings/1e9:.2f}B" if earnings else "N/A"
-
-            # Format YoY changes with color
-            revenue_yoy_str = ""
-            if revenue_yoy is not None:
-                yoy_color = "#28a745" if revenue_yoy > 0 else "#dc3545"
-                revenue_yoy_str = f'<span style="color: {yoy_color}; font-size: 0.85em; font-weight: 600;">({revenue_yoy:+.1f}% YoY)</span>'
-
-            earnings_yoy_str = ""
-            if earnings_yoy is not None:
-                yoy_color = "#28a745" if earnings_yoy > 0 else "#dc3545"
-                earnings_yoy_str = f'<span style="color: {yoy_color}; font-size: 0.85em; font-weight: 600;">({earnings_yoy:+.1f}% YoY)</span>'
-
-            card_html = f"""
-                <div style="background: #f8f9fa; padding: 15px; border-radius: 6px; border-left: 4px solid #0047FF;">
-                    <div style="font-weight: 700; color: #0047FF; font-size: 1em; margin-bottom: 10px;">{quarter}</div>
-
-                    <div style="display: flex; gap: 20px; margin-bottom: 12px;">
-                        <div>
-                            <div style="color: #666; font-size: 0.75em; font-weight: 600; text-transform: uppercase;">Revenue</div>
-                            <div style="color: #1a1a1a; font-weight: 700; font-size: 1em;">{revenue_str} {revenue_yoy_str}</div>
-                        </div>
-                        <div>
-                            <div style="color: #666; font-size: 0.75em; font-weight: 600; text-transform: uppercase;">Earnings</div>
-                            <div style="color: #1a1a1a; font-weight: 700; font-size: 1em;">{earnings_str} {earnings_yoy_str}</div>
-                        </div>
-                    </div>
-            """
+    card_html += """
+        </div>
+    """
 
-            if presentation_summary:
-                card_html += f"""
-                    <div style="background: white; padding: 12px; border-radius: 4px; border-left: 3px solid #FF4500; margin-top: 10px;">
-                        <div style="font-weight: 700; color: #0047FF; font-size: 0.75em; text-transform: uppercase; margin-bottom: 6px;">Management Presentation</div>
-                        <div style="color: #333; font-size: 0.88em; line-height: 1.5;">{presentation_summary}</div>
-                    </div>
-                """
+    return card_html
 
-            card_html += """
-                </div>
-            """
+def index_company_quarters(quarters):
+    """
+    Per-company lookups, built once per render: {year: {q: (quarter key, data)}}
+    and the investor relations URL
+    """
+    by_year = {}
+    ir_url = '#'
+    for quarter, data in quarters.items():
+        parsed = parse_quarter(quarter)
+        if parsed is None:
+            continue
+        year, q = parsed
+        by_year.setdefault(year, {})[q] = (quarter, data)
+        if ir_url == '#' and data and data.get('ir_url'):
+            ir_url = data['ir_url']
+    return by_year, ir_url
+
+def render_year_column(year, year_quarters, metrics, current=False, events=None):
+    """One year of quarter cards (Q1-Q4, placeholders for quarters without data)"""
+    events = events or {}
+    heading_class = "year-heading current" if current else "year-heading"
+    html = '<div class="year-column">'
+    html += f'<div class="{heading_class}">{year}</div>'
+    for q in range(1, 5):
+        quarter, data = year_quarters.get(q, (quarter_key(year, q), None))
+        html += generate_quarter_card(quarter, data, metrics.get(quarter), events.get(quarter))
+    html += '</div>'
+    return html
 
-            return card_html
+def render_company_card(ticker, company_data, company_index, years, sparkline='', metrics=None, earlier_years=(), events=None):
+    """
+    Generate the collapsible earnings card for one company
+    years: the years shown as columns (oldest first, the last one is current);
+    earlier_years: years left out of the page, loaded from data/ on request
+    sparkline: inline SVG for the header; metrics: {quarter: metrics} and
+    events: {quarter: post-earnings reaction} for the company
+    """
+    name = company_data.get('name', ticker)
+    by_year, ir_url = index_company_quarters(company_data.get('quarters', {}))
+    metrics = metrics or {}
 
-        # Column 1: 2024
-        html += '<div style="display: flex; flex-direction: column; gap: 15px;">'
-        html += '<div style="background: #0047FF; color: white; padding: 10px 15px; border-radius: 6px; font-weight: 700; text-align: center; font-size: 1.1em;">2024</div>'
-        for q in ['Q1 2024', 'Q2 2024', 'Q3 2024', 'Q4 2024']:
-            html += generate_quarter_card(q, quarters_2024.get(q))
-        html += '</div>'
+    # Build HTML for company (collapsible)
+    html = f"""
+    <div class="company-card" id="earnings-{ticker}">
+        <div class="company-header" onclick="toggleCompany('company-{company_index}')">
+            <svg class="collapse-arrow" id="arrow-{company_index}" viewBox="0 0 24 24" xmlns="http://www.w3.org/2000/svg">
+                <path d="M7.41 8.59L12 13.17l4.59-4.58L18 10l-6 6-6-6 1.41-1.41z"/>
+            </svg>
+            <span class="company-header-logo logo-{ticker}" role="img" aria-label="{name}"></span>
+            <h2>{name} ({ticker})</h2>
+            {sparkline}
+            <a href="{ir_url}" target="_blank" onclick="event.stopPropagation();" class="ir-link">Investor Relations →</a>
+        </div>
 
-        # Column 2: 2025
-        html += '<div style="display: flex; flex-direction: column; gap: 15px;">'
-        html += '<div style="background: #FF4500; color: white; padding: 10px 15px; border-radius: 6px; font-weight: 700; text-align: center; font-size: 1.1em;">2025</div>'
-        for q in ['Q1 2025', 'Q2 2025', 'Q3 2025', 'Q4 2025']:
-            html += generate_quarter_card(q, quarters_2025.get(q))
-        html += '</div>'
+        <div id="company-{company_index}" class="company-content">
+    """
 
-        html += """
-                </div>
+    if earlier_years:
+        year_range = f"{earlier_years[0]}–{earlier_years[-1]}" if len(earlier_years) > 1 else str(earlier_years[0])
+        html += f"""
+            <div class="earlier-years" data-ticker="{ticker}" data-years="{','.join(map(str, earlier_years))}">
+                <button class="earlier-years-button" onclick="showEarlierYears(this)">Show {year_range}</button>
             </div>
-        </div>
         """
 
+    html += '<div class="year-grid">'
+    for year in years:
+        html += render_year_column(year, by_year.get(year, {}), metrics, current=year == years[-1], events=events)
+
+    html += """
+            </div>
+        </div>
+    </div>
+    """
+
     return html
 
-def generate_html_dashboard():
-    """Generate an HTML dashboard from historical data"""
-    historical_data = load_historical_data()
+def iter_earnings_tracker_html(fragment_cache=None, sparklines=None, earnings_data=None, earlier_columns=None, events=None):
+    """
+    Yield the earnings tracker tab HTML one fragment at a time
+    The most recent EARNINGS_VISIBLE_YEARS years are rendered into the page.
+    When earlier_columns (a dict) is given, older years are collected there
+    as {year: {ticker: column html}} for the data/ archive instead;
+    without it every year is rendered inline.
+    events: {ticker: {quarter: reaction}} from event_study.earnings_events
+    """
+    if earnings_data is None:
+        earnings_data = load_earnings_data()
 
-    if not historical_data['records']:
-        print("No historical data found. Run analysis first.")
+    # Check if we have any earnings data
+    if not earnings_data.get('companies'):
+        yield """
+            <div style="padding: 40px; text-align: center; background: white; border-radius: 8px; margin: 20px 0;">
+                <h2 style="color: #0047FF; margin-bottom: 15px;">No Earnings Data Available</h2>
+                <p style="color: #555; margin-bottom: 20px;">Run <code>python earnings_tracker.py</code> to fetch earnings data.</p>
+            </div>
+        """
         return
 
-    # Sort records by date (newest first)
-    records = sorted(historical_data['records'], key=lambda x: x['date'], reverse=True)
+    # Add industry summary
+    yield generate_industry_summary(earnings_data)
 
-    # Get date range
-    oldest_date = records[-1]['date_display'] if records else 'N/A'
-    newest_date = records[0]['date_display'] if records else 'N/A'
+    # QoQ / TTM / margin figures, recomputed only for companies whose numbers changed
+    metrics, _ = company_metrics(earnings_data)
 
-    # Create company list
-    company_list = '<br>'.join([f"• {name} ({ticker})" for ticker, name in GAMING_COMPANIES.items()])
+    # Every year any company has data for, in order
+    all_years = sorted({year for year, _ in quarter_index(earnings_data)})
+    if earlier_columns is None:
+        years, earlier_years = all_years, []
+    else:
+        years, earlier_years = all_years[-EARNINGS_VISIBLE_YEARS:], all_years[:-EARNINGS_VISIBLE_YEARS]
 
-    # Generate HTML
-    html = f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Gaming Stock Tracker Dashboard</title>
-    <style>
-        @import url('https://fonts.googleapis.com/css2?family=Inter:wght@400;500;600;700&display=swap');
-
-        * {{
-            margin: 0;
-            padding: 0;
-            box-sizing: border-box;
-        }}
-
-        body {{
-            font-family: 'Inter', -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-            background: #0047FF;
-            padding: 0;
-            min-height: 100vh;
-        }}
-
-        .top-banner {{
-            background: #FF4500;
-            color: white;
-            padding: 8px 20px;
-            font-size: 0.85em;
-            font-weight: 500;
-            position: sticky;
-            top: 0;
-            z-index: 100;
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-        }}
-
-        .banner-logo {{
-            display: flex;
-            align-items: center;
-            gap: 8px;
-            font-weight: 700;
-            font-size: 1em;
-        }}
-
-        .banner-logo-icon {{
-            width: 18px;
-            height: 18px;
-            fill: white;
-        }}
-
-        .banner-center {{
-            flex: 1;
-            text-align: center;
-        }}
-
-        .container {{
-            max-width: 1400px;
-            margin: 0 auto;
-            padding: 20px 15px;
-        }}
-
-        .header {{
-            background: white;
-            padding: 20px 25px;
-            border-radius: 8px;
-            box-shadow: 0 2px 8px rgba(0,0,0,0.1);
-            margin-bottom: 15px;
-            display: grid;
-            grid-template-columns: 2fr 1fr 1fr;
-            gap: 25px;
-            align-items: start;
-        }}
-
-        .header-main {{
-            border-right: 2px solid #f0f0f0;
-            padding-right: 25px;
-        }}
-
-        h1 {{
-            color: #0047FF;
-            font-size: 1.8em;
-            margin-bottom: 6px;
-            font-weight: 700;
-            letter-spacing: -0.5px;
-        }}
-
-        .subtitle {{
-            color: #333;
-            font-size: 0.9em;
-            font-weight: 400;
-        }}
-
-        .header-section {{
-            padding-left: 10px;
-        }}
-
-        .header-section-title {{
-            color: #0047FF;
-            font-size: 0.75em;
-            font-weight: 700;
-            text-transform: uppercase;
-            letter-spacing: 0.5px;
-            margin-bottom: 8px;
-        }}
-
-        .header-section-content {{
-            color: #555;
-            font-size: 0.85em;
-            line-height: 1.6;
-        }}
-
-        .date-range {{
-            color: #777;
-            font-size: 0.8em;
-            margin-top: 4px;
-        }}
-
-
-        .day-card {{
-            background: white;
-            padding: 20px 25px;
-            border-radius: 8px;
-            box-shadow: 0 2px 8px rgba(0,0,0,0.08);
-            margin-bottom: 12px;
-        }}
-
-        .day-header {{
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            margin-bottom: 15px;
-            padding-bottom: 12px;
-            border-bottom: 2px solid #f0f0f0;
-            position: sticky;
-            top: 35px;
-            background: white;
-            z-index: 10;
-            margin-left: -25px;
-            margin-right: -25px;
-            margin-top: -20px;
-            padding: 15px 25px 12px 25px;
-            border-radius: 8px 8px 0 0;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.05);
-        }}
-
-        .day-title {{
-            font-size: 1.3em;
-            color: #0047FF;
-            font-weight: 700;
-        }}
-
-        .benchmark {{
-            font-size: 0.9em;
-            padding: 6px 14px;
-            border-radius: 20px;
-            font-weight: 600;
-            background: #f5f5f5;
-        }}
-
-        .benchmark.positive {{
-            background: #d4edda;
-            color: #155724;
-        }}
-
-        .benchmark.negative {{
-            background: #f8d7da;
-            color: #721c24;
-        }}
-
-        .material-changes {{
-            margin-top: 12px;
-        }}
-
-        .change-item {{
-            background: #f8f9fa;
-            padding: 15px 18px;
-            border-left: 4px solid #0047FF;
-            margin-bottom: 12px;
-            border-radius: 6px;
-            transition: all 0.2s ease;
-        }}
-
-        .change-item:hover {{
-            box-shadow: 0 2px 8px rgba(0,0,0,0.08);
-            transform: translateY(-1px);
-        }}
-
-        .change-item.positive {{
-            border-left-color: #28a745;
-            background: #f0fdf4;
-        }}
-
-        .change-item.negative {{
-            border-left-color: #dc3545;
-            background: #fef2f2;
-        }}
-
-        .company-name {{
-            font-size: 1.05em;
-            font-weight: 700;
-            margin-bottom: 6px;
-            color: #1a1a1a;
-            display: flex;
-            align-items: center;
-            gap: 10px;
-        }}
-
-        .company-logo {{
-            width: 24px;
-            height: 24px;
-            object-fit: contain;
-            border-radius: 4px;
-        }}
-
-        .data-row {{
-            display: flex;
-            align-items: center;
-            gap: 20px;
-            flex-wrap: wrap;
-        }}
-
-        .price-info {{
-            display: flex;
-            gap: 20px;
-            align-items: center;
-        }}
-
-        .price-item {{
-            display: flex;
-            gap: 6px;
-            align-items: baseline;
-        }}
-
-        .price-label {{
-            color: #666;
-            font-size: 0.75em;
-            font-weight: 600;
-            text-transform: uppercase;
-            letter-spacing: 0.5px;
-        }}
-
-        .price-value {{
-            font-weight: 700;
-            font-size: 0.95em;
-            color: #1a1a1a;
-        }}
-
-        .search-link {{
-            display: inline-block;
-            margin-top: 8px;
-            padding: 6px 14px;
-            background: #FF4500;
-            color: white;
-            text-decoration: none;
-            border-radius: 20px;
-            font-size: 0.8em;
-            font-weight: 600;
-            transition: all 0.2s ease;
-        }}
-
-        .search-link:hover {{
-            background: #e03e00;
-            transform: translateY(-1px);
-            box-shadow: 0 2px 6px rgba(255,69,0,0.3);
-        }}
-
-        .no-changes {{
-            color: #666;
-            font-style: italic;
-            padding: 15px;
-            text-align: center;
-            background: #f8f9fa;
-            border-radius: 6px;
-            font-size: 0.9em;
-        }}
-
-        .news-inline {{
-            display: flex;
-            align-items: center;
-            gap: 12px;
-            flex: 1;
-            min-width: 0;
-        }}
-
-        .news-text {{
-            color: #333;
-            font-size: 0.88em;
-            line-height: 1.4;
-            flex: 1;
-            min-width: 0;
-        }}
-
-        .news-button {{
-            display: inline-block;
-            padding: 5px 12px;
-            background: #1a1a2e;
-            color: white;
-            text-decoration: none;
-            border-radius: 20px;
-            font-size: 0.75em;
-            font-weight: 600;
-            transition: all 0.2s ease;
-            white-space: nowrap;
-            flex-shrink: 0;
-        }}
-
-        .news-button:hover {{
-            background: #0047FF;
-            box-shadow: 0 2px 6px rgba(0,71,255,0.3);
-        }}
-
-        .separator {{
-            color: #ccc;
-            margin: 0 4px;
-        }}
-
-        .tabs {{
-            display: flex;
-            gap: 0;
-            margin-bottom: 15px;
-            background: white;
-            border-radius: 8px;
-            padding: 5px;
-            box-shadow: 0 2px 8px rgba(0,0,0,0.08);
-            position: sticky;
-            top: 35px;
-            z-index: 50;
-        }}
-
-        .tab {{
-            flex: 1;
-            padding: 12px 20px;
-            background: transparent;
-            border: none;
-            color: #555;
-            font-weight: 600;
-            font-size: 0.95em;
-            cursor: pointer;
-            border-radius: 6px;
-            transition: all 0.2s ease;
-        }}
-
-        .tab:hover {{
-            background: #f5f5f5;
-            color: #0047FF;
-        }}
-
-        .tab.active {{
-            background: #0047FF;
-            color: white;
-        }}
-
-        .tab-content {{
-            display: none;
-        }}
-
-        .tab-content.active {{
-            display: block;
-        }}
-
-        .company-header:hover {{
-            background: #f8f9fa !important;
-        }}
-
-        .company-content {{
-            max-height: 5000px;
-            opacity: 1;
-            transition: max-height 0.4s ease, opacity 0.3s ease;
-        }}
-
-        .company-content.collapsed {{
-            max-height: 0;
-            opacity: 0;
-            padding: 0 25px !important;
-            overflow: hidden;
-        }}
-    </style>
-</head>
-<body>
-    <div class="top-banner">
-        <div class="banner-logo">
-            <svg class="banner-logo-icon" viewBox="0 0 24 24" xmlns="http://www.w3.org/2000/svg">
-                <path d="M12 2L4 5v6.09c0 5.05 3.41 9.76 8 10.91 4.59-1.15 8-5.86 8-10.91V5l-8-3z"/>
-            </svg>
-            <span>GeoComply</span>
-        </div>
-        <div class="banner-center">Gaming Stock Intelligence • Real-time tracking of material market movements</div>
-        <div style="width: 120px;"></div>
-    </div>
-    <div class="container">
-        <div class="header">
-            <div class="header-main">
-                <h1>Gaming Stock Tracker Dashboard</h1>
-                <p class="subtitle">Monitoring {len(GAMING_COMPANIES)} gaming companies for material changes (±{MATERIAL_CHANGE_THRESHOLD}%)</p>
-            </div>
-            <div class="header-section">
-                <div class="header-section-title">Trading Days</div>
-                <div class="header-section-content">
-                    <strong>{len(records)}</strong> days tracked
-                    <div class="date-range">{oldest_date} to {newest_date}</div>
-                </div>
-            </div>
-            <div class="header-section">
-                <div class="header-section-title">Companies Monitored</div>
-                <div class="header-section-content">{company_list}</div>
-            </div>
-        </div>
+    # Generate earnings cards for each company (cached per company's data)
+    company_index = 0
+    for ticker, company_data in earnings_data['companies'].items():
+        if not company_data.get('quarters'):
+            continue
 
-        <div style="background: #FF4500; color: white; padding: 12px 20px; border-radius: 8px; margin-bottom: 15px; box-shadow: 0 2px 8px rgba(255,69,0,0.2); font-size: 0.9em; line-height: 1.5;">
-            <strong>⚠️ Disclaimer:</strong> Data shown here is for informational purposes only and is not intended to be financial advice. Pursuant to the GeoComply <a href="https://drive.google.com/file/d/1AKZ-Bu2KGJGaApcUeE6reQXLA5lqARV3/edit" target="_blank" style="color: white; text-decoration: underline; font-weight: 600;">Restricted Trading List</a>, company employees and their families are prohibited from buying or selling gaming related securities.
-        </div>
+        company_index += 1
+        sparkline = (sparklines or {}).get(ticker, '')
+        company_metrics_data = metrics.get(ticker, {})
+        company_events = (events or {}).get(ticker, {})
+        render = lambda: render_company_card(
+            ticker, company_data, company_index, years, sparkline, company_metrics_data, earlier_years, company_events
+        )
+        if fragment_cache:
+            payload = [ticker, company_index, years, earlier_years, company_data, sparkline, company_metrics_data, company_events]
+            yield fragment_cache.get('company', payload, render)
+        else:
+            yield render()
+
+        if earlier_years:
+            by_year, _ = index_company_quarters(company_data['quarters'])
+            for year in earlier_years:
+                year_quarters = by_year.get(year, {})
+                render_year = lambda: render_year_column(year, year_quarters, company_metrics_data, events=company_events)
+                if fragment_cache:
+                    column = fragment_cache.get('year', [ticker, year, year_quarters, company_metrics_data, company_events], render_year)
+                else:
+                    column = render_year()
+                earlier_columns.setdefault(year, {})[ticker] = column
 
-        <div class="tabs">
-            <button class="tab active" onclick="switchTab('material-changes')">Material Changes</button>
-            <button class="tab" onclick="switchTab('earnings-tracker')">Earnings Tracker</button>
-        </div>
+def generate_earnings_tracker_html(fragment_cache=None, sparklines=None, earnings_data=None):
+    """Generate HTML for the earnings tracker tab"""
+    return ''.join(iter_earnings_tracker_html(fragment_cache, sparklines, earnings_data))
 
-        <div id="material-changes" class="tab-content active">
-"""
+def render_day_card(record):
+    """Generate the day card HTML for one history record"""
+    benchmark = record.get('benchmark', {})
+    bench_change = benchmark.get('pct_change', 0) if benchmark else 0
+    bench_class = 'positive' if bench_change > 0 else 'negative'
 
-    # Add each day's record
-    for record in records:
-        benchmark = record.get('benchmark', {})
-        bench_change = benchmark.get('pct_change', 0) if benchmark else 0
-        bench_class = 'positive' if bench_change > 0 else 'negative'
+    html = f"""
+    <div class="day-card" id="day-{record['date']}">
+        <div class="day-header">
+            <div class="day-title">{record['date_display']}</div>
+"""
 
+    if benchmark:
         html += f"""
-        <div class="day-card">
-            <div class="day-header">
-                <div class="day-title">{record['date_display']}</div>
+            <div class="benchmark {bench_class}">
+                NASDAQ: ${benchmark['current_price']:.2f} ({bench_change:+.2f}%)
+            </div>
 """
 
-        if benchmark:
-            html += f"""
-                <div class="benchmark {bench_class}">
-                    NASDAQ: ${benchmark['current_price']:.2f} ({bench_change:+.2f}%)
-                </div>
+    html += """
+        </div>
 """
 
+    if record['material_changes']:
         html += """
-            </div>
-"""
-
-        if record['material_changes']:
-            html += """
-            <div class="material-changes">
+        <div class="material-changes">
 """
-            for change in record['material_changes']:
-                data = change['data']
-                direction_class = 'positive' if data['pct_change'] > 0 else 'negative'
-                direction = 'UP' if data['pct_change'] > 0 else 'DOWN'
+        for change in record['material_changes']:
+            data = change['data']
+            direction_class = 'positive' if data['pct_change'] > 0 else 'negative'
+            direction = 'UP' if data['pct_change'] > 0 else 'DOWN'
 
-                # Add news summary and search link
-                import urllib.parse
-                news = change.get('news', {})
-                search_query = news.get('search_query') or change.get('search_query', '')
-                summary = news.get('summary', '')
-                search_url = f"https://www.google.com/search?q={urllib.parse.quote(search_query)}"
+            # Add news summary and search link
+            news = change.get('news', {})
+            search_query = news.get('search_query') or change.get('search_query', '')
+            summary = news.get('summary', '')
+            search_url = f"https://www.google.com/search?q={urllib.parse.quote(search_query)}"
 
-                ticker = change['ticker']
-                logo_url = COMPANY_LOGOS.get(ticker, '')
+            ticker = change['ticker']
 
-                html += f"""
-                <div class="change-item {direction_class}">
-                    <div class="company-name">
-                        <img src="{logo_url}" alt="{change['name']}" class="company-logo" onerror="this.style.display='none'">
-                        <span>{change['name']} ({ticker})</span>
-                    </div>
-                    <div class="data-row">
-                        <div class="price-info">
-                            <div class="price-item">
-                                <span class="price-label">Open:</span>
-                                <span class="price-value">${data['open_price']:.2f}</span>
-                            </div>
-                            <div class="price-item">
-                                <span class="price-label">Close:</span>
-                                <span class="price-value">${data['current_price']:.2f}</span>
-                            </div>
-                            <div class="price-item">
-                                <span class="price-label">Change:</span>
-                                <span class="price-value">{data['pct_change']:+.2f}% {direction}</span>
-                            </div>
+            html += f"""
+            <div class="change-item {direction_class}">
+                <div class="company-name">
+                    <span class="company-logo logo-{ticker}" role="img" aria-label="{change['name']}"></span>
+                    <span>{change['name']} ({ticker})</span>
+                </div>
+                <div class="data-row">
+                    <div class="price-info">
+                        <div class="price-item">
+                            <span class="price-label">Open:</span>
+                            <span class="price-value">${data['open_price']:.2f}</span>
                         </div>
-"""
-
-                if summary:
-                    html += f"""
-                        <span class="separator">•</span>
-                        <div class="news-inline">
-                            <div class="news-text">{summary}</div>
-                            <a href="{search_url}" target="_blank" class="news-button">Find News →</a>
+                        <div class="price-item">
+                            <span class="price-label">Close:</span>
+                            <span class="price-value">${data['current_price']:.2f}</span>
                         </div>
-"""
-                else:
-                    html += f"""
-                        <a href="{search_url}" target="_blank" class="search-link">Search News →</a>
+                        <div class="price-item">
+                            <span class="price-label">Change:</span>
+                            <span class="price-value">{data['pct_change']:+.2f}% {direction}</span>
+                        </div>
+                    </div>
 """
 
-                html += """
+            if summary:
+                html += f"""
+                    <span class="separator">•</span>
+                    <div class="news-inline">
+                        <div class="news-text">{summary}</div>
+                        <a href="{search_url}" target="_blank" class="news-button">Find News →</a>
                     </div>
-                </div>
+"""
+            else:
+                html += f"""
+                    <a href="{search_url}" target="_blank" class="search-link">Search News →</a>
 """
 
             html += """
+                </div>
             </div>
 """
-        else:
-            html += """
-            <div class="no-changes">No material changes detected on this day</div>
-"""
 
         html += """
         </div>
 """
+    else:
+        html += """
+        <div class="no-changes">No material changes detected on this day</div>
+"""
 
     html += """
-        </div>
+    </div>
+"""
 
-        <div id="earnings-tracker" class="tab-content">
+    return html
+
+def generate_html_dashboard(historical_data=None, earnings_data=None):
+    """
+    Generate an HTML dashboard from historical data
+    Datasets already loaded by the caller (e.g. a PipelineContext) are used
+    as-is; missing ones are read from disk
     """
+    if historical_data is None:
+        historical_data = load_historical_data()
+    if earnings_data is None:
+        earnings_data = load_earnings_data()
 
-    # Add earnings tracker content
-    html += generate_earnings_tracker_html()
+    if not historical_data['records']:
+        print("No historical data found. Run analysis first.")
+        return
 
-    html += """
-        </div>
-    </div>
+    # Sort records by date (newest first)
+    records = sorted(historical_data['records'], key=lambda x: x['date'], reverse=True)
 
-    <script>
-        function switchTab(tabId) {{
-            // Hide all tabs
-            document.querySelectorAll('.tab-content').forEach(tab => {{
-                tab.classList.remove('active');
-            }});
-            document.querySelectorAll('.tab').forEach(tab => {{
-                tab.classList.remove('active');
-            }});
-
-            // Show selected tab
-            document.getElementById(tabId).classList.add('active');
-            event.target.classList.add('active');
-        }}
-
-        function toggleCompany(companyId) {{
-            const content = document.getElementById(companyId);
-            const arrowId = companyId.replace('company-', 'arrow-');
-            const arrow = document.getElementById(arrowId);
-
-            if (content.classList.contains('collapsed')) {{
-                content.classList.remove('collapsed');
-                arrow.style.transform = 'rotate(0deg)';
-            }} else {{
-                content.classList.add('collapsed');
-                arrow.style.transform = 'rotate(-90deg)';
-            }}
-        }}
-    </script>
-</body>
-</html>
-"""
+    # Rendered day/company fragments are reused until their data or this renderer changes
+    fragment_cache = FragmentCache(version=file_digest(__file__, dashboard_template.__file__))
+
+    # Get date range
+    oldest_date = records[-1]['date_display'] if records else 'N/A'
+    newest_date = records[0]['date_display'] if records else 'N/A'
 
-    # Write HTML file
-    with open(DASHBOARD_FILE, 'w', encoding='utf-8') as f:
-        f.write(html)
+    # Create company list
+    company_list = '<br>'.join([f"• {name} ({ticker})" for ticker, name in GAMING_COMPANIES.items()])
 
-    print(f"\n[OK] Dashboard generated: {DASHBOARD_FILE}")
+    # Header stats (the rest of the page chrome is static, see dashboard_template)
+    page_header = render_header(
+        len(GAMING_COMPANIES),
+        MATERIAL_CHANGE_THRESHOLD,
+        len(records),
+        oldest_date,
+        newest_date,
+        company_list
+    )
+
+    # Logos are inlined into one cached stylesheet, no hotlinked images at view time
+    logo_stylesheet = build_logo_css(COMPANY_LOGOS)
+
+    # Downsampled price / relative-to-NASDAQ lines for the company headers
+    sparklines, sparkline_stats = build_sparklines(records[::-1], GAMING_COMPANIES)
+
+    # Each report's reaction vs NASDAQ, for the quarter cards
+    events = earnings_events(earnings_data, records)
+
+    # Stream fragments straight to disk instead of building the page in memory;
+    # the temp file is swapped in once complete
+    tmp_file = DASHBOARD_FILE + '.tmp'
+    with open(tmp_file, 'w', encoding='utf-8', buffering=DASHBOARD_WRITE_BUFFER) as f:
+        f.write(PAGE_HEAD)
+        f.write(render_stylesheet_link(logo_stylesheet))
+        f.write(BODY_OPEN)
+        f.write(page_header)
+        f.write(TABS_HTML)
+
+        # Embed the most recent days (cached per record content); the rest are
+        # rendered client-side from the month shards as the page is scrolled
+        for record in records[:DASHBOARD_EMBEDDED_DAYS]:
+            f.write(fragment_cache.get('day', record, lambda: render_day_card(record)))
+        if len(records) > DASHBOARD_EMBEDDED_DAYS:
+            f.write(render_day_loader(records[DASHBOARD_EMBEDDED_DAYS - 1]['date']))
+
+        f.write(EARNINGS_TAB_OPEN)
+
+        # Add earnings tracker content (earlier years go to the data/ archive)
+        earlier_columns = {}
+        for fragment in iter_earnings_tracker_html(fragment_cache, sparklines, earnings_data, earlier_columns, events):
+            f.write(fragment)
+
+        f.write(PAGE_FOOTER)
+
+    os.replace(tmp_file, DASHBOARD_FILE)
+
+    fragment_cache.prune()
+    shards_written, shards_unchanged = write_day_shards(records)
+    write_earnings_archive(earlier_columns)
+
+    print(f"\n[OK] Dashboard generated: {DASHBOARD_FILE} ({fragment_cache.misses} fragments rendered, {fragment_cache.hits} cached)")
+    print(f"[OK] Day data: {shards_written} month shards written, {shards_unchanged} unchanged")
+
+    doc_count, term_count, _ = write_search_index(records, earnings_data)
+    print(f"[OK] Search index: {doc_count} summaries, {term_count} terms")
+    print(f"[OK] Sparklines: {sparkline_stats['reduced']} months downsampled, {sparkline_stats['cached']} cached")
+
+    # Minified, precompressed copy of the served files for deployment
+    build_site(DASHBOARD_FILE)
     return DASHBOARD_FILE
 
 def main():
@@ -1043,7 +836,7 @@ def main():
             print("Added new record")
 
         save_historical_data(historical_data)
-        generate_html_dashboard()
+        generate_html_dashboard(historical_data)
 
     elif choice == '2':
         # Run historical analysis
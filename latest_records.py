@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Latest-records pointer for the stock history
+Whenever the history is saved, the newest LATEST_RECORDS_KEPT day records
+are also written to a small sidecar file (stock_tracker_history.latest.json),
+stamped with the size and modification time of the history file they were
+taken from. Consumers that only need the latest days (Slack notifications,
+status checks) read the sidecar instead of parsing and sorting the whole
+history, so they take the same time however long the archive gets.
+
+If the history was written by something else since (the stamp no longer
+matches) or more records are asked for than are kept, the full file is read
+once and the sidecar rebuilt.
+"""
+
+import heapq
+import json
+import os
+
+HISTORY_FILE = 'stock_tracker_history.json'
+LATEST_RECORDS_KEPT = 10
+
+
+def latest_file_for(data_file):
+    """stock_tracker_history.json -> stock_tracker_history.latest.json"""
+    return os.path.splitext(data_file)[0] + '.latest.json'
+
+
+def file_stamp(path):
+    stat = os.stat(path)
+    return [stat.st_size, stat.st_mtime_ns]
+
+
+def newest_records(records, n):
+    """The n most recent records, newest first (a partial selection, not a full sort)"""
+    return heapq.nlargest(n, records, key=lambda r: r['date'])
+
+
+def write_latest_records(data, data_file=HISTORY_FILE):
+    """Refresh the sidecar from history data just written to data_file"""
+    records = data.get('records', [])
+    pointer = {
+        'history': file_stamp(data_file),
+        'total': len(records),
+        'records': newest_records(records, LATEST_RECORDS_KEPT)
+    }
+    path = latest_file_for(data_file)
+    tmp_file = path + '.tmp'
+    with open(tmp_file, 'w') as f:
+        json.dump(pointer, f)
+    os.replace(tmp_file, path)
+    return pointer
+
+
+def _load_pointer(data_file):
+    path = latest_file_for(data_file)
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path, 'r') as f:
+            pointer = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return pointer if pointer.get('history') == file_stamp(data_file) else None
+
+
+def load_latest_records(n=1, data_file=HISTORY_FILE):
+    """The n most recent day records, newest first ([] if there is no history)"""
+    if not os.path.exists(data_file):
+        return []
+
+    pointer = _load_pointer(data_file)
+    if pointer is not None and (n <= len(pointer['records']) or len(pointer['records']) == pointer['total']):
+        return pointer['records'][:n]
+
+    # Stale or missing pointer: read the full history once and rebuild it
+    with open(data_file, 'r') as f:
+        data = json.load(f)
+    pointer = write_latest_records(data, data_file)
+    if n <= len(pointer['records']):
+        return pointer['records'][:n]
+    return newest_records(data.get('records', []), n)
+
+
+def load_latest_record(data_file=HISTORY_FILE):
+    """The most recent day record, or None"""
+    records = load_latest_records(1, data_file)
+    return records[0] if records else None
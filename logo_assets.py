@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""
+Company logo assets
+Builds one content-hashed stylesheet with every company logo inlined as a
+data URI, so the dashboard makes no third-party image requests at view time.
+
+Logos are read from assets/logos/<TICKER>.<ext>. Missing ones are fetched
+once from COMPANY_LOGOS and saved there (unless LOGO_FETCH=0); when that
+fails (offline, logo service down, not an image) a monogram SVG is used instead
+and the failure is remembered in assets/logos/fetch_failures.json, so the fetch
+is only retried after FETCH_RETRY_HOURS. Raster logos are downsized
+to LOGO_PIXELS when Pillow is installed.
+
+Usage:
+  python logo_assets.py            # Fetch missing logos and rebuild the stylesheet
+"""
+
+import base64
+import hashlib
+import io
+import json
+import os
+from datetime import datetime, timedelta
+
+import requests
+
+# Optional: logos are embedded at their original size without Pillow
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+LOGO_DIR = os.path.join('assets', 'logos')
+ASSET_DIR = 'assets'
+LOGO_PIXELS = 64  # 2x the largest display size (32px earnings header)
+FETCH_TIMEOUT = 10
+FETCH_RETRY_HOURS = 24  # Wait this long before fetching a logo that failed again
+FAILURES_FILE = 'fetch_failures.json'  # {ticker: retry-after ISO time}, kept in the logo dir
+LOGO_FETCH = os.environ.get('LOGO_FETCH', '1') != '0'  # Set LOGO_FETCH=0 to only use local logos
+
+MIME_TYPES = {
+    '.png': 'image/png',
+    '.jpg': 'image/jpeg',
+    '.jpeg': 'image/jpeg',
+    '.gif': 'image/gif',
+    '.webp': 'image/webp',
+    '.svg': 'image/svg+xml'
+}
+
+MONOGRAM_SVG = (
+    '<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 64 64">'
+    '<rect width="64" height="64" rx="8" fill="#0047FF"/>'
+    '<text x="32" y="41" font-family="Arial,sans-serif" font-size="{size}" font-weight="700" '
+    'fill="white" text-anchor="middle">{text}</text></svg>'
+)
+
+LOGO_BASE_CSS = (
+    '.company-logo,.company-header-logo{display:inline-block;flex-shrink:0;'
+    'background:center/contain no-repeat}\n'
+)
+
+
+def find_local_logo(ticker, logo_dir=LOGO_DIR):
+    """Path of the stored logo for ticker, or None"""
+    for ext in MIME_TYPES:
+        path = os.path.join(logo_dir, ticker + ext)
+        if os.path.exists(path):
+            return path
+    return None
+
+
+def load_fetch_failures(logo_dir=LOGO_DIR):
+    """{ticker: retry-after ISO time} for logos whose last fetch failed"""
+    path = os.path.join(logo_dir, FAILURES_FILE)
+    if not os.path.exists(path):
+        return {}
+    try:
+        with open(path, 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_fetch_failures(failures, logo_dir=LOGO_DIR):
+    """Save fetch failures atomically (the file is removed once there are none)"""
+    path = os.path.join(logo_dir, FAILURES_FILE)
+    if not failures:
+        if os.path.exists(path):
+            os.remove(path)
+        return
+    os.makedirs(logo_dir, exist_ok=True)
+    tmp_file = path + '.tmp'
+    with open(tmp_file, 'w') as f:
+        json.dump(failures, f, indent=2, sort_keys=True)
+    os.replace(tmp_file, path)
+
+
+def is_image(payload, mime):
+    """Check downloaded bytes really are the image type they claim to be"""
+    if mime == 'image/svg+xml':
+        return b'<svg' in payload[:1024].lower()
+    if Image is None:
+        return True
+    try:
+        with Image.open(io.BytesIO(payload)) as image:
+            image.verify()
+    except Exception:
+        return False
+    return True
+
+
+def fetch_logo(ticker, url, logo_dir=LOGO_DIR):
+    """Download a logo once into logo_dir, returns its path or None on failure"""
+    try:
+        response = requests.get(url, timeout=FETCH_TIMEOUT)
+        response.raise_for_status()
+    except requests.RequestException as e:
+        print(f"  [WARN] {ticker} logo fetch failed ({e.__class__.__name__}), using monogram")
+        return None
+
+    # Error pages and redirects to HTML come back as 200s too
+    content_type = response.headers.get('Content-Type', '').split(';')[0].strip().lower()
+    ext = next((ext for ext, mime in MIME_TYPES.items() if mime == content_type), None)
+    if ext is None or not is_image(response.content, content_type):
+        print(f"  [WARN] {ticker} logo fetch returned {content_type or 'no content type'}, not an image, using monogram")
+        return None
+
+    os.makedirs(logo_dir, exist_ok=True)
+    path = os.path.join(logo_dir, ticker + ext)
+    with open(path, 'wb') as f:
+        f.write(response.content)
+    print(f"  [OK] Saved {ticker} logo to {path}")
+    return path
+
+
+def monogram(ticker):
+    """Fallback logo: the ticker on a brand-coloured tile"""
+    size = 26 if len(ticker) <= 3 else 20
+    return 'image/svg+xml', MONOGRAM_SVG.format(size=size, text=ticker).encode('utf-8')
+
+
+def load_logo(path):
+    """Read a logo file as (mime type, bytes), downsized when Pillow is available"""
+    ext = os.path.splitext(path)[1].lower()
+    with open(path, 'rb') as f:
+        payload = f.read()
+
+    if Image is None or ext == '.svg':
+        return MIME_TYPES[ext], payload
+
+    with Image.open(io.BytesIO(payload)) as image:
+        if max(image.size) <= LOGO_PIXELS and ext == '.png':
+            return 'image/png', payload
+        image = image.convert('RGBA')
+        image.thumbnail((LOGO_PIXELS, LOGO_PIXELS), Image.LANCZOS)
+        out = io.BytesIO()
+        image.save(out, format='PNG', optimize=True)
+    return 'image/png', out.getvalue()
+
+
+def build_logo_css(logo_urls, asset_dir=ASSET_DIR, logo_dir=LOGO_DIR, fetch=None):
+    """
+    Write assets/logos.<hash>.css (one .logo-<TICKER> rule per company) and
+    remove older builds, returns the stylesheet path relative to the page
+    """
+    if fetch is None:
+        fetch = LOGO_FETCH
+
+    now = datetime.now()
+    failures = load_fetch_failures(logo_dir)
+    failures_before = dict(failures)
+
+    rules = [LOGO_BASE_CSS]
+    for ticker, url in logo_urls.items():
+        path = find_local_logo(ticker, logo_dir)
+        if path is None and fetch and url:
+            retry_after = failures.get(ticker)
+            if retry_after and datetime.fromisoformat(retry_after) > now:
+                print(f"  [SKIP] {ticker} logo fetch failed recently, retrying after {retry_after}")
+            else:
+                path = fetch_logo(ticker, url, logo_dir)
+                if path is None:
+                    failures[ticker] = (now + timedelta(hours=FETCH_RETRY_HOURS)).isoformat(timespec='seconds')
+                else:
+                    failures.pop(ticker, None)
+
+        mime, payload = monogram(ticker)
+        if path:
+            try:
+                mime, payload = load_logo(path)
+            except (OSError, ValueError) as e:
+                print(f"  [WARN] {ticker} logo {path} unreadable ({e.__class__.__name__}), using monogram")
+        data_uri = f"data:{mime};base64,{base64.b64encode(payload).decode('ascii')}"
+        rules.append(f'.logo-{ticker}{{background-image:url("{data_uri}")}}\n')
+
+    if failures != failures_before:
+        save_fetch_failures(failures, logo_dir)
+
+    css = ''.join(rules)
+    digest = hashlib.sha1(css.encode('utf-8')).hexdigest()[:10]
+    name = f"logos.{digest}.css"
+    path = os.path.join(asset_dir, name)
+
+    os.makedirs(asset_dir, exist_ok=True)
+    if not os.path.exists(path):
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(css)
+
+    # Only the current hash is referenced by the page
+    for old in os.listdir(asset_dir):
+        if old.startswith('logos.') and old.endswith('.css') and old != name:
+            os.remove(os.path.join(asset_dir, old))
+
+    return f"{asset_dir}/{name}"
+
+
+if __name__ == '__main__':
+    from gaming_stock_tracker_v3 import COMPANY_LOGOS
+    print(f"[OK] Logo stylesheet: {build_logo_css(COMPANY_LOGOS)}")
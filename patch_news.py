@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Bulk news patch command
+Applies narrative edits to stock_tracker_history.json from a JSONL or CSV
+patch file in one indexed pass and one write.
+
+Each patch is keyed by (date, ticker) and may set:
+  summary              - new narrative (required)
+  needs_manual_lookup  - defaults to false
+  search_query         - optional replacement search query
+
+JSONL: {"date": "2025-11-21", "ticker": "MGM", "summary": "MGM Resorts jumped..."}
+CSV:   date,ticker,summary[,needs_manual_lookup,search_query]
+
+Usage:
+  python patch_news.py PATCH_FILE [PATCH_FILE ...] [--dry-run]
+"""
+
+import argparse
+import csv
+import difflib
+import json
+import sys
+
+from gaming_stock_tracker_v3 import (
+    load_historical_data,
+    save_historical_data,
+    index_material_changes
+)
+
+
+def _parse_bool(value):
+    if isinstance(value, bool):
+        return value
+    return str(value).strip().lower() in ('1', 'true', 'yes', 'y')
+
+
+def read_patches(path):
+    """Stream patch dicts from a JSONL or CSV file, one at a time"""
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        if path.lower().endswith('.csv'):
+            for row in csv.DictReader(f):
+                yield row
+        else:
+            for line_num, line in enumerate(f, 1):
+                line = line.strip()
+                if not line or line.startswith('#'):
+                    continue
+                try:
+                    yield json.loads(line)
+                except ValueError as e:
+                    print(f"WARNING: {path}:{line_num} is not valid JSON ({e}), skipping")
+
+
+def patch_problem(patch):
+    """Why a patch can't be applied as written (None if it's well formed)"""
+    summary = patch.get('summary')
+    if not isinstance(summary, str):
+        return f"summary must be a string, got {type(summary).__name__}"
+    if not summary.strip():
+        return "summary is empty"
+    search_query = patch.get('search_query')
+    if search_query is not None and not isinstance(search_query, str):
+        return f"search_query must be a string, got {type(search_query).__name__}"
+    return None
+
+
+def apply_patches(data, patches, dry_run=False):
+    """
+    Apply patches to history data in place through a (date, ticker) index
+    (nothing is modified with dry_run)
+    Returns (changed, unchanged, unmatched, invalid) where unmatched is a list
+    of keys and invalid a list of (date, ticker, problem)
+    """
+    index = index_material_changes(data)
+    changed = 0
+    unchanged = 0
+    unmatched = []
+    invalid = []
+
+    for patch in patches:
+        date = str(patch.get('date') or '').strip()
+        ticker = str(patch.get('ticker') or '').strip().upper()
+
+        problem = patch_problem(patch)
+        if problem:
+            invalid.append((date, ticker, problem))
+            continue
+
+        change = index.get((date, ticker))
+        if change is None:
+            unmatched.append((date, ticker))
+            continue
+
+        news = change.get('news') or {}
+        updated = dict(news)
+        updated['summary'] = patch['summary'].strip()
+        updated['needs_manual_lookup'] = _parse_bool(patch.get('needs_manual_lookup') or False)
+        if patch.get('search_query'):
+            updated['search_query'] = patch['search_query'].strip()
+
+        if updated == news:
+            unchanged += 1
+            continue
+
+        changed += 1
+        if dry_run:
+            print(f"--- {date} {ticker}")
+            diff = difflib.unified_diff(
+                [f"{k}: {v}" for k, v in sorted(news.items())],
+                [f"{k}: {v}" for k, v in sorted(updated.items())],
+                lineterm='', n=0
+            )
+            for line in list(diff)[2:]:
+                print(f"  {line}")
+        else:
+            change['news'] = updated
+
+    return changed, unchanged, unmatched, invalid
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Apply bulk news narrative patches to the history')
+    parser.add_argument('patch_files', nargs='+', help='JSONL or CSV patch files')
+    parser.add_argument('--dry-run', action='store_true', help='Show diffs without writing the history')
+    args = parser.parse_args()
+
+    data = load_historical_data()
+
+    def all_patches():
+        for path in args.patch_files:
+            yield from read_patches(path)
+
+    changed, unchanged, unmatched, invalid = apply_patches(data, all_patches(), dry_run=args.dry_run)
+
+    if changed and not args.dry_run:
+        save_historical_data(data)
+
+    verb = "Would update" if args.dry_run else "Updated"
+    print(f"[OK] {verb} {changed} news summaries ({unchanged} already up to date)")
+
+    if unmatched:
+        print(f"[WARN] {len(unmatched)} patches did not match a material change:")
+        for date, ticker in unmatched:
+            print(f"  - {date} {ticker}")
+    if invalid:
+        print(f"[WARN] {len(invalid)} patches were invalid and skipped:")
+        for date, ticker, problem in invalid:
+            print(f"  - {date} {ticker}: {problem}")
+    if unmatched or invalid:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
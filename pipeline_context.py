@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Pipeline context
+Holds the datasets a run works on (stock history, earnings data), loading
+each from disk at most once and writing back only the ones a stage marked
+dirty. Stages share the in-memory models instead of re-reading the JSON
+files: fetch/research update the history, save() persists what changed,
+and the dashboard renders from the same objects.
+"""
+
+from gaming_stock_tracker_v3 import (
+    load_historical_data,
+    save_historical_data,
+    load_earnings_data,
+    generate_html_dashboard
+)
+from earnings_tracker import save_earnings_data
+
+HISTORY = 'history'
+EARNINGS = 'earnings'
+
+
+class PipelineContext:
+    """Lazily loaded, dirty-tracked datasets for one pipeline run"""
+
+    def __init__(self):
+        self._history = None
+        self._earnings = None
+        self.dirty = set()
+
+    @property
+    def history(self):
+        if self._history is None:
+            self._history = load_historical_data()
+        return self._history
+
+    @property
+    def earnings(self):
+        if self._earnings is None:
+            self._earnings = load_earnings_data()
+        return self._earnings
+
+    def mark_dirty(self, dataset):
+        """Flag a dataset (HISTORY or EARNINGS) as modified in memory"""
+        self.dirty.add(dataset)
+
+    def upsert_record(self, record):
+        """
+        Add a day record to the history, replacing any record for the same date
+        Returns 'added', 'replaced' or 'unchanged' (identical record already stored)
+        """
+        records = self.history['records']
+        for i, existing in enumerate(records):
+            if existing['date'] == record['date']:
+                if existing == record:
+                    return 'unchanged'
+                records[i] = record
+                self.mark_dirty(HISTORY)
+                return 'replaced'
+
+        records.append(record)
+        self.mark_dirty(HISTORY)
+        return 'added'
+
+    def save(self):
+        """Write every dirty dataset once, returns the names written"""
+        written = []
+        if HISTORY in self.dirty:
+            save_historical_data(self.history)
+            written.append(HISTORY)
+        if EARNINGS in self.dirty:
+            save_earnings_data(self.earnings)
+            written.append(EARNINGS)
+        self.dirty.clear()
+        return written
+
+    def render_dashboard(self):
+        """Regenerate the dashboard from the in-memory datasets"""
+        return generate_html_dashboard(self.history, self.earnings)
@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+Quarter index and earnings metrics
+Quarter keys ("Q3 2025") are parsed once into (year, q) integer tuples so
+they sort and compare chronologically; string comparison would put
+"Q4 2024" after "Q3 2025".
+
+Metrics (YoY, QoQ, trailing-twelve-month totals and net margin) are computed
+for many companies at once over a companies x quarters array whose columns
+are consecutive quarters, so YoY is a shift by 4 columns, QoQ by 1 and TTM a
+sum of four shifted copies. Results are cached per company under a digest of
+its revenue/earnings figures; only companies whose figures changed are
+recomputed.
+"""
+
+import hashlib
+import json
+import os
+import re
+
+import numpy as np
+
+from fragment_cache import FRAGMENT_CACHE_DIR
+
+QUARTER_METRICS_CACHE_FILE = os.path.join(FRAGMENT_CACHE_DIR, 'quarter_metrics.json')
+QUARTER_KEY = re.compile(r'^Q([1-4]) (\d{4})$')
+
+METRIC_FIELDS = (
+    'revenue_yoy',
+    'earnings_yoy',
+    'revenue_qoq',
+    'earnings_qoq',
+    'revenue_ttm',
+    'earnings_ttm',
+    'net_margin'
+)
+
+
+def parse_quarter(key):
+    """'Q3 2025' -> (2025, 3), or None for keys that aren't quarters"""
+    match = QUARTER_KEY.match(key)
+    if not match:
+        return None
+    return int(match.group(2)), int(match.group(1))
+
+
+def quarter_key(year, q):
+    return f"Q{q} {year}"
+
+
+def quarter_ordinal(year, q):
+    """Consecutive integer per quarter, so adjacent quarters differ by 1"""
+    return year * 4 + q - 1
+
+
+def quarter_index(earnings_data, predicate=None):
+    """
+    Sorted (year, q) tuples of every quarter any company has, oldest first
+    predicate(data) restricts the index to quarters whose data matches
+    """
+    quarters = set()
+    for company in earnings_data.get('companies', {}).values():
+        for key, data in company.get('quarters', {}).items():
+            parsed = parse_quarter(key)
+            if parsed and (predicate is None or (data and predicate(data))):
+                quarters.add(parsed)
+    return sorted(quarters)
+
+
+def latest_quarter(earnings_data, predicate=None):
+    """Most recent quarter key matching predicate, or None"""
+    index = quarter_index(earnings_data, predicate)
+    return quarter_key(*index[-1]) if index else None
+
+
+def build_arrays(companies, fields=('revenue', 'earnings')):
+    """
+    Quarter figures as {field: [companies x quarters] float array} (NaN = missing)
+    companies is a list of quarters dicts; columns span the oldest to the newest
+    quarter present, with no gaps. Returns (column (year, q) tuples, arrays)
+    """
+    parsed = [
+        [(parse_quarter(key), data) for key, data in quarters.items() if data and parse_quarter(key)]
+        for quarters in companies
+    ]
+    ordinals = [quarter_ordinal(*quarter) for rows in parsed for quarter, _ in rows]
+    if not ordinals:
+        return [], {field: np.empty((len(companies), 0)) for field in fields}
+
+    first = min(ordinals)
+    width = max(ordinals) - first + 1
+    columns = [(ordinal // 4, ordinal % 4 + 1) for ordinal in range(first, first + width)]
+
+    arrays = {field: np.full((len(companies), width), np.nan) for field in fields}
+    for row, rows in enumerate(parsed):
+        for quarter, data in rows:
+            col = quarter_ordinal(*quarter) - first
+            for field in fields:
+                if data.get(field) is not None:
+                    arrays[field][row, col] = data[field]
+
+    return columns, arrays
+
+
+def shift_quarters(values, lag):
+    """Shift columns right by lag quarters, NaN-filled"""
+    shifted = np.full_like(values, np.nan)
+    if lag < values.shape[1]:
+        shifted[:, lag:] = values[:, :values.shape[1] - lag]
+    return shifted
+
+
+def _pct_change(values, lag):
+    previous = shift_quarters(values, lag)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        change = (values - previous) / previous * 100
+    # Zero figures are treated as missing, as the per-quarter YoY always did
+    change[(values == 0) | (previous == 0)] = np.nan
+    return change
+
+
+def compute_metrics(revenue, earnings):
+    """All metrics as arrays shaped like the inputs (NaN where undefined)"""
+    revenue_ttm = revenue + shift_quarters(revenue, 1) + shift_quarters(revenue, 2) + shift_quarters(revenue, 3)
+    earnings_ttm = earnings + shift_quarters(earnings, 1) + shift_quarters(earnings, 2) + shift_quarters(earnings, 3)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        net_margin = np.where(revenue != 0, earnings / revenue * 100, np.nan)
+
+    return {
+        'revenue_yoy': _pct_change(revenue, 4),
+        'earnings_yoy': _pct_change(earnings, 4),
+        'revenue_qoq': _pct_change(revenue, 1),
+        'earnings_qoq': _pct_change(earnings, 1),
+        'revenue_ttm': revenue_ttm,
+        'earnings_ttm': earnings_ttm,
+        'net_margin': net_margin
+    }
+
+
+def _value(x, field):
+    if np.isnan(x):
+        return None
+    # Percentages are shown to one decimal; TTM totals stay in dollars
+    return float(x) if field.endswith('_ttm') else round(float(x), 1)
+
+
+def metrics_by_quarter(companies):
+    """Compute metrics for a list of quarters dicts in one pass, returns a list of {quarter: {field: value}}"""
+    columns, figures = build_arrays(companies)
+    arrays = compute_metrics(figures['revenue'], figures['earnings'])
+
+    results = []
+    for row, quarters in enumerate(companies):
+        present = {parse_quarter(key): key for key, data in quarters.items() if data and parse_quarter(key)}
+        company = {}
+        for col, quarter in enumerate(columns):
+            if quarter in present:
+                company[present[quarter]] = {field: _value(arrays[field][row, col], field) for field in METRIC_FIELDS}
+        results.append(company)
+    return results
+
+
+def figures_digest(quarters):
+    """Digest of the figures metrics depend on (summaries and URLs don't matter)"""
+    figures = sorted(
+        (key, data.get('revenue'), data.get('earnings'))
+        for key, data in quarters.items() if data
+    )
+    return hashlib.sha1(json.dumps(figures).encode('utf-8')).hexdigest()
+
+
+def load_metrics_cache():
+    if os.path.exists(QUARTER_METRICS_CACHE_FILE):
+        with open(QUARTER_METRICS_CACHE_FILE, 'r') as f:
+            return json.load(f)
+    return {}
+
+
+def save_metrics_cache(cache):
+    os.makedirs(os.path.dirname(QUARTER_METRICS_CACHE_FILE), exist_ok=True)
+    tmp_file = QUARTER_METRICS_CACHE_FILE + '.tmp'
+    with open(tmp_file, 'w') as f:
+        json.dump(cache, f, separators=(',', ':'))
+    os.replace(tmp_file, QUARTER_METRICS_CACHE_FILE)
+
+
+def company_metrics(earnings_data):
+    """
+    Return ({ticker: {quarter: {field: value}}}, stats) for every company,
+    recomputing (in one batch) only companies whose figures changed
+    """
+    cache = load_metrics_cache()
+    companies = earnings_data.get('companies', {})
+
+    digests = {ticker: figures_digest(company.get('quarters', {})) for ticker, company in companies.items()}
+    stale = [ticker for ticker, digest in digests.items() if cache.get(ticker, {}).get('digest') != digest]
+
+    if stale:
+        computed = metrics_by_quarter([companies[ticker].get('quarters', {}) for ticker in stale])
+        for ticker, metrics in zip(stale, computed):
+            cache[ticker] = {'digest': digests[ticker], 'metrics': metrics}
+
+    removed = [ticker for ticker in cache if ticker not in companies]
+    for ticker in removed:
+        del cache[ticker]
+    if stale or removed:
+        save_metrics_cache(cache)
+
+    stats = {'computed': len(stale), 'cached': len(digests) - len(stale)}
+    return {ticker: cache[ticker]['metrics'] for ticker in companies}, stats
@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+"""
+Token and cost budget for daily news research
+Caps Google Custom Search and Vertex AI Claude usage per run, ranks material
+changes so the budget is spent on the most significant moves first
+"""
+
+import os
+import threading
+
+# Claude Sonnet 4.5 list pricing on Vertex AI (USD per million tokens)
+INPUT_COST_PER_MTOK = 3.00
+OUTPUT_COST_PER_MTOK = 15.00
+SEARCH_COST = 0.005  # Custom Search: $5 per 1000 queries beyond the free tier
+
+CHARS_PER_TOKEN = 4  # Rough estimate used before a call is made
+MIN_OUTPUT_TOKENS = 256  # Don't bother calling Claude with less room than this
+
+
+def estimate_tokens(text):
+    """Rough token estimate for a prompt"""
+    return len(text) // CHARS_PER_TOKEN + 1
+
+
+def _env_number(name, cast):
+    value = os.environ.get(name)
+    if value in (None, ''):
+        return None
+    return cast(value)
+
+
+def signal_score(change, benchmark_change=0.0):
+    """
+    Significance of a material change: raw magnitude plus the move in excess
+    of NASDAQ, so idiosyncratic moves outrank ones that just tracked the market
+    """
+    pct_change = change['data']['pct_change']
+    return abs(pct_change) + abs(pct_change - benchmark_change)
+
+
+def rank_material_changes(material_changes, benchmark=None):
+    """Return material changes sorted most significant first (input list is not modified)"""
+    benchmark_change = benchmark.get('pct_change', 0) if benchmark else 0
+    return sorted(
+        material_changes,
+        key=lambda change: signal_score(change, benchmark_change),
+        reverse=True
+    )
+
+
+class ResearchBudget:
+    """Tracks search/LLM requests, tokens and estimated cost against optional limits"""
+
+    def __init__(self, max_llm_calls=None, max_searches=None, max_tokens=None, max_cost=None):
+        self.max_llm_calls = max_llm_calls
+        self.max_searches = max_searches
+        self.max_tokens = max_tokens
+        self.max_cost = max_cost
+
+        self.llm_calls = 0
+        self.searches = 0
+        self.input_tokens = 0
+        self.output_tokens = 0
+        self.skipped = []
+        # Held by calls in flight (see reserve_llm_call), so concurrent workers can't overspend
+        self.reserved_calls = 0
+        self.reserved_searches = 0
+        self.reserved_tokens = 0
+        self.reserved_cost = 0.0
+        self._held = threading.local()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls):
+        """Build limits from RESEARCH_MAX_* environment variables (unset = unlimited)"""
+        return cls(
+            max_llm_calls=_env_number('RESEARCH_MAX_LLM_CALLS', int),
+            max_searches=_env_number('RESEARCH_MAX_SEARCHES', int),
+            max_tokens=_env_number('RESEARCH_MAX_TOKENS', int),
+            max_cost=_env_number('RESEARCH_MAX_COST_USD', float)
+        )
+
+    @property
+    def total_tokens(self):
+        return self.input_tokens + self.output_tokens
+
+    @property
+    def cost(self):
+        """Estimated spend so far in USD"""
+        return (
+            self.input_tokens * INPUT_COST_PER_MTOK / 1e6
+            + self.output_tokens * OUTPUT_COST_PER_MTOK / 1e6
+            + self.searches * SEARCH_COST
+        )
+
+    def can_search(self):
+        if self.max_searches is not None and self.searches + self.reserved_searches >= self.max_searches:
+            return False
+        if self.max_cost is not None and self.cost + self.reserved_cost + SEARCH_COST > self.max_cost:
+            return False
+        return True
+
+    def cap_max_tokens(self, max_tokens):
+        """Shrink a call's output allowance to what is left of the token budget"""
+        if self.max_tokens is None:
+            return max_tokens
+        return max(0, min(max_tokens, self.max_tokens - self.total_tokens - self.reserved_tokens))
+
+    def _call_cost(self, input_tokens, output_tokens):
+        return input_tokens * INPUT_COST_PER_MTOK / 1e6 + output_tokens * OUTPUT_COST_PER_MTOK / 1e6
+
+    def can_call_llm(self, input_tokens, max_tokens):
+        """Check whether a call with this prompt size and output allowance fits the budget"""
+        if self.max_llm_calls is not None and self.llm_calls + self.reserved_calls >= self.max_llm_calls:
+            return False
+
+        output_tokens = self.cap_max_tokens(max_tokens)
+        if output_tokens < min(MIN_OUTPUT_TOKENS, max_tokens):
+            return False
+        if self.max_tokens is not None and self.total_tokens + self.reserved_tokens + input_tokens + output_tokens > self.max_tokens:
+            return False
+
+        if self.max_cost is not None:
+            if self.cost + self.reserved_cost + self._call_cost(input_tokens, output_tokens) > self.max_cost:
+                return False
+
+        return True
+
+    def reserve_search(self):
+        """
+        Check and hold budget for one search in one step, for use from concurrent
+        workers; the hold turns into the recorded search, or is freed by release_search()
+        """
+        with self._lock:
+            if not self.can_search():
+                return False
+            self.reserved_searches += 1
+            self.reserved_cost += SEARCH_COST
+            self._held.search = True
+            return True
+
+    def _drop_search_hold(self):
+        if getattr(self._held, 'search', False):
+            self.reserved_searches -= 1
+            self.reserved_cost -= SEARCH_COST
+            self._held.search = False
+
+    def release_search(self):
+        """Free this thread's search hold if the search was never recorded"""
+        with self._lock:
+            self._drop_search_hold()
+
+    def reserve_llm_call(self, input_tokens, max_tokens):
+        """
+        Check and hold budget for one call in one step, for use from concurrent workers
+        Returns the output allowance to call with (None if the call doesn't fit); the
+        hold turns into the recorded call, or is freed by release_llm_call()
+        """
+        with self._lock:
+            if not self.can_call_llm(input_tokens, max_tokens):
+                return None
+            output_tokens = self.cap_max_tokens(max_tokens)
+            self.reserved_calls += 1
+            self.reserved_tokens += input_tokens + output_tokens
+            self.reserved_cost += self._call_cost(input_tokens, output_tokens)
+            self._held.llm = (input_tokens, output_tokens)
+            return output_tokens
+
+    def _drop_llm_hold(self):
+        held = getattr(self._held, 'llm', None)
+        if held:
+            self.reserved_calls -= 1
+            self.reserved_tokens -= sum(held)
+            self.reserved_cost -= self._call_cost(*held)
+            self._held.llm = None
+
+    def release_llm_call(self):
+        """Free this thread's call hold if the call was never recorded (it failed)"""
+        with self._lock:
+            self._drop_llm_hold()
+
+    def record_search(self):
+        with self._lock:
+            self._drop_search_hold()
+            self.searches += 1
+
+    def record_llm_call(self, input_tokens, output_tokens):
+        with self._lock:
+            self._drop_llm_hold()
+            self.llm_calls += 1
+            self.input_tokens += input_tokens
+            self.output_tokens += output_tokens
+
+    def record_skip(self, ticker, reason):
+        """Note a material change that was downgraded to a placeholder"""
+        with self._lock:
+            self.skipped.append({'ticker': ticker, 'reason': reason})
+            self._held.skipped = True
+
+    def take_thread_skip(self):
+        """Whether this thread recorded a skip since it last asked (clears the flag)"""
+        skipped = getattr(self._held, 'skipped', False)
+        self._held.skipped = False
+        return skipped
+
+    def report(self):
+        """Usage summary for the run report"""
+        return {
+            'llm_calls': self.llm_calls,
+            'searches': self.searches,
+            'input_tokens': self.input_tokens,
+            'output_tokens': self.output_tokens,
+            'estimated_cost_usd': round(self.cost, 4),
+            'skipped': list(self.skipped),
+            'limits': {
+                'max_llm_calls': self.max_llm_calls,
+                'max_searches': self.max_searches,
+                'max_tokens': self.max_tokens,
+                'max_cost_usd': self.max_cost
+            }
+        }
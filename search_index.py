@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Dashboard search index
+Builds an inverted index over every news narrative and management
+presentation summary, written to data/search-index.json and loaded by the
+page the first time the search box is focused. Queries are answered from
+the postings on the client, without scanning the DOM.
+
+Tokens are lowercased, stopwords dropped and words reduced with a light
+suffix stemmer. The stopwords and stem rules ship inside the index, so the
+client tokenizes queries exactly as the postings were built.
+"""
+
+import json
+import os
+import re
+
+from dashboard_data import DASHBOARD_DATA_DIR, write_if_changed
+from quarter_metrics import parse_quarter
+
+SEARCH_INDEX_FILE = 'search-index.json'
+SNIPPET_CHARS = 160
+
+TOKEN = re.compile(r'[a-z0-9]+')
+
+STOPWORDS = frozenset(
+    'a an and are as at be been but by for from had has have in into is it its '
+    'of on or that the their this to was were which while with'.split()
+)
+
+# (suffix, replacement, minimum stem length), first match wins
+STEM_RULES = (
+    ('sses', 'ss', 2),
+    ('ies', 'y', 2),
+    ('ches', 'ch', 1),
+    ('shes', 'sh', 1),
+    ('xes', 'x', 1),
+    ('ss', 'ss', 0),
+    ('us', 'us', 0),
+    ('is', 'is', 0),
+    ('s', '', 3),
+    ('ing', '', 3),
+    ('ed', '', 3),
+    ('ly', '', 3)
+)
+
+
+def stem(word):
+    """Light suffix stemmer: launches/launched/launching -> launch"""
+    for suffix, replacement, min_stem in STEM_RULES:
+        if word.endswith(suffix) and len(word) - len(suffix) >= min_stem:
+            word = word[:len(word) - len(suffix)] + replacement
+            # betting -> bett -> bet
+            if suffix in ('ing', 'ed') and len(word) > 3 and word[-1] == word[-2] and word[-1] not in 'lsz':
+                word = word[:-1]
+            return word
+    return word
+
+
+def tokenize(text):
+    """Stemmed index terms for a piece of text"""
+    return [stem(token) for token in TOKEN.findall(text.lower()) if token not in STOPWORDS]
+
+
+def snippet(text):
+    if len(text) <= SNIPPET_CHARS:
+        return text
+    return text[:SNIPPET_CHARS].rsplit(' ', 1)[0] + '...'
+
+
+def collect_documents(records, earnings_data):
+    """
+    Yield (doc, text) pairs: doc is [kind, key, ticker, label, snippet] where kind
+    is 'd' (day narrative, key = date) or 'q' (quarter summary, key = quarter)
+    records must already be sorted newest first
+    """
+    for record in records:
+        for change in record.get('material_changes', []):
+            summary = (change.get('news') or {}).get('summary')
+            if summary:
+                doc = ['d', record['date'], change['ticker'], record['date_display'], snippet(summary)]
+                yield doc, f"{change['ticker']} {change['name']} {summary}"
+
+    for ticker, company in earnings_data.get('companies', {}).items():
+        name = company.get('name', ticker)
+        quarters = [(quarter, data) for quarter, data in company.get('quarters', {}).items() if data]
+        # Newest quarter first; keys that aren't quarters go last
+        quarters.sort(key=lambda item: parse_quarter(item[0]) or (0, 0), reverse=True)
+        for quarter, data in quarters:
+            summary = data.get('presentation_summary')
+            if summary:
+                doc = ['q', quarter, ticker, quarter, snippet(summary)]
+                yield doc, f"{ticker} {name} {summary}"
+
+
+def build_search_index(records, earnings_data):
+    """Return the index dict: tokenizer settings, docs list and term -> delta-encoded sorted doc ids"""
+    docs = []
+    postings = {}
+    for doc_id, (doc, text) in enumerate(collect_documents(records, earnings_data)):
+        docs.append(doc)
+        for term in set(tokenize(text)):
+            postings.setdefault(term, []).append(doc_id)
+
+    terms = {}
+    for term in sorted(postings):
+        ids = postings[term]
+        # Gaps between ids are shorter to ship than the ids themselves
+        terms[term] = [ids[0]] + [b - a for a, b in zip(ids, ids[1:])]
+
+    return {
+        'stopwords': sorted(STOPWORDS),
+        'stem_rules': [list(rule) for rule in STEM_RULES],
+        'docs': docs,
+        'terms': terms
+    }
+
+
+def write_search_index(records, earnings_data, data_dir=DASHBOARD_DATA_DIR):
+    """Write data/search-index.json if its content changed, returns (docs, terms, written)"""
+    index = build_search_index(records, earnings_data)
+    os.makedirs(data_dir, exist_ok=True)
+    text = json.dumps(index, separators=(',', ':'), ensure_ascii=False)
+    written = write_if_changed(os.path.join(data_dir, SEARCH_INDEX_FILE), text)
+    return len(index['docs']), len(index['terms']), written
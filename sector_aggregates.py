@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Sector earnings aggregates
+Per-quarter figures for the industry overview card, computed in one
+vectorized pass over the companies x quarters arrays from quarter_metrics:
+sector totals, like-for-like revenue growth (companies reporting both this
+quarter and the same quarter a year earlier), the spread of company growth
+rates, EPS beats/misses against estimates and the net margin ranking.
+
+Each quarter's aggregates are cached under a digest of the figures they
+are computed from, so a run only aggregates quarters whose inputs changed.
+"""
+
+import hashlib
+import json
+import os
+import warnings
+
+import numpy as np
+
+from fragment_cache import FRAGMENT_CACHE_DIR
+from quarter_metrics import build_arrays, compute_metrics, quarter_key, shift_quarters
+
+SECTOR_CACHE_FILE = os.path.join(FRAGMENT_CACHE_DIR, 'sector_aggregates.json')
+SECTOR_FIELDS = ('revenue', 'earnings', 'eps_actual', 'eps_estimate')
+STRONG_GROWTH_PCT = 10.0  # Revenue YoY at or above this counts as strong growth
+
+
+def _number(x, digits=None):
+    if np.isnan(x):
+        return None
+    return round(float(x), digits) if digits is not None else float(x)
+
+
+def column_digest(tickers, arrays, col):
+    """Digest of the inputs to one quarter's aggregates (that quarter and a year earlier)"""
+    parts = [tickers]
+    for field in SECTOR_FIELDS:
+        for c in (col, col - 4):
+            values = arrays[field][:, c] if c >= 0 else []
+            parts.append([None if np.isnan(v) else float(v) for v in values])
+    return hashlib.sha1(json.dumps(parts).encode('utf-8')).hexdigest()
+
+
+def aggregate_columns(tickers, arrays, cols):
+    """Aggregates for the given quarter columns, computed together; returns {col: aggregates}"""
+    revenue = arrays['revenue']
+    earnings = arrays['earnings']
+    metrics = compute_metrics(revenue, earnings)
+    prior_revenue = shift_quarters(revenue, 4)
+
+    sel = np.array(cols, dtype=int)
+    rev = revenue[:, sel]
+    earn = earnings[:, sel]
+    prior = prior_revenue[:, sel]
+    yoy = metrics['revenue_yoy'][:, sel]
+    margin = metrics['net_margin'][:, sel]
+    eps_actual = arrays['eps_actual'][:, sel]
+    eps_estimate = arrays['eps_estimate'][:, sel]
+
+    reported = ~np.isnan(rev)
+    comparable = reported & ~np.isnan(prior)
+    comparable_now = np.where(comparable, rev, 0).sum(axis=0)
+    comparable_prior = np.where(comparable, prior, 0).sum(axis=0)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        sector_yoy = np.where(comparable_prior > 0, (comparable_now - comparable_prior) / comparable_prior * 100, np.nan)
+
+    # NaN compares False, so companies without a YoY fall in no bucket
+    strong = (yoy >= STRONG_GROWTH_PCT).sum(axis=0)
+    moderate = ((yoy >= 0) & (yoy < STRONG_GROWTH_PCT)).sum(axis=0)
+    declining = (yoy < 0).sum(axis=0)
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', RuntimeWarning)  # All-NaN columns
+        median_yoy = np.nanmedian(yoy, axis=0) if yoy.size else np.full(len(cols), np.nan)
+
+    has_earnings = ~np.isnan(earn)
+    earnings_total = np.where(has_earnings.any(axis=0), np.nansum(earn, axis=0), np.nan)
+    profitable = (earn > 0).sum(axis=0)
+
+    beat = (eps_actual > eps_estimate).sum(axis=0)
+    met = (eps_actual == eps_estimate).sum(axis=0)
+    missed = (eps_actual < eps_estimate).sum(axis=0)
+
+    # Rank by margin (missing margins sort last and are dropped below)
+    margin_order = np.argsort(-np.where(np.isnan(margin), -np.inf, margin), axis=0, kind='stable')
+    growth_order = np.argsort(-np.where(np.isnan(yoy), -np.inf, yoy), axis=0, kind='stable')
+
+    results = {}
+    for j, col in enumerate(cols):
+        leader = growth_order[0, j]
+        results[col] = {
+            'companies': int(reported[:, j].sum()),
+            'revenue': float(np.nansum(rev[:, j])),
+            'earnings': _number(earnings_total[j]),
+            'comparable': int(comparable[:, j].sum()),
+            'revenue_yoy': _number(sector_yoy[j], 1),
+            'growth': {
+                'strong': int(strong[j]),
+                'moderate': int(moderate[j]),
+                'declining': int(declining[j]),
+                'median': _number(median_yoy[j], 1)
+            },
+            'fastest': [tickers[leader], round(float(yoy[leader, j]), 1)] if not np.isnan(yoy[leader, j]) else None,
+            'profitable': int(profitable[j]),
+            'with_earnings': int(has_earnings[:, j].sum()),
+            'eps': {'beat': int(beat[j]), 'met': int(met[j]), 'missed': int(missed[j])},
+            'margins': [
+                [tickers[i], round(float(margin[i, j]), 1)]
+                for i in margin_order[:, j] if not np.isnan(margin[i, j])
+            ]
+        }
+    return results
+
+
+def load_sector_cache():
+    if os.path.exists(SECTOR_CACHE_FILE):
+        with open(SECTOR_CACHE_FILE, 'r') as f:
+            return json.load(f)
+    return {}
+
+
+def save_sector_cache(cache):
+    os.makedirs(os.path.dirname(SECTOR_CACHE_FILE), exist_ok=True)
+    tmp_file = SECTOR_CACHE_FILE + '.tmp'
+    with open(tmp_file, 'w') as f:
+        json.dump(cache, f, separators=(',', ':'))
+    os.replace(tmp_file, SECTOR_CACHE_FILE)
+
+
+def sector_aggregates(earnings_data):
+    """
+    Return ({quarter: aggregates}, stats) for every quarter at least one company
+    reported revenue for, aggregating only quarters whose inputs changed
+    """
+    companies = earnings_data.get('companies', {})
+    tickers = list(companies)
+    columns, arrays = build_arrays([companies[t].get('quarters', {}) for t in tickers], SECTOR_FIELDS)
+
+    cache = load_sector_cache()
+    keys = [quarter_key(*quarter) for quarter in columns]
+    digests = [column_digest(tickers, arrays, col) for col in range(len(columns))]
+    stale = [col for col, key in enumerate(keys) if cache.get(key, {}).get('digest') != digests[col]]
+
+    if stale:
+        for col, aggregates in aggregate_columns(tickers, arrays, stale).items():
+            cache[keys[col]] = {'digest': digests[col], 'aggregates': aggregates}
+
+    removed = [key for key in cache if key not in keys]
+    for key in removed:
+        del cache[key]
+    if stale or removed:
+        save_sector_cache(cache)
+
+    aggregates = {key: cache[key]['aggregates'] for key in keys if cache[key]['aggregates']['companies']}
+    return aggregates, {'aggregated': len(stale), 'cached': len(keys) - len(stale)}
+
+
+def overview_quarter(aggregates, company_count):
+    """Latest quarter at least half the companies have reported (else the latest with any report)"""
+    quarters = list(aggregates)
+    for quarter in reversed(quarters):
+        if aggregates[quarter]['companies'] * 2 >= company_count:
+            return quarter
+    return quarters[-1] if quarters else None
@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+"""
+Static site build
+Copies only what the dashboard serves (index.html, the data/ shards and the
+logo stylesheet in assets/) into site/, minifies the HTML, inline CSS/JS and JSON, and writes precompressed
+.gz (and .br, when the brotli package is installed) siblings. This directory,
+not the repo root, is what gets deployed to GitHub Pages.
+
+site/ is kept between builds: a file is only re-minified and recompressed
+when its source bytes (or this builder) changed, tracked in
+.dashboard_cache/site_build.json, and files whose source is gone are removed.
+
+Usage:
+  python site_build.py          # Build site/ from the current index.html and data/
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import re
+
+from dashboard_data import DASHBOARD_DATA_DIR
+from fragment_cache import FRAGMENT_CACHE_DIR, file_digest
+from logo_assets import ASSET_DIR
+
+# Optional: brotli output is skipped when the package is not installed
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+SITE_DIR = 'site'
+SITE_MANIFEST_FILE = os.path.join(FRAGMENT_CACHE_DIR, 'site_build.json')
+COMPRESSIBLE = ('.html', '.json', '.css', '.js', '.svg')
+
+# Maximum quality for the page and stylesheet; the data shards are larger
+# and far slower to compress at 11 for a few percent of size
+BROTLI_QUALITY = 11
+BROTLI_DATA_QUALITY = 5
+
+BLOCK_PATTERN = re.compile(r'(<(script|style|pre|textarea)\b[^>]*>)(.*?)(</\2>)', re.DOTALL | re.IGNORECASE)
+HTML_COMMENT = re.compile(r'<!--(?!\[if).*?-->', re.DOTALL)
+CSS_COMMENT = re.compile(r'/\*.*?\*/', re.DOTALL)
+CSS_PUNCTUATION = re.compile(r'\s*([{}:;,>])\s*')
+
+
+def minify_css(css):
+    """Drop comments and whitespace around CSS punctuation"""
+    css = CSS_COMMENT.sub('', css)
+    css = re.sub(r'\s+', ' ', css)
+    css = CSS_PUNCTUATION.sub(r'\1', css)
+    return css.replace(';}', '}').strip()
+
+
+def minify_js(js):
+    """
+    Conservative JS minification: strip indentation, blank lines and whole-line
+    // comments. Line breaks are kept so automatic semicolon insertion still holds.
+    """
+    lines = []
+    for line in js.splitlines():
+        line = line.strip()
+        if line and not line.startswith('//'):
+            lines.append(line)
+    return '\n'.join(lines)
+
+
+def minify_html(html):
+    """
+    Collapse whitespace runs to a single space (how the browser renders them
+    anyway) outside <pre>/<textarea>, and minify inline <style> and <script>
+    """
+    parts = []
+    last = 0
+    for match in BLOCK_PATTERN.finditer(html):
+        parts.append(re.sub(r'\s+', ' ', HTML_COMMENT.sub('', html[last:match.start()])))
+        open_tag, tag, body, close_tag = match.groups()
+        tag = tag.lower()
+        if tag == 'style':
+            body = minify_css(body)
+        elif tag == 'script':
+            body = minify_js(body)
+        parts.append(open_tag + body + close_tag)
+        last = match.end()
+    parts.append(re.sub(r'\s+', ' ', HTML_COMMENT.sub('', html[last:])))
+    return ''.join(parts).strip()
+
+
+def minify_json(text):
+    return json.dumps(json.loads(text), separators=(',', ':'), ensure_ascii=False)
+
+
+def write_compressed(path, payload):
+    """Write .gz (and .br if available) siblings of path, returns their sizes"""
+    quality = BROTLI_DATA_QUALITY if path.endswith('.json') else BROTLI_QUALITY
+    sizes = {}
+    with open(path + '.gz', 'wb') as f:
+        # mtime=0 keeps the output byte-identical across builds of the same content
+        f.write(gzip.compress(payload, compresslevel=9, mtime=0))
+    sizes['gz'] = os.path.getsize(path + '.gz')
+
+    if brotli is not None:
+        with open(path + '.br', 'wb') as f:
+            f.write(brotli.compress(payload, quality=quality))
+        sizes['br'] = os.path.getsize(path + '.br')
+
+    return sizes
+
+
+def build_file(source, target, text=None):
+    """Minify one file into the site directory, returns a size report row"""
+    if text is None:
+        with open(source, 'r', encoding='utf-8') as f:
+            text = f.read()
+
+    if source.endswith('.html'):
+        minified = minify_html(text)
+    elif source.endswith('.json'):
+        minified = minify_json(text)
+    elif source.endswith('.css'):
+        minified = minify_css(text)
+    else:
+        minified = text
+
+    payload = minified.encode('utf-8')
+    with open(target, 'wb') as f:
+        f.write(payload)
+
+    row = {'file': target, 'source': len(text.encode('utf-8')), 'minified': len(payload)}
+    if target.endswith(COMPRESSIBLE):
+        row.update(write_compressed(target, payload))
+    return row
+
+
+def print_size_report(rows):
+    columns = ['source', 'minified', 'gz'] + (['br'] if any('br' in row for row in rows) else [])
+    totals = {'file': 'total'}
+    for column in columns:
+        totals[column] = sum(row.get(column, 0) for row in rows)
+
+    print(f"{'file':<32}" + ''.join(f"{column:>11}" for column in columns))
+    for row in rows + [totals]:
+        print(f"{row['file']:<32}" + ''.join(f"{row.get(column, 0) / 1024:>10.1f}K" for column in columns))
+
+
+def load_site_manifest():
+    if os.path.exists(SITE_MANIFEST_FILE):
+        with open(SITE_MANIFEST_FILE, 'r') as f:
+            return json.load(f)
+    return {}
+
+
+def save_site_manifest(manifest):
+    os.makedirs(os.path.dirname(SITE_MANIFEST_FILE), exist_ok=True)
+    tmp_file = SITE_MANIFEST_FILE + '.tmp'
+    with open(tmp_file, 'w') as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(tmp_file, SITE_MANIFEST_FILE)
+
+
+def built_outputs(target):
+    """Every file build_file writes for target"""
+    outputs = [target]
+    if target.endswith(COMPRESSIBLE):
+        outputs.append(target + '.gz')
+        if brotli is not None:
+            outputs.append(target + '.br')
+    return outputs
+
+
+def site_sources(dashboard_file, data_dir, asset_dir, site_dir):
+    """(source, target) pairs for everything the site serves"""
+    pairs = [(dashboard_file, os.path.join(site_dir, 'index.html'))]
+    for source_dir, ext in ((data_dir, '.json'), (asset_dir, '.css')):
+        if not os.path.isdir(source_dir):
+            continue
+        for name in sorted(os.listdir(source_dir)):
+            if name.endswith(ext):
+                pairs.append((os.path.join(source_dir, name), os.path.join(site_dir, source_dir, name)))
+    return pairs
+
+
+def remove_stale_outputs(site_dir, keep):
+    """Delete files under site_dir not in keep (sources removed since the last build)"""
+    removed = 0
+    for root, _, names in os.walk(site_dir):
+        for name in names:
+            path = os.path.join(root, name)
+            if path not in keep:
+                os.remove(path)
+                removed += 1
+    return removed
+
+
+def build_site(dashboard_file='index.html', data_dir=DASHBOARD_DATA_DIR, asset_dir=ASSET_DIR,
+               site_dir=SITE_DIR, report=True):
+    """Build the deployable site directory, returns the list of size report rows"""
+    if not os.path.exists(dashboard_file):
+        print(f"[WARN] {dashboard_file} not found - generate the dashboard first")
+        return []
+
+    # Builder changes (minifiers, compression settings) invalidate every file
+    version = f"{file_digest(__file__)}-{'br' if brotli else 'gz'}"
+    manifest = load_site_manifest()
+    files = manifest.get('files', {}) if manifest.get('version') == version else {}
+
+    rows = []
+    built = {}
+    keep = set()
+    rebuilt = 0
+    for source, target in site_sources(dashboard_file, data_dir, asset_dir, site_dir):
+        with open(source, 'rb') as f:
+            source_bytes = f.read()
+        digest = hashlib.sha1(source_bytes).hexdigest()
+        outputs = built_outputs(target)
+        keep.update(outputs)
+
+        entry = files.get(target)
+        if entry and entry['digest'] == digest and all(os.path.exists(path) for path in outputs):
+            row = entry['row']
+        else:
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            row = build_file(source, target, source_bytes.decode('utf-8'))
+            rebuilt += 1
+        rows.append(row)
+        built[target] = {'digest': digest, 'row': row}
+
+    removed = remove_stale_outputs(site_dir, keep)
+    save_site_manifest({'version': version, 'files': built})
+
+    if report:
+        print(f"\n[OK] Site built: {site_dir}/ ({len(rows)} files, {rebuilt} rebuilt, {removed} removed"
+              f"{'' if brotli else ', brotli not installed'})")
+        print_size_report(rows)
+    return rows
+
+
+if __name__ == '__main__':
+    build_site()
@@ -4,11 +4,15 @@ Slack Notifier for Gaming Stock Tracker
 Sends daily summaries to Slack channel
 """
 
-import json
 import os
 import sys
+import time
 from datetime import datetime, timedelta
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import NewConnectionError
+
+from latest_records import load_latest_record
 
 # Fix Windows console encoding for emojis
 if sys.platform == 'win32':
@@ -19,6 +23,22 @@ if sys.platform == 'win32':
 # Slack webhook URL (set via environment variable for security)
 SLACK_WEBHOOK_URL = os.environ.get('SLACK_WEBHOOK_URL', '')
 
+# Optional bot token + channel: posts through chat.postMessage instead, so
+# overflow messages are threaded under the first one (webhooks can't thread)
+SLACK_BOT_TOKEN = os.environ.get('SLACK_BOT_TOKEN', '')
+SLACK_CHANNEL = os.environ.get('SLACK_CHANNEL', '')
+SLACK_POST_MESSAGE_URL = os.environ.get('SLACK_API_URL', 'https://slack.com/api') + '/chat.postMessage'
+
+# Set SLACK_VERIFY_SSL=0 only where a proxy breaks certificate checks (e.g. some Windows setups)
+SLACK_VERIFY_SSL = os.environ.get('SLACK_VERIFY_SSL', '1') != '0'
+
+SLACK_MAX_BLOCKS = 50        # Slack rejects messages with more blocks
+SLACK_MAX_TEXT = 3000        # Per section text
+SLACK_TIMEOUT = (5, 15)      # Connect, read seconds
+SLACK_MAX_ATTEMPTS = 5
+SLACK_BACKOFF_SECONDS = 1.0  # Doubles after each failed attempt
+SLACK_MAX_WAIT = 60          # Cap on a single Retry-After / backoff wait
+
 # Configuration
 DASHBOARD_URL = 'https://adamware-creator.github.io/gaming-stock-tracker/'
 DATA_FILE = 'stock_tracker_history.json'
@@ -35,19 +55,8 @@ GAMING_COMPANIES = {
 
 
 def load_latest_data():
-    """Load the most recent trading day's data"""
-    if not os.path.exists(DATA_FILE):
-        return None
-
-    with open(DATA_FILE, 'r') as f:
-        data = json.load(f)
-
-    if not data.get('records'):
-        return None
-
-    # Get the most recent record
-    records = sorted(data['records'], key=lambda x: x['date'], reverse=True)
-    return records[0] if records else None
+    """Load the most recent trading day's data (from the latest-records pointer, not the full history)"""
+    return load_latest_record(DATA_FILE)
 
 
 def format_slack_message(record):
@@ -137,7 +146,7 @@ def format_slack_message(record):
                 "type": "section",
                 "text": {
                     "type": "mrkdwn",
-                    "text": change_text
+                    "text": truncate_text(change_text)
                 }
             })
 
@@ -167,9 +176,137 @@ def format_slack_message(record):
     }
 
 
+_session = None
+
+
+def get_session():
+    """One pooled session for every post in the run (keep-alive, shared TLS handshake)"""
+    global _session
+    if _session is None:
+        _session = requests.Session()
+        _session.mount('https://', HTTPAdapter(pool_connections=1, pool_maxsize=4))
+        _session.mount('http://', HTTPAdapter(pool_connections=1, pool_maxsize=4))
+        _session.verify = SLACK_VERIFY_SSL
+        if not SLACK_VERIFY_SSL:
+            import urllib3
+            urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+    return _session
+
+
+def truncate_text(text, limit=SLACK_MAX_TEXT):
+    return text if len(text) <= limit else text[:limit - 1] + '…'
+
+
+def split_message(message, max_blocks=SLACK_MAX_BLOCKS):
+    """
+    Split a message whose blocks exceed Slack's limit into a first message and
+    follow-ups, each follow-up starting with a "continued" context block
+    """
+    blocks = message.get('blocks')
+    if not blocks or len(blocks) <= max_blocks:
+        return [message]
+
+    chunks = [blocks[:max_blocks]]
+    rest = blocks[max_blocks:]
+    while rest:
+        # A follow-up shouldn't open with a divider
+        while rest and rest[0]['type'] == 'divider':
+            rest = rest[1:]
+        if rest:
+            chunks.append(rest[:max_blocks - 1])
+            rest = rest[max_blocks - 1:]
+
+    text = message.get('text', '')
+    parts = [{**message, 'blocks': chunks[0]}]
+    for i, chunk in enumerate(chunks[1:], start=2):
+        label = f"Continued ({i}/{len(chunks)})"
+        parts.append({
+            'blocks': [{"type": "context", "elements": [{"type": "mrkdwn", "text": f"_{label}_"}]}] + chunk,
+            'text': f"{text} - {label}" if text else label
+        })
+    return parts
+
+
+def retry_wait(response, attempt):
+    """Seconds to wait before the next attempt: Retry-After on 429s, else exponential backoff"""
+    retry_after = response.headers.get('Retry-After') if response is not None else None
+    if retry_after and retry_after.isdigit():
+        return min(int(retry_after), SLACK_MAX_WAIT)
+    return min(SLACK_BACKOFF_SECONDS * 2 ** attempt, SLACK_MAX_WAIT)
+
+
+def never_connected(error):
+    """Whether a failed request never reached Slack (connect timeout, refused, DNS)"""
+    if isinstance(error, requests.ConnectTimeout):
+        return True
+    reason = getattr(error.args[0], 'reason', None) if error.args else None
+    return isinstance(reason, NewConnectionError)
+
+
+def post_with_retry(url, payload, headers=None):
+    """
+    POST a payload, retrying only when Slack can't have posted it: failures to
+    connect and 429s. A read timeout, dropped connection or 5xx may still have
+    posted the message, so those are not retried (no duplicate notifications)
+    Returns the final response, or None if the request failed without one
+    """
+    session = get_session()
+    response = None
+    for attempt in range(SLACK_MAX_ATTEMPTS):
+        try:
+            response = session.post(url, json=payload, headers=headers, timeout=SLACK_TIMEOUT)
+        except requests.RequestException as e:
+            if not never_connected(e):
+                print(f"  ⚠️ Slack request failed after sending ({e.__class__.__name__}), not retrying")
+                return None
+            print(f"  ⚠️ Slack connection failed ({e.__class__.__name__}), attempt {attempt + 1}/{SLACK_MAX_ATTEMPTS}")
+            response = None
+        else:
+            if response.status_code != 429:
+                return response
+            print(f"  ⚠️ Slack rate limited (429), attempt {attempt + 1}/{SLACK_MAX_ATTEMPTS}")
+
+        if attempt + 1 < SLACK_MAX_ATTEMPTS:
+            time.sleep(retry_wait(response, attempt))
+    return response
+
+
+def post_webhook(message):
+    response = post_with_retry(SLACK_WEBHOOK_URL, message)
+    if response is None or response.status_code != 200:
+        status = response.status_code if response is not None else 'no response'
+        print(f"❌ Failed to send message. Status code: {status}")
+        if response is not None:
+            print(f"Response: {response.text}")
+        return False
+    return True
+
+
+def post_chat_message(message, thread_ts=None):
+    """Post through chat.postMessage, returns the message ts (None on failure)"""
+    payload = {**message, 'channel': SLACK_CHANNEL}
+    if thread_ts:
+        payload['thread_ts'] = thread_ts
+    headers = {'Authorization': f'Bearer {SLACK_BOT_TOKEN}'}
+    response = post_with_retry(SLACK_POST_MESSAGE_URL, payload, headers)
+
+    # The Web API answers 200 with ok: false for most errors
+    result = response.json() if response is not None and response.status_code == 200 else {}
+    if not result.get('ok'):
+        status = response.status_code if response is not None else 'no response'
+        print(f"❌ Failed to send message. Status code: {status}, error: {result.get('error', 'unknown')}")
+        return None
+    return result['ts']
+
+
 def send_to_slack(message):
-    """Send message to Slack via webhook"""
-    if not SLACK_WEBHOOK_URL:
+    """
+    Send message to Slack, split into follow-ups if it exceeds the block limit
+    Follow-ups are threaded under the first message when posting with a bot
+    token, and sent as consecutive messages through a webhook
+    """
+    use_bot = bool(SLACK_BOT_TOKEN and SLACK_CHANNEL)
+    if not use_bot and not SLACK_WEBHOOK_URL:
         print("ERROR: SLACK_WEBHOOK_URL environment variable not set!")
         print("\nSet it with:")
         print("  export SLACK_WEBHOOK_URL='your-webhook-url'")
@@ -177,29 +314,27 @@ def send_to_slack(message):
         print("  set SLACK_WEBHOOK_URL=your-webhook-url  (Windows)")
         return False
 
-    try:
-        # Disable SSL warnings for Windows environments
-        import urllib3
-        urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
-
-        response = requests.post(
-            SLACK_WEBHOOK_URL,
-            json=message,
-            headers={'Content-Type': 'application/json'},
-            verify=False  # Disable SSL verification for Windows SSL certificate issues
-        )
-
-        if response.status_code == 200:
-            print("✅ Message sent to Slack successfully!")
-            return True
-        else:
-            print(f"❌ Failed to send message. Status code: {response.status_code}")
-            print(f"Response: {response.text}")
+    parts = split_message(message)
+    thread_ts = None
+    for i, part in enumerate(parts):
+        try:
+            if use_bot:
+                ts = post_chat_message(part, thread_ts)
+                sent = ts is not None
+                thread_ts = thread_ts or ts
+            else:
+                sent = post_webhook(part)
+        except Exception as e:
+            print(f"❌ Error sending to Slack: {e}")
+            sent = False
+        if not sent:
+            if i:
+                print(f"   ({i} of {len(parts)} messages were sent)")
             return False
 
-    except Exception as e:
-        print(f"❌ Error sending to Slack: {e}")
-        return False
+    suffix = f" ({len(parts)} messages)" if len(parts) > 1 else ""
+    print(f"✅ Message sent to Slack successfully!{suffix}")
+    return True
 
 
 def main():
@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""
+Company sparklines
+Per-ticker closing price and price relative to ^IXIC, downsampled with
+Largest-Triangle-Three-Buckets to a fixed point budget and drawn as inline
+SVG on the earnings company headers.
+
+Downsampling is incremental: each month is reduced to MONTH_POINTS once and
+cached by its content, then one final LTTB pass brings the concatenated
+months down to SPARKLINE_POINTS. A daily run only re-reduces the current
+month, and the SVG stays a couple of KB however long the history gets.
+"""
+
+import hashlib
+import json
+import os
+
+from fragment_cache import FRAGMENT_CACHE_DIR
+
+SPARKLINE_CACHE_FILE = os.path.join(FRAGMENT_CACHE_DIR, 'sparklines.json')
+SPARKLINE_POINTS = 60
+MONTH_POINTS = 12
+SPARKLINE_WIDTH = 120
+SPARKLINE_HEIGHT = 32
+
+
+def lttb(points, threshold):
+    """Largest-Triangle-Three-Buckets downsampling of [(x, y), ...] sorted by x"""
+    if threshold >= len(points) or threshold < 3:
+        return list(points)
+
+    sampled = [points[0]]
+    bucket_size = (len(points) - 2) / (threshold - 2)
+    a = 0
+    for i in range(threshold - 2):
+        start = int(i * bucket_size) + 1
+        end = int((i + 1) * bucket_size) + 1
+
+        # Average of the next bucket is the third triangle vertex
+        next_start = end
+        next_end = min(int((i + 2) * bucket_size) + 1, len(points))
+        next_bucket = points[next_start:next_end]
+        avg_x = sum(p[0] for p in next_bucket) / len(next_bucket)
+        avg_y = sum(p[1] for p in next_bucket) / len(next_bucket)
+
+        ax, ay = points[a]
+        best_area = -1
+        best = start
+        for j in range(start, end):
+            x, y = points[j]
+            area = abs((ax - avg_x) * (y - ay) - (ax - x) * (avg_y - ay))
+            if area > best_area:
+                best_area = area
+                best = j
+
+        sampled.append(points[best])
+        a = best
+
+    sampled.append(points[-1])
+    return sampled
+
+
+def ticker_series(records, ticker):
+    """
+    Trading-day indexed (x, close) and (x, close / ^IXIC close) series for a ticker
+    records must be sorted oldest first; x is the record's position in the history
+    """
+    price = []
+    relative = []
+    months = []
+    for x, record in enumerate(records):
+        company = (record.get('companies') or {}).get(ticker)
+        if not company:
+            continue
+        close = company['data']['current_price']
+        price.append((x, close))
+        benchmark = record.get('benchmark')
+        relative.append((x, close / benchmark['current_price'] if benchmark else None))
+        months.append(record['date'][:7])
+    return price, relative, months
+
+
+def load_sparkline_cache():
+    if os.path.exists(SPARKLINE_CACHE_FILE):
+        with open(SPARKLINE_CACHE_FILE, 'r') as f:
+            return json.load(f)
+    return {}
+
+
+def save_sparkline_cache(cache):
+    os.makedirs(os.path.dirname(SPARKLINE_CACHE_FILE), exist_ok=True)
+    tmp_file = SPARKLINE_CACHE_FILE + '.tmp'
+    with open(tmp_file, 'w') as f:
+        json.dump(cache, f, separators=(',', ':'))
+    os.replace(tmp_file, SPARKLINE_CACHE_FILE)
+
+
+def downsample(points, months, cache, cache_prefix, used, stats):
+    """Reduce each month to MONTH_POINTS (cached by content), then the whole series to SPARKLINE_POINTS"""
+    if len(points) <= SPARKLINE_POINTS:
+        return points
+
+    by_month = {}
+    for point, month in zip(points, months):
+        by_month.setdefault(month, []).append(point)
+
+    reduced = []
+    for month, month_points in by_month.items():
+        key = f"{cache_prefix}|{month}"
+        used.add(key)
+        digest = hashlib.sha1(json.dumps(month_points).encode('utf-8')).hexdigest()
+        entry = cache.get(key)
+        if entry is None or entry['digest'] != digest:
+            entry = {'digest': digest, 'points': lttb(month_points, MONTH_POINTS)}
+            cache[key] = entry
+            stats['reduced'] += 1
+        else:
+            stats['cached'] += 1
+        reduced.extend(tuple(p) for p in entry['points'])
+
+    return lttb(reduced, SPARKLINE_POINTS)
+
+
+def polyline(points, x_range, y_range, css_class):
+    """SVG polyline scaled into the sparkline box (y grows downwards)"""
+    x0, x1 = x_range
+    y0, y1 = y_range
+    pad = 2
+    width = SPARKLINE_WIDTH - 2 * pad
+    height = SPARKLINE_HEIGHT - 2 * pad
+    coords = ' '.join(
+        f"{pad + (x - x0) / ((x1 - x0) or 1) * width:.1f},{pad + (y1 - y) / ((y1 - y0) or 1) * height:.1f}"
+        for x, y in points
+    )
+    return f'<polyline class="{css_class}" points="{coords}"/>'
+
+
+def render_sparkline(ticker, price, relative):
+    """Inline SVG with both lines indexed to 100 at the first point, plus a change label"""
+    if len(price) < 2 or len(relative) < 2:
+        return ''
+
+    base_price = price[0][1]
+    base_relative = relative[0][1]
+    indexed_price = [(x, y / base_price * 100) for x, y in price]
+    indexed_relative = [(x, y / base_relative * 100) for x, y in relative]
+
+    all_points = indexed_price + indexed_relative
+    x_range = (min(p[0] for p in all_points), max(p[0] for p in all_points))
+    y_range = (min(p[1] for p in all_points), max(p[1] for p in all_points))
+
+    price_change = indexed_price[-1][1] - 100
+    relative_change = indexed_relative[-1][1] - 100
+    price_class = 'positive' if price_change > 0 else 'negative'
+    relative_class = 'positive' if relative_change > 0 else 'negative'
+
+    return (
+        f'<span class="sparkline" title="{ticker}: {price_change:+.1f}% over the tracked period, '
+        f'{relative_change:+.1f}% relative to NASDAQ">'
+        f'<svg viewBox="0 0 {SPARKLINE_WIDTH} {SPARKLINE_HEIGHT}" width="{SPARKLINE_WIDTH}" height="{SPARKLINE_HEIGHT}" '
+        f'xmlns="http://www.w3.org/2000/svg" aria-hidden="true">'
+        f'{polyline(indexed_relative, x_range, y_range, "spark-relative")}'
+        f'{polyline(indexed_price, x_range, y_range, "spark-price")}'
+        f'</svg>'
+        f'<span class="spark-labels"><span class="spark-change {price_class}">{price_change:+.1f}%</span>'
+        f'<span class="spark-change {relative_class}">{relative_change:+.1f}% vs NASDAQ</span></span>'
+        f'</span>'
+    )
+
+
+def build_sparklines(records, tickers):
+    """
+    Return ({ticker: sparkline html}, stats) for the given tickers, where stats
+    counts months reduced vs served from the cache
+    records must be sorted oldest first
+    """
+    cache = load_sparkline_cache()
+    stats = {'reduced': 0, 'cached': 0}
+    used = set()
+    sparklines = {}
+
+    for ticker in tickers:
+        price, relative, months = ticker_series(records, ticker)
+        # Days without a benchmark close have no relative value
+        relative_months = [m for (x, y), m in zip(relative, months) if y is not None]
+        relative = [(x, y) for x, y in relative if y is not None]
+
+        price = downsample(price, months, cache, f"{ticker}|price", used, stats)
+        relative = downsample(relative, relative_months, cache, f"{ticker}|relative", used, stats)
+        sparklines[ticker] = render_sparkline(ticker, price, relative)
+
+    # Drop months no longer in the history (or for tickers no longer tracked)
+    stale = [key for key in cache if key not in used]
+    for key in stale:
+        del cache[key]
+    if stats['reduced'] or stale:
+        save_sparkline_cache(cache)
+
+    return sparklines, stats
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+On-disk cache of raw quarterly statements
+Keeps the yfinance statement frame per ticker as a compressed pickle, with
+its fetch time and latest period end in index.json. A statement is only
+refetched once a new quarter could plausibly have been reported: after the
+next quarter has closed and the reporting lag has passed, and then at most
+every RECHECK_DAYS until the new period shows up. Between earnings seasons
+an earnings run does no network I/O at all.
+"""
+
+import json
+import os
+import threading
+from datetime import datetime, timedelta
+
+import pandas as pd
+
+STATEMENT_CACHE_DIR = '.statement_cache'
+INDEX_FILE = 'index.json'
+REPORT_LAG_DAYS = 20   # Earliest a quarter is reported after it closes
+RECHECK_DAYS = 2       # Retry interval once a report is due but not yet out
+MAX_AGE_DAYS = 120     # Refetch regardless after this long (restatements, missed periods)
+
+_index_lock = threading.Lock()
+
+
+def _index_path(cache_dir):
+    return os.path.join(cache_dir, INDEX_FILE)
+
+
+def load_index(cache_dir=STATEMENT_CACHE_DIR):
+    path = _index_path(cache_dir)
+    if os.path.exists(path):
+        with open(path, 'r') as f:
+            return json.load(f)
+    return {}
+
+
+def next_period_end(period_end):
+    """Expected end of the quarter after period_end (three months on, fiscal calendars included)"""
+    return (pd.Timestamp(period_end) + pd.DateOffset(months=3)).to_pydatetime()
+
+
+def is_fresh(entry, now=None):
+    """
+    Whether a cached statement can be used without refetching
+    entry is an index.json record: fetched_at and latest_period_end (ISO dates)
+    """
+    now = now or datetime.now()
+    fetched_at = datetime.fromisoformat(entry['fetched_at'])
+    if now - fetched_at > timedelta(days=MAX_AGE_DAYS):
+        return False
+    if not entry.get('latest_period_end'):
+        return now - fetched_at < timedelta(days=RECHECK_DAYS)
+
+    latest = datetime.fromisoformat(entry['latest_period_end'])
+    report_due = next_period_end(latest) + timedelta(days=REPORT_LAG_DAYS)
+    if now < report_due:
+        return True
+
+    # A new quarter may be out: recheck, but not on every run
+    return now - fetched_at < timedelta(days=RECHECK_DAYS) and fetched_at >= report_due
+
+
+def load_statement(ticker, cache_dir=STATEMENT_CACHE_DIR, now=None):
+    """Return (frame, source) from the cache if fresh, else None"""
+    entry = load_index(cache_dir).get(ticker)
+    path = os.path.join(cache_dir, f"{ticker}.pkl.gz")
+    if entry is None or not os.path.exists(path) or not is_fresh(entry, now):
+        return None
+    return pd.read_pickle(path, compression='gzip'), entry['source']
+
+
+def store_statement(ticker, frame, source, cache_dir=STATEMENT_CACHE_DIR):
+    """Cache a freshly downloaded statement frame and record its fetch metadata"""
+    os.makedirs(cache_dir, exist_ok=True)
+    path = os.path.join(cache_dir, f"{ticker}.pkl.gz")
+    tmp_path = path + '.tmp'
+    frame.to_pickle(tmp_path, compression='gzip')
+    os.replace(tmp_path, path)
+
+    latest = max(frame.columns) if len(frame.columns) else None
+    entry = {
+        'source': source,
+        'fetched_at': datetime.now().isoformat(timespec='seconds'),
+        'latest_period_end': latest.strftime('%Y-%m-%d') if latest is not None else None
+    }
+
+    # Workers store concurrently; serialise the read-modify-write of the index
+    with _index_lock:
+        index = load_index(cache_dir)
+        index[ticker] = entry
+        tmp_index = _index_path(cache_dir) + '.tmp'
+        with open(tmp_index, 'w') as f:
+            json.dump(index, f, indent=2)
+        os.replace(tmp_index, _index_path(cache_dir))
+    return entry
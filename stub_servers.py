@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+"""
+Local stand-in server for Google Custom Search, Vertex AI Claude and Slack
+Lets the daily pipeline run offline for benchmarking and load testing
+
+Usage:
+  python stub_servers.py [--port 8765] [--latency-ms 50] [--error-rate 0.05] [--rate-limit 10]
+
+Then point the pipeline at it:
+  GOOGLE_SEARCH_URL=http://127.0.0.1:8765/customsearch/v1
+  VERTEX_BASE_URL=http://127.0.0.1:8765
+  VERTEX_ACCESS_TOKEN=stub
+  SLACK_WEBHOOK_URL=http://127.0.0.1:8765/slack/webhook
+
+GET /_stats returns request, error and 429 counts per endpoint
+"""
+
+import argparse
+import json
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+DEFAULT_PORT = 8765
+
+# Matches the per-ticker headings written by automated_daily_update.build_batch_prompt
+BATCH_TICKER_PATTERN = re.compile(r'^## ([A-Z^]+):', re.MULTILINE)
+SINGLE_TICKER_PATTERN = re.compile(r'\(([A-Z]+)\) stock (rose|fell)')
+# Matches auto_fetch_earnings_summaries prompts (fetch_earnings_summaries.generate_earnings_summary_prompt)
+EARNINGS_CALL_PATTERN = re.compile(r'\(([A-Z]+)\) (Q[1-4] \d{4}) earnings call')
+
+
+class StubConfig:
+    """Latency, error injection and rate limit settings shared by all handlers"""
+
+    def __init__(self, latency_ms=0, error_rate=0.0, rate_limit=0, retry_after=1, seed=None):
+        self.latency_ms = latency_ms
+        self.error_rate = error_rate
+        self.rate_limit = rate_limit  # Requests per second per endpoint, 0 = unlimited
+        self.retry_after = retry_after
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+        self.windows = {}
+        self.stats = {}
+
+    def record(self, endpoint, outcome):
+        with self.lock:
+            counts = self.stats.setdefault(endpoint, {'requests': 0, 'errors': 0, 'rate_limited': 0})
+            counts['requests'] += 1
+            if outcome != 'ok':
+                counts[outcome] += 1
+
+    def is_rate_limited(self, endpoint):
+        """Fixed one-second window limiter per endpoint"""
+        if not self.rate_limit:
+            return False
+
+        with self.lock:
+            now = int(time.time())
+            window, count = self.windows.get(endpoint, (now, 0))
+            if window != now:
+                window, count = now, 0
+            count += 1
+            self.windows[endpoint] = (window, count)
+            return count > self.rate_limit
+
+    def should_fail(self):
+        with self.lock:
+            return self.random.random() < self.error_rate
+
+
+def search_items(query):
+    """Deterministic Custom Search results for a query"""
+    return [
+        {
+            'title': f"{query} - result {i}",
+            'snippet': f"Stub snippet {i} describing market news for: {query}.",
+            'link': f"https://example.com/news/{i}"
+        }
+        for i in range(1, 6)
+    ]
+
+
+def narrative_text(prompt):
+    """Build the text Claude would return: JSON for batch prompts, prose otherwise"""
+    tickers = BATCH_TICKER_PATTERN.findall(prompt)
+    if tickers:
+        return json.dumps({
+            ticker: f"{ticker} moved on stub market news. Analysts cited sector trends."
+            for ticker in tickers
+        })
+
+    match = SINGLE_TICKER_PATTERN.search(prompt)
+    if match:
+        return f"{match.group(1)} {match.group(2)} on stub market news. Analysts cited sector trends."
+
+    match = EARNINGS_CALL_PATTERN.search(prompt)
+    if match:
+        return (f"{match.group(1)} {match.group(2)}: stub earnings call summary. Revenue and earnings were "
+                f"discussed, management reiterated guidance and analysts asked about margins.")
+    return "Stub narrative."
+
+
+def sse_events(text, input_tokens=0, chunk_size=40):
+    """Vertex streamRawPredict SSE body split into several text deltas"""
+    events = [
+        {'type': 'message_start', 'message': {'role': 'assistant', 'content': [],
+                                              'usage': {'input_tokens': input_tokens, 'output_tokens': 1}}},
+        {'type': 'content_block_start', 'index': 0, 'content_block': {'type': 'text', 'text': ''}},
+    ]
+    for i in range(0, len(text), chunk_size):
+        events.append({
+            'type': 'content_block_delta',
+            'index': 0,
+            'delta': {'type': 'text_delta', 'text': text[i:i + chunk_size]}
+        })
+    events.append({'type': 'content_block_stop', 'index': 0})
+    events.append({'type': 'message_delta', 'delta': {'stop_reason': 'end_turn'},
+                   'usage': {'output_tokens': len(text) // 4}})
+    events.append({'type': 'message_stop'})
+
+    body = ''
+    for event in events:
+        body += f"event: {event['type']}\ndata: {json.dumps(event)}\n\n"
+    return body
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Routes requests to the search, Vertex and Slack stand-ins"""
+
+    config = StubConfig()
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send(self, status, body, content_type='application/json', headers=None):
+        data = body.encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(data)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _endpoint(self, path):
+        if path.startswith('/customsearch'):
+            return 'search'
+        if ':streamRawPredict' in path or ':rawPredict' in path:
+            return 'vertex'
+        if path.startswith('/slack'):
+            return 'slack'
+        return None
+
+    def _read_body(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        return self.rfile.read(length).decode('utf-8') if length else ''
+
+    def _handle(self, method):
+        path = urlparse(self.path).path
+
+        if path == '/_stats':
+            self._send(200, json.dumps(self.config.stats, indent=2))
+            return
+
+        endpoint = self._endpoint(path)
+        if endpoint is None:
+            self._send(404, json.dumps({'error': 'not found'}))
+            return
+
+        body = self._read_body() if method == 'POST' else ''
+
+        if self.config.latency_ms:
+            time.sleep(self.config.latency_ms / 1000.0)
+
+        if self.config.is_rate_limited(endpoint):
+            self.config.record(endpoint, 'rate_limited')
+            self._send(429, json.dumps({'error': 'rate_limited'}),
+                       headers={'Retry-After': str(self.config.retry_after)})
+            return
+
+        if self.config.should_fail():
+            self.config.record(endpoint, 'errors')
+            self._send(500, json.dumps({'error': 'injected failure'}))
+            return
+
+        self.config.record(endpoint, 'ok')
+
+        if endpoint == 'search':
+            query = parse_qs(urlparse(self.path).query).get('q', [''])[0]
+            self._send(200, json.dumps({'items': search_items(query)}))
+        elif endpoint == 'vertex':
+            payload = json.loads(body or '{}')
+            prompt = ''.join(m.get('content', '') for m in payload.get('messages', []))
+            self._send(200, sse_events(narrative_text(prompt), len(prompt) // 4), content_type='text/event-stream')
+        else:
+            self._send(200, 'ok', content_type='text/plain')
+
+    def do_GET(self):
+        self._handle('GET')
+
+    def do_POST(self):
+        self._handle('POST')
+
+
+def make_stub_server(port=DEFAULT_PORT, config=None):
+    """Create (but do not start) a stub server bound to localhost"""
+    handler = type('ConfiguredStubHandler', (StubHandler,), {'config': config or StubConfig()})
+    return ThreadingHTTPServer(('127.0.0.1', port), handler)
+
+
+def start_stub_server(port=DEFAULT_PORT, config=None):
+    """Start the stub server on a background thread, returns the server (call .shutdown() to stop)"""
+    server = make_stub_server(port, config)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Local stand-in for Google Search, Vertex AI and Slack')
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT)
+    parser.add_argument('--latency-ms', type=int, default=0, help='Delay added to every response')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='Fraction of requests answered with HTTP 500')
+    parser.add_argument('--rate-limit', type=int, default=0, help='Requests per second per endpoint before HTTP 429')
+    parser.add_argument('--retry-after', type=int, default=1, help='Retry-After seconds sent with 429 responses')
+    parser.add_argument('--seed', type=int, default=None, help='Random seed for reproducible error injection')
+    args = parser.parse_args()
+
+    config = StubConfig(args.latency_ms, args.error_rate, args.rate_limit, args.retry_after, args.seed)
+    server = make_stub_server(args.port, config)
+
+    base = f"http://127.0.0.1:{args.port}"
+    print(f"Stub server listening on {base}")
+    print(f"  GOOGLE_SEARCH_URL={base}/customsearch/v1")
+    print(f"  VERTEX_BASE_URL={base}")
+    print(f"  VERTEX_ACCESS_TOKEN=stub")
+    print(f"  SLACK_WEBHOOK_URL={base}/slack/webhook")
+    print(f"  Stats: {base}/_stats")
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\nStopping stub server")
+        server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
@@ -15,11 +15,9 @@ from datetime import datetime, timedelta
 sys.path.insert(0, '.')
 from gaming_stock_tracker_v3 import (
     analyze_single_day,
-    load_historical_data,
-    save_historical_data,
-    generate_html_dashboard,
     GAMING_COMPANIES
 )
+from pipeline_context import PipelineContext
 
 def research_news_for_material_change(ticker, name, pct_change, date_display, current_price, open_price):
     """
@@ -76,24 +74,9 @@ def update_yesterday():
     print(f"  ✓ Fetched data for {record['date_display']}")
     print(f"  ✓ Found {len(record['material_changes'])} material changes")
 
-    # Step 2: Load existing data and add new record
-    print("\n[STEP 2] Saving stock data to history...")
-    historical_data = load_historical_data()
-
-    # Check if this date already exists
-    existing_dates = {r['date'] for r in historical_data['records']}
-    if record['date'] in existing_dates:
-        print(f"  WARNING: {record['date']} already exists in history")
-        print(f"  Removing old record and replacing with new data...")
-        historical_data['records'] = [r for r in historical_data['records'] if r['date'] != record['date']]
-
-    historical_data['records'].append(record)
-    save_historical_data(historical_data)
-    print(f"  ✓ Saved to {historical_data}")
-
-    # Step 3: Research news for material changes
+    # Step 2: Research news for material changes
     if record['material_changes']:
-        print(f"\n[STEP 3] Researching news for {len(record['material_changes'])} material changes...")
+        print(f"\n[STEP 2] Researching news for {len(record['material_changes'])} material changes...")
 
         for i, change in enumerate(record['material_changes'], 1):
             ticker = change['ticker']
@@ -116,16 +99,25 @@ def update_yesterday():
 
             # Update the news in the record
             change['news'] = news
-
-        # Save updated data with researched news
-        save_historical_data(historical_data)
-        print(f"\n  ✓ Updated news summaries in history file")
     else:
-        print("\n[STEP 3] No material changes to research (all stocks < ±2%)")
+        print("\n[STEP 2] No material changes to research (all stocks < ±2%)")
+
+    # Step 3: Add the researched record to the history (after research, so an
+    # identical stored record is only skipped when nothing new was found)
+    print("\n[STEP 3] Adding stock data to history...")
+    context = PipelineContext()
+    status = context.upsert_record(record)
+    if status == 'replaced':
+        print(f"  WARNING: {record['date']} already exists in history")
+        print(f"  Replaced old record with new data")
+    if context.save():
+        print(f"  ✓ Saved to stock_tracker_history.json")
+    else:
+        print(f"  ✓ {record['date']} already stored, unchanged")
 
     # Step 4: Regenerate dashboard
     print("\n[STEP 4] Regenerating dashboard...")
-    dashboard_file = generate_html_dashboard()
+    dashboard_file = context.render_dashboard()
     print(f"  ✓ Dashboard updated: {dashboard_file}")
 
     # Step 5: Summary
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Narrative consistency validator
+Checks every news summary against the stored move for its (date, ticker):
+the first direction verb must match the sign of pct_change, and the first
+percentage quoted must match its magnitude.
+
+Usage:
+  python validate_news.py            # Validate the full history, exit 1 on mismatches
+"""
+
+import re
+import sys
+import time
+
+import numpy as np
+
+from gaming_stock_tracker_v3 import load_historical_data
+
+# Allowed gap between the quoted percentage and the stored move (summaries round to 0.1%)
+PCT_TOLERANCE = 0.15
+
+UP_WORDS = re.compile(
+    r'\b(rose|rises|jumped|jumps|surged|surges|soared|gained|gains|rallied|rallies|'
+    r'climbed|climbs|advanced|rebounded|bounced|spiked|popped)\b',
+    re.IGNORECASE
+)
+DOWN_WORDS = re.compile(
+    r'\b(fell|falls|dropped|drops|declined|declines|plunged|plunges|slid|slides|'
+    r'tumbled|tumbles|sank|sinks|dipped|dips|slumped|slumps|retreated|lost)\b',
+    re.IGNORECASE
+)
+PERCENT = re.compile(r'([+-]?\d+(?:\.\d+)?)\s?%')
+
+
+def extract_claims(summary):
+    """
+    Return (direction, pct, signed) stated by a narrative: direction is +1/-1/0,
+    pct is NaN if none is quoted, signed is True for "+2.1%" / "-2.1%" style
+    """
+    up = UP_WORDS.search(summary)
+    down = DOWN_WORDS.search(summary)
+    if up and (not down or up.start() < down.start()):
+        direction = 1
+    elif down:
+        direction = -1
+    else:
+        direction = 0
+
+    match = PERCENT.search(summary)
+    if not match:
+        return direction, np.nan, False
+    return direction, float(match.group(1)), match.group(1)[0] in '+-'
+
+
+def validate_history(data, tolerance=PCT_TOLERANCE):
+    """Compare all narratives against their stored moves, returns a list of mismatch dicts"""
+    keys = []
+    summaries = []
+    actual = []
+    for record in data['records']:
+        for change in record.get('material_changes', []):
+            summary = (change.get('news') or {}).get('summary')
+            if summary:
+                keys.append((record['date'], change['ticker']))
+                summaries.append(summary)
+                actual.append(change['data']['pct_change'])
+
+    if not keys:
+        return []
+
+    claims = [extract_claims(s) for s in summaries]
+    stated_dir = np.array([c[0] for c in claims])
+    stated_pct = np.array([c[1] for c in claims], dtype=float)
+    signed = np.array([c[2] for c in claims], dtype=bool)
+    actual = np.array(actual, dtype=float)
+
+    # Direction: verb disagrees with the sign of the move
+    direction_bad = (stated_dir != 0) & (stated_dir != np.sign(actual))
+
+    # An explicitly signed percentage ("-2.1%") also states a direction
+    has_pct = ~np.isnan(stated_pct)
+    direction_bad |= has_pct & signed & (stated_pct != 0) & (np.sign(stated_pct) != np.sign(actual))
+
+    # Magnitude: quoted percentage too far from the stored move
+    pct_bad = has_pct & (np.abs(np.abs(stated_pct) - np.abs(actual)) > tolerance)
+
+    mismatches = []
+    for i in np.flatnonzero(direction_bad | pct_bad):
+        issues = []
+        if direction_bad[i]:
+            issues.append('direction')
+        if pct_bad[i]:
+            issues.append('percentage')
+        mismatches.append({
+            'date': keys[i][0],
+            'ticker': keys[i][1],
+            'issues': issues,
+            'stated_pct': None if np.isnan(stated_pct[i]) else float(stated_pct[i]),
+            'actual_pct': round(float(actual[i]), 2),
+            'summary': summaries[i]
+        })
+
+    return mismatches
+
+
+def validate_record(record, tolerance=PCT_TOLERANCE):
+    """Validate a single day's narratives (used as a pre-publish gate for new records)"""
+    return validate_history({'records': [record]}, tolerance)
+
+
+def print_report(mismatches):
+    for m in mismatches:
+        stated = f"{m['stated_pct']:g}%" if m['stated_pct'] is not None else 'n/a'
+        print(f"  {m['date']} {m['ticker']}: {', '.join(m['issues'])} mismatch "
+              f"(narrative {stated}, actual {m['actual_pct']:+.2f}%)")
+        print(f"    {m['summary'][:120]}...")
+
+
+def main():
+    start = time.perf_counter()
+    data = load_historical_data()
+    mismatches = validate_history(data)
+    elapsed = time.perf_counter() - start
+
+    total = sum(len(r.get('material_changes', [])) for r in data['records'])
+    print(f"Validated {total} narratives across {len(data['records'])} days in {elapsed * 1000:.1f} ms")
+
+    if mismatches:
+        print(f"[FAIL] {len(mismatches)} narratives disagree with stored price moves:")
+        print_report(mismatches)
+        sys.exit(1)
+
+    print("[OK] All narratives consistent with stored price moves")
+
+
+if __name__ == '__main__':
+    main()